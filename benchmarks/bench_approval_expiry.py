@@ -0,0 +1,118 @@
+"""
+Benchmark: expiry checks over a large /Pending_Approval folder.
+
+Fills Pending_Approval with N approval requests whose `expires:` values are
+spread over the next 48 hours, then compares:
+
+  old pass   the former HITL._warn_expiring: glob the folder and parse
+             every file's frontmatter, on every check
+  scan       watchers.approval_expiry.ExpiryScheduler.scan(), the startup
+             load and the safety rescan
+  wake       one scheduler wake-up: due() + next_deadline(), with one new
+             approval arriving as a vault event
+
+It then runs the scheduler on a fake clock from one deadline to the next
+and checks that every warn / expire fires once, on time, in order.
+
+Usage:
+    uv run python benchmarks/bench_approval_expiry.py [N ...]   # default 1000 10000 100000
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers import vault_meta  # noqa: E402
+from watchers.approval_expiry import ExpiryScheduler  # noqa: E402
+from watchers.vault_events import VaultEvent  # noqa: E402
+
+WARN_BEFORE = 2 * 3600
+
+
+def write_approval(path: Path, expires: datetime) -> None:
+    path.write_text(
+        f"---\ntype: approval_request\naction: send_email\nto: client@example.com\n"
+        f"subject: Invoice follow-up\ncreated: {datetime.now().isoformat()}\n"
+        f"expires: {expires.isoformat()}\nstatus: pending\n---\n\n## Details\n{'Please approve. ' * 40}\n"
+    )
+
+
+def old_pass(pending_dir: Path) -> int:
+    """The former HITL._warn_expiring (without its log calls)."""
+    now = datetime.now()
+    expiring = 0
+    for pending_file in pending_dir.glob("*.md"):
+        metadata = vault_meta.read_frontmatter(pending_file)
+        expires_str = metadata.get("expires")
+        if expires_str:
+            try:
+                expires = datetime.fromisoformat(expires_str)
+                if (expires - now).total_seconds() < 7200:
+                    expiring += 1
+            except ValueError:
+                pass
+    return expiring
+
+
+def run(n: int) -> None:
+    rng = random.Random(n)
+    base = datetime.now().replace(microsecond=0) + timedelta(hours=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        pending = Path(tmp) / "Pending_Approval"
+        pending.mkdir()
+        for i in range(n):
+            write_approval(pending / f"APPROVAL_{i:06d}.md", base + timedelta(seconds=rng.randrange(48 * 3600)))
+        vault_meta.CACHE_SIZE = max(vault_meta.CACHE_SIZE, 2 * n)
+
+        t0 = time.perf_counter()
+        old_pass(pending)
+        t_old = time.perf_counter() - t0
+
+        clock = [time.time()]
+        scheduler = ExpiryScheduler(pending, WARN_BEFORE, clock=lambda: clock[0])
+        t0 = time.perf_counter()
+        scheduler.scan()
+        t_scan = time.perf_counter() - t0
+
+        new_file = pending / "APPROVAL_new.md"
+        write_approval(new_file, base + timedelta(hours=1))
+        t0 = time.perf_counter()
+        scheduler.on_event(VaultEvent("created", new_file.resolve()))
+        scheduler.due()
+        scheduler.next_deadline()
+        t_wake = time.perf_counter() - t0
+
+        # Walk the fake clock from deadline to deadline
+        fired, late, order_ok, last = [], 0, True, float("-inf")
+        while (deadline := scheduler.next_deadline()) is not None:
+            clock[0] = deadline
+            for kind, path, expires in scheduler.due():
+                expected = expires - WARN_BEFORE if kind == "warn" else expires
+                late += expected != deadline
+                order_ok &= deadline >= last
+                last = deadline
+                fired.append((kind, path))
+        once = len(set(fired)) == len(fired)
+        complete = len(fired) == 2 * (n + 1)
+
+    print(f"{n:>9,} | {t_old * 1000:>11.0f} | {t_scan * 1000:>7.0f} | {t_wake * 1e6:>7.0f} | "
+          f"{len(fired):>8,} | {once and complete and order_ok and not late}")
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    print(f"{'pending':>9} | {'old pass ms':>11} | {'scan ms':>7} | {'wake us':>7} | {'fired':>8} | all on time, once")
+    print("-" * 72)
+    for n in sizes:
+        run(n)
+    print("\nold pass: paid on every HITL check; scan: startup + every VAULT_RESCAN_INTERVAL;")
+    print("wake: what each deadline or new approval costs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: audit queries through the SQLite index vs re-reading the logs.
+
+Writes D days of audit entries (default 90 days x 1000), then times
+"failed send_email actions in the last 7 days" three ways:
+
+  scan       read_entries() over every day file, filtered in Python
+  sync       the first AuditIndex.sync() (a full build)
+  indexed    query() on a synced index (sync finds nothing new)
+
+It also runs a self-check of `main.py --migrate-logs` under a live index:
+legacy .json days are converted after the index has seen them. The index
+must then report the same counts as one built from scratch. It exits
+non-zero if they differ.
+
+Usage:
+    uv run python benchmarks/bench_audit_index.py [DAYS] [PER_DAY]   # default 90 1000
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.audit_index import AuditIndex, parse_since  # noqa: E402
+from watchers.audit_log import append_entry, encode_entry, migrate_legacy_logs, read_entries  # noqa: E402
+
+
+def _entry(day: datetime, i: int, kind: str = "new") -> dict:
+    return {
+        "timestamp": (day + timedelta(seconds=i)).isoformat(),
+        "session_id": kind,
+        "action_type": ["send_email", "post_linkedin", "send_whatsapp"][i % 3],
+        "actor": "hitl_approval_watcher",
+        "metadata": {"to": f"client{i}@example.com"},
+        "result": "failed" if i % 17 == 0 else "sent",
+    }
+
+
+def migration_check() -> bool:
+    """Legacy 5 + new 1 per day, indexed before and after migrate_legacy_logs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        logs_dir = Path(tmp)
+        day = datetime(2026, 3, 1)
+        for d in range(3):
+            date = day + timedelta(days=d)
+            legacy = [_entry(date, i, "legacy") for i in range(5)]
+            (logs_dir / f"{date:%Y-%m-%d}.json").write_text(json.dumps(legacy, indent=2))
+            with open(logs_dir / f"{date:%Y-%m-%d}.jsonl", "wb") as f:
+                f.write(encode_entry(_entry(date, 5)))
+
+        live = AuditIndex(logs_dir, db_path=logs_dir / "live.sqlite3")
+        before = live.counts("session_id")
+        migrate_legacy_logs(logs_dir)
+        after = live.counts("session_id")
+        append_entry(logs_dir, _entry(day, 6))
+        appended = live.counts("session_id")
+        fresh = AuditIndex(logs_dir, db_path=logs_dir / "fresh.sqlite3").counts("session_id")
+
+    expected = {"legacy": 15, "new": 3}
+    print(f"before migration {before} | after {after} | fresh build {fresh}")
+    return before == after == expected and appended == fresh == {"legacy": 15, "new": 4}
+
+
+def main() -> None:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logs_dir = Path(tmp)
+        start = datetime.now().replace(microsecond=0) - timedelta(days=days)
+        for d in range(days):
+            date = start + timedelta(days=d)
+            with open(logs_dir / f"{date:%Y-%m-%d}.jsonl", "wb") as f:
+                for i in range(per_day):
+                    f.write(encode_entry(_entry(date, i)))
+
+        since = parse_since("7d")
+        t0 = time.perf_counter()
+        scanned = [
+            e for e in read_entries(logs_dir)
+            if e.get("action_type") == "send_email" and e.get("result") == "failed"
+            and e.get("timestamp", "") >= since
+        ]
+        t_scan = time.perf_counter() - t0
+
+        index = AuditIndex(logs_dir)
+        t0 = time.perf_counter()
+        index.sync()
+        t_sync = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        indexed = index.query(action_type="send_email", since=since, failed=True)
+        t_query = time.perf_counter() - t0
+        index.close()
+
+    print(f"{days} days x {per_day:,} entries\n")
+    print(f"{'path':<8} | {'ms':>8} | {'matches':>7}")
+    print("-" * 30)
+    print(f"{'scan':<8} | {t_scan * 1000:>8.1f} | {len(scanned):>7}")
+    print(f"{'sync':<8} | {t_sync * 1000:>8.1f} |")
+    print(f"{'indexed':<8} | {t_query * 1000:>8.1f} | {len(indexed):>7}\n")
+
+    ok = migration_check()
+    print(f"migration self-check: {'ok' if ok else 'FAILED'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: cost per audit entry as a day's log grows.
+
+Compares the old read-modify-write JSON array against the append-only
+JSONL writer at 10 .. 100k entries already in the day's file.
+
+Usage:
+    uv run python benchmarks/bench_audit_log.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.audit_log import append_entry, encode_entry, log_file_for  # noqa: E402
+
+DAY_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def _entry(i: int) -> dict:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "session_id": "bench",
+        "action_type": "send_email",
+        "actor": "hitl_approval_watcher",
+        "metadata": {"to": f"client{i}@example.com", "subject": "Invoice"},
+        "result": "sent",
+    }
+
+
+def _legacy_append(log_file: Path, entry: dict) -> None:
+    """The pre-JSONL write path: read, parse, append, rewrite."""
+    logs = json.loads(log_file.read_text()) if log_file.exists() else []
+    logs.append(entry)
+    log_file.write_text(json.dumps(logs, indent=2))
+
+
+def _time_per_entry(fn, samples: int) -> float:
+    start = time.perf_counter()
+    for i in range(samples):
+        fn(i)
+    return (time.perf_counter() - start) / samples * 1e6
+
+
+def main() -> None:
+    print(f"{'entries/day':>12} | {'legacy µs/entry':>16} | {'jsonl µs/entry':>15} | {'speedup':>8}")
+    print("-" * 62)
+    for size in DAY_SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            logs_dir = Path(tmp)
+
+            legacy_file = logs_dir / "legacy.json"
+            legacy_file.write_text(json.dumps([_entry(i) for i in range(size)], indent=2))
+            jsonl_file = log_file_for(logs_dir)
+            with open(jsonl_file, "wb") as f:
+                for i in range(size):
+                    f.write(encode_entry(_entry(i)))
+
+            # Fewer legacy samples at large sizes — each one rewrites the whole day
+            legacy_samples = max(3, min(200, 200_000 // size))
+            legacy_us = _time_per_entry(
+                lambda i: _legacy_append(legacy_file, _entry(i)), legacy_samples
+            )
+            jsonl_us = _time_per_entry(
+                lambda i: append_entry(logs_dir, _entry(i)), 2_000
+            )
+        print(f"{size:>12,} | {legacy_us:>16,.1f} | {jsonl_us:>15,.1f} | {legacy_us / jsonl_us:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
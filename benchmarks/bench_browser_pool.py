@@ -0,0 +1,132 @@
+"""
+Benchmark: launch-per-post vs the shared BrowserPool.
+
+Serves a local page per platform with a compose box, then makes POSTS posts
+round-robin across PLATFORMS two ways: the old way (a fresh Playwright and
+persistent context per post) and through watchers.browser_pool. A sampler
+thread records peak RSS of every Chromium process under the benchmark's
+profile folder.
+
+Usage:
+    uv run python benchmarks/bench_browser_pool.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.browser_pool import BrowserPool  # noqa: E402
+from watchers.browser_session import _proc_tree_rss_mb  # noqa: E402
+
+PLATFORMS = ["linkedin", "twitter", "facebook"]
+POSTS = 9
+PAGE = b"""<!doctype html><html><body>
+<div contenteditable="true" role="textbox" id="compose"></div>
+<button id="post" onclick="document.getElementById('compose').innerText=''">Post</button>
+</body></html>"""
+
+
+class AppHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+
+class PeakRss:
+    def __init__(self, marker: str):
+        self.marker = marker
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(0.1):
+            self.peak = max(self.peak, _proc_tree_rss_mb(self.marker) or 0.0)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _post(url: str, text: str):
+    def post(page):
+        page.goto(url, wait_until="domcontentloaded")
+        page.fill("#compose", text)
+        page.click("#post")
+        return True
+    return post
+
+
+def launch_per_post(url: str, root: Path) -> list[float]:
+    timings = []
+    for i in range(POSTS):
+        platform = PLATFORMS[i % len(PLATFORMS)]
+        start = time.perf_counter()
+        with sync_playwright() as p:
+            browser = p.chromium.launch_persistent_context(str(root / platform), headless=True)
+            page = browser.pages[0] if browser.pages else browser.new_page()
+            _post(url + platform, f"post {i}")(page)
+            browser.close()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def pooled(url: str, root: Path) -> tuple[list[float], dict]:
+    pool = BrowserPool(idle_timeout=None)
+    for platform in PLATFORMS:
+        pool.register(platform, root / platform, headless=True)
+    timings = []
+    for i in range(POSTS):
+        platform = PLATFORMS[i % len(PLATFORMS)]
+        start = time.perf_counter()
+        pool.run(platform, _post(url + platform, f"post {i}"))
+        timings.append((time.perf_counter() - start) * 1000)
+    stats = pool.stats()
+    pool.close()
+    return timings, stats
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AppHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        with PeakRss(f"--user-data-dir={root}") as rss:
+            timings = launch_per_post(url, root / "per_post")
+        results.append(("launch-per-post", timings, rss.peak))
+        with PeakRss(f"--user-data-dir={root}") as rss:
+            timings, stats = pooled(url, root / "pool")
+        results.append(("browser pool", timings, rss.peak))
+    server.shutdown()
+
+    print(f"{POSTS} posts round-robin over {len(PLATFORMS)} platforms\n")
+    print(f"{'mode':<16} | {'avg ms/post':>11} | {'total ms':>9} | {'peak RSS MB':>11}")
+    print("-" * 58)
+    for mode, timings, peak in results:
+        print(f"{mode:<16} | {sum(timings) / len(timings):>11.0f} | {sum(timings):>9.0f} | {peak:>11.0f}")
+    print(f"\nPool stats: launches per platform = "
+          f"{ {name: s['launches'] for name, s in stats['platforms'].items()} }")
+
+
+if __name__ == "__main__":
+    main()
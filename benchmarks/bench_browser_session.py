@@ -0,0 +1,111 @@
+"""
+Benchmark: launch-per-poll vs a warm BrowserSession.
+
+Serves a local stand-in for WhatsApp Web whose #pane-side chat list appears
+after a simulated app boot delay, then times N polls done the old way
+(sync_playwright + launch_persistent_context + goto + wait on every poll)
+against N polls through one long-lived watchers.browser_session session.
+
+Usage:
+    uv run python benchmarks/bench_browser_session.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.browser_session import BrowserSession  # noqa: E402
+
+POLLS = 5
+BOOT_DELAY_MS = 1500  # time the fake web app takes to render its chat list
+PAGE = f"""<!doctype html><html><head><title>WhatsApp</title></head><body>
+<script>
+setTimeout(() => {{
+  const pane = document.createElement("div");
+  pane.id = "pane-side";
+  pane.innerText = "Ali Traders\\n10:32 AM\\nURGENT: please send the invoice asap\\n2";
+  document.body.appendChild(pane);
+}}, {BOOT_DELAY_MS});
+</script></body></html>""".encode()
+
+
+class AppHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+
+def _open(url):
+    def open_app(page):
+        page.goto(url, wait_until="domcontentloaded")
+        page.wait_for_selector("#pane-side", timeout=30_000)
+    return open_app
+
+
+def _read(page):
+    return page.query_selector("#pane-side").inner_text().split("\n")
+
+
+def launch_per_poll(url: str, profile: Path) -> list[float]:
+    timings = []
+    for _ in range(POLLS):
+        start = time.perf_counter()
+        with sync_playwright() as p:
+            browser = p.chromium.launch_persistent_context(str(profile), headless=True)
+            page = browser.pages[0] if browser.pages else browser.new_page()
+            _open(url)(page)
+            _read(page)
+            browser.close()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def warm_session(url: str, profile: Path) -> tuple[list[float], dict]:
+    session = BrowserSession("bench", profile, on_launch=_open(url), headless=True)
+    timings = []
+    for _ in range(POLLS):
+        start = time.perf_counter()
+        session.run(_read)
+        timings.append((time.perf_counter() - start) * 1000)
+    stats = session.stats()
+    session.close()
+    return timings, stats
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AppHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cold = launch_per_poll(url, Path(tmp) / "per_poll")
+        warm, stats = warm_session(url, Path(tmp) / "session")
+    server.shutdown()
+
+    print(f"Simulated app boot: {BOOT_DELAY_MS} ms, {POLLS} polls each\n")
+    print(f"{'mode':<16} | {'first ms':>9} | {'later avg ms':>12} | {'total ms':>9}")
+    print("-" * 56)
+    for mode, timings in (("launch-per-poll", cold), ("warm session", warm)):
+        later = timings[1:] or timings
+        print(
+            f"{mode:<16} | {timings[0]:>9.0f} | {sum(later) / len(later):>12.1f} | "
+            f"{sum(timings):>9.0f}"
+        )
+    print(f"\nSession stats: {stats}")
+
+
+if __name__ == "__main__":
+    main()
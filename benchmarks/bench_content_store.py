@@ -0,0 +1,114 @@
+"""
+Benchmark: duplicate drops through the content store.
+
+1. Drop handler: U unique files (64 KB - 4 MB), each dropped 3 times under
+   new names, through DropFolderHandler._ingest with and without the
+   store. Reports the action items created, the bytes added to the vault and
+   the time per unique / duplicate drop.
+2. Index: load time and lookup time of Files/index.jsonl with 1k - 1M
+   records. Lookups should stay flat as the index grows.
+
+Usage:
+    uv run python benchmarks/bench_content_store.py [U]   # default 200
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.content_store import ContentStore  # noqa: E402
+from watchers.filesystem_watcher import DropFolderHandler  # noqa: E402
+
+DROPS_PER_FILE = 3
+
+
+def disk_bytes(folder: Path) -> int:
+    """Allocated bytes, counting each inode once (hardlinks share their blocks)."""
+    seen, total = set(), 0
+    for path in folder.rglob("*"):
+        st = path.stat()
+        if path.is_file() and st.st_ino not in seen:
+            seen.add(st.st_ino)
+            total += st.st_blocks * 512
+    return total
+
+
+def drop_run(root: Path, unique: int, use_store: bool) -> dict:
+    rng = random.Random(7)
+    drop, vault = root / "drop", root / "vault"
+    needs_action, logs = vault / "Needs_Action", vault / "Logs"
+    for folder in [drop, needs_action, logs]:
+        folder.mkdir(parents=True)
+    store = ContentStore(vault / "Files") if use_store else None
+    handler = DropFolderHandler(needs_action, logs, logging.getLogger("bench"), store)
+
+    contents = [os.urandom(rng.choice([64, 256, 1024, 4096]) * 1024) for _ in range(unique)]
+    timings = {"first": 0.0, "repeat": 0.0}
+    for round_no in range(DROPS_PER_FILE):
+        for i, data in enumerate(contents):
+            source = drop / f"invoice_{i}_copy{round_no}.pdf"
+            source.write_bytes(data)
+            start = time.perf_counter()
+            handler._ingest(source)
+            timings["first" if round_no == 0 else "repeat"] += time.perf_counter() - start
+            # The drop folder is emptied afterwards, as a user clearing it would
+            source.unlink()
+    handler.close()
+    return {
+        "action_items": len(list(needs_action.glob("*_meta.md"))),
+        "vault_mb": disk_bytes(vault) / 1024 ** 2,
+        "first_ms": timings["first"] / unique * 1000,
+        "repeat_ms": timings["repeat"] / (unique * (DROPS_PER_FILE - 1)) * 1000,
+    }
+
+
+def index_run(root: Path, records: int) -> tuple[float, float]:
+    store_dir = root / f"store_{records}"
+    store_dir.mkdir()
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(records)]
+    with open(store_dir / "index.jsonl", "w") as f:
+        for i, sha in enumerate(hashes):
+            f.write(json.dumps({"sha256": sha, "size": 1000 + i, "name": f"f{i}.pdf",
+                                "action_file": f"FILE_f{i}.pdf", "first_seen": "2026-01-01T00:00:00"}) + "\n")
+    start = time.perf_counter()
+    store = ContentStore(store_dir)
+    load_ms = (time.perf_counter() - start) * 1000
+    probes = [random.choice(hashes) for _ in range(100_000)]
+    start = time.perf_counter()
+    for sha in probes:
+        store.lookup(sha)
+    lookup_ns = (time.perf_counter() - start) / len(probes) * 1e9
+    return load_ms, lookup_ns
+
+
+def main() -> None:
+    unique = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logging.disable(logging.INFO)
+
+    print(f"{unique} unique files x {DROPS_PER_FILE} drops\n")
+    print(f"{'store':<8} | {'action items':>12} | {'vault MB':>9} | {'first drop ms':>13} | {'re-drop ms':>10}")
+    print("-" * 66)
+    for use_store in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            r = drop_run(Path(tmp), unique, use_store)
+        print(f"{'on' if use_store else 'off':<8} | {r['action_items']:>12} | {r['vault_mb']:>9.1f} | "
+              f"{r['first_ms']:>13.2f} | {r['repeat_ms']:>10.2f}")
+
+    print(f"\n{'index records':>13} | {'load ms':>9} | {'lookup ns':>9}")
+    print("-" * 38)
+    with tempfile.TemporaryDirectory() as tmp:
+        for records in (1_000, 10_000, 100_000, 1_000_000):
+            load_ms, lookup_ns = index_run(Path(tmp), records)
+            print(f"{records:>13,} | {load_ms:>9.0f} | {lookup_ns:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: cookies.json loading and session checks in watchers.cookie_session.
+
+Uses a synthetic 40-cookie cookies.json and a local HTTP server standing in
+for the platform:
+
+  load     convert cookies.json per post (old) vs CookieJar.cookies() (cached)
+  expired  check() with an expired auth cookie: no network, no browser
+  probe    check() against a server that redirects to /login (logged out)
+           and one that answers 200 (logged in), then the cached verdict
+
+Usage:
+    uv run python benchmarks/bench_cookie_session.py
+"""
+
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.cookie_session import CookieJar, to_playwright  # noqa: E402
+
+ROUNDS = 1000
+
+
+class FakePlatform(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/out"):
+            self.send_response(302)
+            self.send_header("Location", "/login?next=/settings")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def write_cookies(path: Path, auth_expires: float) -> None:
+    cookies = [
+        {"name": f"pref_{i}", "value": "x" * 40, "domain": ".x.com", "path": "/",
+         "secure": True, "httpOnly": False, "expirationDate": time.time() + 86400}
+        for i in range(39)
+    ]
+    cookies.append({"name": "auth_token", "value": "a" * 40, "domain": ".x.com", "path": "/",
+                    "secure": True, "httpOnly": True, "expirationDate": auth_expires})
+    path.write_text(json.dumps(cookies, indent=2))
+
+
+def timed(fn, rounds: int = ROUNDS) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    logger = logging.getLogger("bench")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakePlatform)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = Path(tmp)
+        cookies_file = session / "cookies.json"
+        write_cookies(cookies_file, time.time() + 86400)
+
+        def old_load():
+            with open(cookies_file) as f:
+                return [to_playwright(c, ".x.com") for c in json.load(f)]
+
+        jar = CookieJar("twitter", session, logger)
+        rows = [("load: read + convert (old)", timed(old_load)),
+                ("load: cached", timed(jar.cookies))]
+
+        write_cookies(cookies_file, time.time() - 60)
+        expired_jar = CookieJar("twitter", session, logger)
+
+        def uncached_check():
+            expired_jar._verdict = None  # time the check itself, not the cached verdict
+            return expired_jar.check()
+
+        rows.append(("check: expired auth cookie", timed(uncached_check)))
+        verdict_expired = expired_jar.check()
+
+        write_cookies(cookies_file, time.time() + 86400)
+        for label, path in (("logged out", "/out"), ("logged in", "/in")):
+            probe_jar = CookieJar("twitter", session, logger)
+            probe_jar.probe_url = base + path
+            start = time.perf_counter()
+            verdict = probe_jar.check()
+            rows.append((f"check: probe, {label} -> {'ok' if verdict is None else 'expired'}",
+                         (time.perf_counter() - start) * 1000))
+        rows.append(("check: cached verdict", timed(probe_jar.check)))
+
+    server.shutdown()
+    print(f"{'step':<38} | {'ms':>9}")
+    print("-" * 50)
+    for label, ms in rows:
+        print(f"{label:<38} | {ms:>9.3f}")
+    print(f"\nexpired reason: {verdict_expired}")
+
+
+if __name__ == "__main__":
+    main()
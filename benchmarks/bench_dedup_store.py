@@ -0,0 +1,101 @@
+"""
+Benchmark: processed-ID store with a large history.
+
+Fills a ProcessedIdStore with N IDs (default 1,000,000), reopens it and
+runs what a Gmail / WhatsApp cycle does: re-check IDs already seen, check
+new ones, add a few. It reports:
+
+  startup      reopen (Bloom snapshot + log tail)
+  seen / new   microseconds per `in` check
+  memory       Python heap growth after re-checking seen IDs (tracemalloc)
+  compaction   compact() time, and the slowest add() while it runs
+               on another thread
+
+It also checks that every seen ID is found, new IDs are not, and the store
+agrees with itself after compaction and a restart.
+
+Usage:
+    uv run python benchmarks/bench_dedup_store.py [N]   # default 1000000
+"""
+
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.dedup_store import ProcessedIdStore  # noqa: E402
+
+
+def per_check_us(store: ProcessedIdStore, ids: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    found = sum(i in store for i in ids)
+    return (time.perf_counter() - start) / len(ids) * 1e6, found
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(4)
+    ids = [f"{rng.getrandbits(64):016x}" for _ in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProcessedIdStore(Path(tmp), "bench", ttl_days=90)
+        for i in range(0, n, 10_000):
+            store.add_many(ids[i:i + 10_000])
+        store.close()
+
+        t0 = time.perf_counter()
+        store = ProcessedIdStore(Path(tmp), "bench", ttl_days=90)
+        t_start = time.perf_counter() - t0
+
+        seen = rng.sample(ids, 10_000)
+        new = [f"new-{i}" for i in range(10_000)]
+        tracemalloc.start()
+        seen_us, seen_found = per_check_us(store, seen)
+        new_us, new_found = per_check_us(store, new)
+        grown = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        slowest = [0.0]
+        done = threading.Event()
+
+        def writer():
+            i = 0
+            while not done.is_set():
+                t = time.perf_counter()
+                store.add(f"during-{i}")
+                slowest[0] = max(slowest[0], time.perf_counter() - t)
+                i += 1
+                time.sleep(0.001)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        t0 = time.perf_counter()
+        kept = store.compact()
+        t_compact = time.perf_counter() - t0
+        done.set()
+        thread.join()
+
+        during = [f"during-{i}" for i in range(10)]
+        consistent = all(i in store for i in seen + during) and not any(i in store for i in new)
+        store.close()
+        store = ProcessedIdStore(Path(tmp), "bench", ttl_days=90)
+        consistent &= all(i in store for i in seen + during) and not any(i in store for i in new)
+        store.close()
+
+    print(f"{n:,} processed IDs\n")
+    print(f"startup          {t_start * 1000:>8.1f} ms")
+    print(f"seen ID check    {seen_us:>8.1f} us   found {seen_found:,} / {len(seen):,}")
+    print(f"new ID check     {new_us:>8.1f} us   found {new_found:,} / {len(new):,}")
+    print(f"heap growth      {grown / 1024:>8.0f} KB after {len(seen) + len(new):,} checks")
+    print(f"compaction       {t_compact * 1000:>8.0f} ms   kept {kept:,}")
+    print(f"slowest add()    {slowest[0] * 1000:>8.1f} ms while compacting")
+    print(f"consistent after compaction and restart: {consistent}")
+
+
+if __name__ == "__main__":
+    main()
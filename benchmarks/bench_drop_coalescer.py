@@ -0,0 +1,145 @@
+"""
+Benchmark: drop-folder event coalescing under a burst of writes.
+
+Watches a temporary folder with a real watchdog Observer and writes:
+
+  burst  N files, each written in 4 chunks (one create + several modify
+         events), 10% of them saved as .part and renamed into place
+  slow   20 files that keep growing for longer than the debounce window
+
+It then compares three handlers:
+
+  on_created  the old handler: one copy per create event; "partial" counts
+              copies taken before the file was complete
+  per event   acting on every create / modify / move event
+  coalesced   watchers.filesystem_watcher.EventCoalescer
+
+Usage:
+    uv run python benchmarks/bench_drop_coalescer.py [N]   # default 2000
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchdog.events import FileSystemEventHandler  # noqa: E402
+from watchdog.observers import Observer  # noqa: E402
+
+from watchers.filesystem_watcher import DropFolderHandler, EventCoalescer  # noqa: E402
+
+DEBOUNCE = 0.5
+CHUNK = b"x" * 4096
+CHUNKS = 4
+SLOW_FILES = 20
+
+
+class Recorder(FileSystemEventHandler):
+    """Counts what the old and the per-event handlers would have copied."""
+
+    def __init__(self, coalescer: EventCoalescer):
+        self.coalescer = coalescer
+        self.created = Counter()
+        self.partial_created = 0
+        self.per_event = Counter()
+        self.partial_per_event = 0
+        self.lock = threading.Lock()
+
+    def _note(self, path: Path, created: bool) -> None:
+        if not DropFolderHandler._wanted(path):
+            return
+        size = path.stat().st_size if path.exists() else 0
+        with self.lock:
+            self.per_event[path] += 1
+            self.partial_per_event += size < CHUNKS * len(CHUNK)
+            if created:
+                self.created[path] += 1
+                self.partial_created += size < CHUNKS * len(CHUNK)
+        self.coalescer.touch(path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._note(Path(event.src_path), created=True)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._note(Path(event.src_path), created=False)
+
+    def on_moved(self, event):
+        self.coalescer.forget(Path(event.src_path))
+        self._note(Path(event.dest_path), created=False)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    emitted = Counter()
+    partial_emits = []
+
+    def emit(path: Path):
+        emitted[path] += 1
+        if path.stat().st_size < CHUNKS * len(CHUNK):
+            partial_emits.append(path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        coalescer = EventCoalescer(emit, DEBOUNCE, logging.getLogger("bench"))
+        recorder = Recorder(coalescer)
+        observer = Observer()
+        observer.schedule(recorder, str(folder), recursive=False)
+        observer.start()
+
+        def slow_writer():
+            handles = [open(folder / f"slow_{i}.bin", "wb", buffering=0) for i in range(SLOW_FILES)]
+            for _ in range(CHUNKS):
+                for handle in handles:
+                    handle.write(CHUNK)
+                time.sleep(DEBOUNCE * 0.6)
+            for handle in handles:
+                handle.close()
+
+        slow = threading.Thread(target=slow_writer)
+        start = time.perf_counter()
+        slow.start()
+        for i in range(n):
+            final = folder / f"drop_{i:05d}.bin"
+            target = final.with_suffix(".part") if i % 10 == 0 else final
+            with open(target, "wb", buffering=0) as f:
+                for _ in range(CHUNKS):
+                    f.write(CHUNK)
+            if target != final:
+                os.rename(target, final)
+        slow.join()
+        write_s = time.perf_counter() - start
+
+        total = n + SLOW_FILES
+        deadline = time.monotonic() + 30
+        while len(emitted) < total and time.monotonic() < deadline:
+            time.sleep(0.1)
+        time.sleep(DEBOUNCE * 2)  # let any late duplicate show up
+        observer.stop()
+        observer.join()
+        coalescer.close()
+
+    def row(label, counts, partial):
+        copies = sum(counts.values())
+        print(f"{label:<12} | {copies:>7} | {len(counts):>6} | {copies - len(counts):>9} | {partial:>8}")
+
+    print(f"{n} burst files + {SLOW_FILES} slow writers, {CHUNKS} chunks each, written in {write_s:.1f} s, "
+          f"debounce {DEBOUNCE}s\n")
+    print(f"{'handler':<12} | {'copies':>7} | {'files':>6} | {'redundant':>9} | {'partial':>8}")
+    print("-" * 56)
+    row("on_created", recorder.created, recorder.partial_created)
+    row("per event", recorder.per_event, recorder.partial_per_event)
+    row("coalesced", emitted, len(partial_emits))
+    print(f"\nmissed by coalescer: {total - len(emitted)}  |  stats: {coalescer.stats()}")
+    print(f"on_created never saw {total - len(recorder.created)} files that were renamed into place")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: per-message vs batched Gmail metadata fetch.
+
+Starts a local stand-in for the Gmail REST API (messages.get plus the
+/batch/gmail/v1 multipart endpoint) with a fixed simulated round-trip time,
+builds a real googleapiclient service against it from the static discovery
+document, and times watchers.gmail_sync.fetch_metadata in both modes.
+
+Usage:
+    uv run python benchmarks/bench_gmail_batch.py
+"""
+
+import json
+import logging
+import re
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httplib2
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.gmail_sync import fetch_metadata  # noqa: E402
+
+ROUND_TRIP = 0.040  # seconds per HTTP request, roughly a real Gmail API call
+BATCH_SIZES = [1, 10, 50, 200]
+_MESSAGE_PATH = re.compile(r"/gmail/v1/users/me/messages/([^/?]+)")
+
+
+def _message(msg_id: str) -> dict:
+    return {
+        "id": msg_id,
+        "threadId": msg_id,
+        "labelIds": ["INBOX", "UNREAD", "STARRED"],
+        "snippet": "Please send the invoice for March asap",
+        "payload": {"headers": [
+            {"name": "From", "value": "client@example.com"},
+            {"name": "Subject", "value": f"Invoice {msg_id}"},
+            {"name": "Date", "value": "Mon, 1 Jan 2026 09:00:00 +0000"},
+        ]},
+    }
+
+
+class GmailStubHandler(BaseHTTPRequestHandler):
+    requests_served = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        GmailStubHandler.requests_served += 1
+        time.sleep(ROUND_TRIP)
+        match = _MESSAGE_PATH.match(self.path)
+        if not match:
+            self.send_error(404)
+            return
+        self._send(json.dumps(_message(match.group(1))).encode(), "application/json")
+
+    def do_POST(self):
+        GmailStubHandler.requests_served += 1
+        time.sleep(ROUND_TRIP)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        batch = BytesParser().parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        out = []
+        for part in batch.get_payload():
+            content_id = part["Content-ID"].strip("<>")
+            request_line = part.get_payload().lstrip().split("\n", 1)[0]
+            msg_id = _MESSAGE_PATH.search(request_line).group(1)
+            payload = json.dumps(_message(msg_id))
+            out.append(
+                "--batch_response\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                "HTTP/1.1 200 OK\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{payload}\r\n"
+            )
+        out.append("--batch_response--\r\n")
+        self._send("".join(out).encode(), "multipart/mixed; boundary=batch_response")
+
+
+def _service(port: int):
+    doc = json.loads(get_static_doc("gmail", "v1"))
+    doc["rootUrl"] = doc["mtlsRootUrl"] = f"http://127.0.0.1:{port}/"
+    return build_from_document(doc, http=httplib2.Http())
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GmailStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = _service(server.server_address[1])
+    logger = logging.getLogger("bench")
+
+    print(f"Simulated round trip: {ROUND_TRIP * 1000:.0f} ms\n")
+    print(f"{'messages':>8} | {'mode':<11} | {'HTTP reqs':>9} | {'total ms':>9} | {'ms/message':>10}")
+    print("-" * 60)
+    for count in BATCH_SIZES:
+        ids = [f"m{i:05d}" for i in range(count)]
+        for mode, batch in (("per-message", False), ("batched", True)):
+            GmailStubHandler.requests_served = 0
+            start = time.perf_counter()
+            results = fetch_metadata(service, ids, logger, batch=batch)
+            elapsed = (time.perf_counter() - start) * 1000
+            assert len(results) == count, f"{mode}: got {len(results)}/{count}"
+            print(
+                f"{count:>8} | {mode:<11} | {GmailStubHandler.requests_served:>9} | "
+                f"{elapsed:>9.0f} | {elapsed / count:>10.1f}"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
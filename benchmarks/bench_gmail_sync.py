@@ -0,0 +1,81 @@
+"""
+Benchmark: Gmail API calls and latency per watcher cycle as the mailbox grows.
+
+Modes compared against an in-process fake Gmail API (5 ms per call):
+  legacy       messages.list(maxResults=10) every cycle (drops anything past 10)
+  full-resync  paginated messages.list every cycle (correct but grows with mailbox)
+  incremental  users.history.list since the stored historyId (GmailSync)
+
+Usage:
+    uv run python benchmarks/bench_gmail_sync.py
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fake_gmail import FakeGmailService  # noqa: E402
+from watchers.gmail_sync import GmailSync  # noqa: E402
+
+MAILBOX_SIZES = [100, 1_000, 10_000, 100_000]
+CYCLES = 10
+NEW_PER_CYCLE = 3
+WEEKEND_BURST = 15  # first cycle: more new starred mail than legacy's maxResults=10
+LOGGER = logging.getLogger("bench")
+
+
+def _run(mode: str, size: int) -> tuple[float, float, int]:
+    svc = FakeGmailService()
+    svc.bulk_load(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        sync = GmailSync(svc, Path(tmp) / "state.json", LOGGER)
+        seen: set[str] = set()
+        if mode != "legacy":
+            seen.update(sync.new_message_ids())  # initial full sync, not timed
+        missed = 0
+        svc.calls = 0
+        start = time.perf_counter()
+        for cycle in range(CYCLES):
+            burst = WEEKEND_BURST if cycle == 0 else NEW_PER_CYCLE
+            new = [svc.add_message(["INBOX", "UNREAD", "STARRED"]) for _ in range(burst)]
+            if mode == "legacy":
+                page = svc.messages().list(userId="me", q="is:unread is:starred", maxResults=10).execute()
+                found = {m["id"] for m in page.get("messages", [])}
+            elif mode == "full-resync":
+                sync.history_id = None
+                found = set(sync.new_message_ids())
+            else:
+                found = set(sync.new_message_ids())
+            missed += sum(1 for m in new if m not in found)
+            seen.update(found)
+        elapsed = time.perf_counter() - start
+    return svc.calls / CYCLES, elapsed / CYCLES * 1000, missed
+
+
+def main() -> None:
+    print(f"{'mailbox':>8} | {'mode':<12} | {'calls/cycle':>11} | {'ms/cycle':>9} | {'missed':>6}")
+    print("-" * 60)
+    for size in MAILBOX_SIZES:
+        for mode in ("legacy", "full-resync", "incremental"):
+            calls, ms, missed = _run(mode, size)
+            print(f"{size:>8,} | {mode:<12} | {calls:>11.1f} | {ms:>9.1f} | {missed:>6}")
+
+    # Expired historyId falls back to a full resync instead of failing
+    svc = FakeGmailService(history_retention=5)
+    svc.bulk_load(1_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        sync = GmailSync(svc, Path(tmp) / "state.json", LOGGER)
+        sync.new_message_ids()
+        for _ in range(10):
+            svc.add_message(["INBOX"])
+        starred = svc.add_message(["INBOX", "UNREAD", "STARRED"])
+        assert starred in sync.new_message_ids(), "fallback resync lost a message"
+    print("\nExpired historyId -> full resync fallback: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: metadata extraction for dropped documents.
+
+Generates a mix of CSVs (1k - 100k rows), PNG / GIF / BMP / JPEG headers, text
+files and small PDFs. It then times every extractor in-process, one after
+another, against MetadataExtractor's process pool. The pool is fed from
+several threads, like the drop folder's ingest workers. The run also checks
+that the generated frontmatter parses as YAML and that the limits hold:
+
+  slow  an extractor that never returns      -> extract_error (timeout)
+  hog   an extractor allocating 4 GB         -> extract_error (memory)
+  crash a worker killed mid-file             -> extract_error, pool restarts
+
+Usage:
+    uv run python benchmarks/bench_metadata_extract.py
+"""
+
+import os
+import random
+import signal
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.metadata_extract import EXTRACTORS, MetadataExtractor, frontmatter_lines  # noqa: E402
+
+
+def slow(path: Path) -> dict:
+    while True:
+        time.sleep(0.1)
+
+
+def hog(path: Path) -> dict:
+    blob = bytearray(4 * 1024 ** 3)
+    return {"allocated": len(blob)}
+
+
+def crash(path: Path) -> dict:
+    os.kill(os.getpid(), signal.SIGKILL)
+    return {}
+
+
+def png(width: int, height: int) -> bytes:
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+
+
+def jpeg(width: int, height: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\0" + b"\x01\x01\0\0\x01\0\x01\0\0"
+    sof = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\0"
+    return b"\xff\xd8" + app0 + sof + b"\xff\xd9"
+
+
+def pdf(pages: int) -> bytes:
+    kids = " ".join(f"{3 + i} 0 R" for i in range(pages))
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>",
+               f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()]
+    objects += [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"] * pages
+    body = b"%PDF-1.4\n" + b"".join(f"{i + 1} 0 obj\n".encode() + o + b"\nendobj\n" for i, o in enumerate(objects))
+    return body + b"trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+
+
+def make_files(root: Path) -> list[Path]:
+    rng = random.Random(3)
+    files = []
+    for i, rows in enumerate([1_000, 10_000, 100_000] * 4):
+        path = root / f"report_{i}.csv"
+        with open(path, "w") as f:
+            f.write("date,client,amount,hours\n")
+            for r in range(rows):
+                f.write(f"2026-03-{r % 28 + 1:02d},client{r % 40},{rng.uniform(10, 5000):.2f},{rng.randint(1, 12)}\n")
+        files.append(path)
+    for i in range(40):
+        w, h = rng.randint(64, 4000), rng.randint(64, 4000)
+        kind = i % 4
+        if kind == 0:
+            data, ext = png(w, h), ".png"
+        elif kind == 1:
+            data, ext = b"GIF89a" + struct.pack("<HH", w, h) + b"\0" * 22, ".gif"
+        elif kind == 2:
+            data, ext = b"BM" + b"\0" * 16 + struct.pack("<ii", w, -h) + b"\0" * 8, ".bmp"
+        else:
+            data, ext = jpeg(w, h), ".jpg"
+        path = root / f"scan_{i}{ext}"
+        path.write_bytes(data)
+        files.append(path)
+    for i in range(20):
+        path = root / f"notes_{i}.txt"
+        path.write_text("Meeting notes: follow up on invoice and contract renewal.\n" * rng.randint(10, 20_000))
+        files.append(path)
+    for i in range(20):
+        path = root / f"contract_{i}.pdf"
+        path.write_bytes(pdf(rng.randint(1, 40)))
+        files.append(path)
+    return files
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_files(Path(tmp))
+        total_mb = sum(f.stat().st_size for f in files) / 1024 ** 2
+
+        start = time.perf_counter()
+        serial = {f: EXTRACTORS[f.suffix](f) for f in files}
+        serial_s = time.perf_counter() - start
+
+        extractor = MetadataExtractor(workers=4, timeout=2, max_mb=512)
+        extractor.extract(files[0])  # start the workers outside the timing
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as ingest_threads:
+            pooled = dict(zip(files, ingest_threads.map(extractor.extract, files)))
+        pooled_s = time.perf_counter() - start
+
+        mismatched = sum(
+            1 for f in files
+            if {k: v for k, v in pooled[f].items() if k != "extract_ms"} != serial[f]
+        )
+        bad_yaml = 0
+        for fields in pooled.values():
+            try:
+                parsed = yaml.safe_load("---\n" + frontmatter_lines(fields))
+                bad_yaml += set(parsed) != set(fields)
+            except yaml.YAMLError:
+                bad_yaml += 1
+
+        limits = {}
+        for name, fn in (("slow", slow), ("hog", hog), ("crash", crash)):
+            start = time.perf_counter()
+            result = extractor.run(fn, files[0])
+            limits[name] = (result.get("extract_error"), time.perf_counter() - start)
+        after = extractor.extract(files[1])
+        extractor.close()
+
+    print(f"{len(files)} files, {total_mb:.0f} MB, {os.cpu_count()} CPU(s)\n")
+    print(f"in-process, serial : {serial_s * 1000:8.0f} ms")
+    print(f"process pool (4)   : {pooled_s * 1000:8.0f} ms")
+    print(f"results differ     : {mismatched}")
+    print(f"bad frontmatter    : {bad_yaml}\n")
+    for name, (error, seconds) in limits.items():
+        print(f"{name:<6} -> {error!s:<40} in {seconds:.1f} s")
+    print(f"after limits, pool still extracts: {'extract_error' not in after}")
+    sample = next(f for f in files if f.suffix == ".csv")
+    print(f"\nsample ({sample.name}):\n{frontmatter_lines(pooled[sample])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: PlanCreator restarts over a large Needs_Action backlog.
+
+Fills Needs_Action with N action files and starts PlanCreator's reconcile
+pass (watchers.plan_index.PlanIndex) again and again:
+
+  first start     empty index; every file gets a plan
+  restart         nothing changed
+  agent edits     10% of the files edited in place (status updated)
+  git restore     every file rewritten with the same content (new inodes)
+  upgrade         no index yet; seeded from the plans already in /Plans
+  in-memory set   the old PlanCreator.processed set, after a restart
+
+For each one it reports the plans written and the startup time.
+
+Usage:
+    uv run python benchmarks/bench_plan_index.py [N]   # default 10000
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.plan_creator import create_plan_for  # noqa: E402
+from watchers.plan_index import PlanIndex  # noqa: E402
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    logging.disable(logging.INFO)
+    logger = logging.getLogger("bench")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp)
+        needs_action, plans, logs = vault / "Needs_Action", vault / "Plans", vault / "Logs"
+        for folder in [needs_action, plans, logs]:
+            folder.mkdir()
+        for i in range(n):
+            (needs_action / f"EMAIL_{i:06d}.md").write_text(
+                f"---\ntype: email\nfrom: client{i % 300}@example.com\nsubject: Invoice {i}\n"
+                f"priority: high\nstatus: pending\n---\n\n## Email Content\n{'Please send the invoice. ' * 20}\n"
+            )
+        index_path = logs / "plan_index.jsonl"
+
+        def create(source: Path) -> Path:
+            return create_plan_for(source, plans, logger)
+
+        def start(label: str, seed: bool = False) -> None:
+            before = len(list(plans.iterdir()))
+            t0 = time.perf_counter()
+            index = PlanIndex(index_path, plans_dir=plans if seed else None)
+            stats = index.reconcile(needs_action, "*.md", create)
+            elapsed = time.perf_counter() - t0
+            index.close()
+            written = len(list(plans.iterdir())) - before
+            print(f"{label:<14} | {written:>13,} | {elapsed * 1000:>10.0f} | {stats}")
+
+        print(f"{n:,} files in Needs_Action\n")
+        print(f"{'start':<14} | {'plans written':>13} | {'startup ms':>10} | reconcile stats")
+        print("-" * 90)
+        start("first start")
+        start("restart")
+
+        for i in range(0, n, 10):
+            path = needs_action / f"EMAIL_{i:06d}.md"
+            path.write_text(path.read_text().replace("status: pending", "status: in_progress"))
+        start("agent edits")
+
+        for path in needs_action.iterdir():
+            data = path.read_bytes()
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        start("git restore")
+
+        index_path.unlink()
+        start("upgrade", seed=True)
+
+        # The old in-memory set starts empty after a restart
+        processed: set[str] = set()
+        before = len(list(plans.iterdir()))
+        t0 = time.perf_counter()
+        for action_file in needs_action.glob("*.md"):
+            if action_file.name not in processed:
+                create(action_file)
+                processed.add(action_file.name)
+        elapsed = time.perf_counter() - t0
+        print(f"{'in-memory set':<14} | {len(list(plans.iterdir())) - before:>13,} | {elapsed * 1000:>10.0f} |")
+
+
+if __name__ == "__main__":
+    main()
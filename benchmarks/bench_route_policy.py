@@ -0,0 +1,126 @@
+"""
+Benchmark / check: post flow with and without the route policy.
+
+Serves a fixture "feed" page with a compose box and Post button, plus the
+kind of weight real feeds carry: images, a video, a web font and an
+analytics script on a tracker host (mapped to the local server with
+--host-resolver-rules). The same post flow runs with no policy and with
+watchers.route_policy for each platform. The script asserts the post still
+goes through and reports the requests and bytes the server actually sent.
+
+Usage:
+    uv run python benchmarks/bench_route_policy.py
+"""
+
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.browser_session import BrowserSession  # noqa: E402
+from watchers.browser_waits import FlowTimer, condition, selector  # noqa: E402
+from watchers.route_policy import RoutePolicy  # noqa: E402
+
+TRACKER = "www.google-analytics.com"
+IMAGES = 12
+IMAGE_BYTES = 150_000
+ASSETS = {
+    "/app.js": (b"document.getElementById('post').onclick = () => {"
+                b" document.getElementById('status').innerText = 'posted: ' +"
+                b" document.getElementById('compose').innerText; };", "application/javascript"),
+    "/app.css": (b"#compose { min-height: 3em; border: 1px solid #ccc; }", "text/css"),
+    "/font.woff2": (b"\0" * 80_000, "font/woff2"),
+    "/clip.mp4": (b"\0" * 600_000, "video/mp4"),
+    "/analytics.js": (b"window.tracked = true;" + b" " * 40_000, "application/javascript"),
+}
+ASSETS.update({f"/img{i}.jpg": (b"\xff\xd8" + b"\0" * IMAGE_BYTES, "image/jpeg") for i in range(IMAGES)})
+
+
+def _page(port: int) -> bytes:
+    images = "".join(f'<img src="/img{i}.jpg">' for i in range(IMAGES))
+    return f"""<!doctype html><html><head>
+<link rel="stylesheet" href="/app.css">
+<style>@font-face {{ font-family: Brand; src: url(/font.woff2); }} body {{ font-family: Brand; }}</style>
+<script src="http://{TRACKER}:{port}/analytics.js"></script>
+</head><body>
+<div contenteditable="true" role="textbox" id="compose"></div>
+<button id="post">Post</button><div id="status"></div>
+{images}<video src="/clip.mp4" autoplay muted></video>
+<script src="/app.js"></script>
+</body></html>""".encode()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    served_requests = 0
+    served_bytes = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/":
+            body, content_type = _page(self.server.server_address[1]), "text/html"
+        elif path in ASSETS:
+            body, content_type = ASSETS[path]
+        else:
+            self.send_error(404)
+            return
+        FixtureHandler.served_requests += 1
+        FixtureHandler.served_bytes += len(body)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def post_flow(url: str, text: str):
+    import logging
+    logger = logging.getLogger("bench")
+
+    def flow(page):
+        timer = FlowTimer("fixture_post", logger)
+        page.goto(url, wait_until="domcontentloaded")
+        timer.wait(page, selector("compose", "#compose")).fill(text)
+        page.click("#post")
+        return timer.wait(page, condition(
+            "posted", "t => document.getElementById('status').innerText === 'posted: ' + t", arg=text,
+        ))
+    return flow
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    url = f"http://127.0.0.1:{port}/"
+    args = [f"--host-resolver-rules=MAP {TRACKER} 127.0.0.1"]
+
+    print(f"{'policy':<10} | {'posted':>6} | {'requests':>8} | {'KB served':>9} | blocked")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [("none", None)] + [
+            (platform, RoutePolicy(platform, block_types=["image", "media", "font"]))
+            for platform in ("whatsapp", "linkedin", "twitter", "facebook")
+        ]
+        for name, policy in runs:
+            FixtureHandler.served_requests = FixtureHandler.served_bytes = 0
+            session = BrowserSession(name, Path(tmp) / name, headless=True, args=args, route_policy=policy)
+            posted = session.run(post_flow(url, f"hello from {name}"))
+            session.close()
+            assert posted, f"post flow failed with policy {name}"
+            blocked = policy.stats()["blocked_by_reason"] if policy else {}
+            print(
+                f"{name:<10} | {'yes' if posted else 'NO':>6} | {FixtureHandler.served_requests:>8} | "
+                f"{FixtureHandler.served_bytes / 1024:>9.0f} | {blocked}"
+            )
+    server.shutdown()
+    print("\nOK: post flow works under every platform policy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: text-entry strategies for a 250-character post.
+
+Loads a local page with a contenteditable compose box (like X / LinkedIn /
+Facebook) and a plain textarea, then times each watchers.text_entry
+strategy on its own and the default enter_text() chain, checking that the
+text read back matches every time.
+
+Usage:
+    uv run python benchmarks/bench_text_entry.py
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.browser_session import BrowserSession  # noqa: E402
+from watchers.text_entry import STRATEGIES, enter_text  # noqa: E402
+
+TEXT = ("Launching our new invoicing workflow today: faster approvals, fewer emails, "
+        "and a weekly summary for every client. Ask us for a demo! ") * 2
+TEXT = TEXT[:250]
+PAGE = ("data:text/html,<div id='editable' contenteditable='true' style='min-height:3em'></div>"
+        "<textarea id='plain'></textarea>")
+
+
+def run(page) -> list[tuple[str, str, float, bool]]:
+    logger = logging.getLogger("bench")
+    rows = []
+    for target in ("#editable", "#plain"):
+        for strategy in list(STRATEGIES) + ["chain"]:
+            page.goto(PAGE)
+            box = page.locator(target)
+            start = time.perf_counter()
+            if strategy == "chain":
+                used = enter_text(page, box, TEXT, logger)
+                label, ok = f"chain -> {used}", used is not None
+            else:
+                # Only this strategy (then the typing fallback, which counts as a miss)
+                used = enter_text(page, box, TEXT, logger, strategies=[strategy])
+                label, ok = strategy, used == strategy
+            rows.append((target, label, (time.perf_counter() - start) * 1000, ok))
+    return rows
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        session = BrowserSession("bench", Path(tmp), headless=True)
+        rows = session.run(run)
+        session.close()
+
+    print(f"{len(TEXT)} characters\n")
+    print(f"{'box':<10} | {'strategy':<22} | {'ms':>8} | landed")
+    print("-" * 54)
+    for target, label, ms, ok in rows:
+        print(f"{target:<10} | {label:<22} | {ms:>8.0f} | {'yes' if ok else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark: glob polling loops vs the vault event bus.
+
+1. Pickup latency: files are written into Needs_Action at random moments and
+   timed until a subscriber sees them, with the inotify bus and the polling
+   fallback. For the old loops (PlanCreator 15 s, HITL 10 s, cloud 30 s,
+   posters 300 s) a file waits on average half the interval; one glob loop
+   is run at 1 s to confirm that model.
+2. Idle cost: a vault with F files per folder is left idle for T seconds.
+   The old loops' cost comes from one timed glob pass of each folder / pattern,
+   scaled to their intervals. The bus is measured directly (process CPU time
+   over the idle period). Both are reported per hour.
+
+Usage:
+    uv run python benchmarks/bench_vault_events.py [F] [T]   # default 500 files, 20 s
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers.vault_events import VaultEventBus  # noqa: E402
+
+SAMPLES = 40
+
+# (folder, pattern, interval s) for every glob the old loops ran
+OLD_LOOPS = [
+    ("Needs_Action", "*.md", 15),                      # PlanCreator
+    ("Approved", "*.md", 10),                          # HITL
+    ("Rejected", "*.md", 10),
+    ("Pending_Approval", "*.md", 10),
+    ("Plans/linkedin_queue", "*.md", 300),             # posters
+    ("Plans/twitter_queue", "*.md", 300),
+    ("Plans/facebook_queue", "*.md", 300),
+    ("Needs_Action", "EMAIL_*.md", 30),                # cloud orchestrator
+    ("Needs_Action", "SOCIAL_TWITTER_*.md", 30),
+    ("Needs_Action", "SOCIAL_LINKEDIN_*.md", 30),
+    ("Needs_Action", "SOCIAL_FACEBOOK_*.md", 30),
+    ("Needs_Action", "INVOICE_*.md", 30),
+]
+
+
+def make_vault(root: Path, files: int) -> Path:
+    for folder in {f for f, _, _ in OLD_LOOPS}:
+        (root / folder).mkdir(parents=True, exist_ok=True)
+        prefixes = ["EMAIL", "WHATSAPP", "FILE", "SOCIAL_TWITTER", "INVOICE"]
+        for i in range(files):
+            (root / folder / f"{prefixes[i % len(prefixes)]}_{i:05d}.md").write_text("---\ntype: email\n---\n")
+    return root
+
+
+def bus_latency(root: Path, mode: str, poll_interval: float) -> list[float]:
+    folder = root / "Needs_Action"
+    seen: dict[str, float] = {}
+    done = threading.Event()
+
+    def on_event(event):
+        if event.kind != "deleted":
+            seen.setdefault(event.path.name, time.perf_counter())
+            if len(seen) == SAMPLES:
+                done.set()
+
+    bus = VaultEventBus(mode=mode, poll_interval=poll_interval)
+    bus.subscribe(folder, "NEW_*.md", on_event)
+    time.sleep(poll_interval if mode == "polling" else 0.2)  # first polling snapshot
+    written = {}
+    rng = random.Random(1)
+    for i in range(SAMPLES):
+        name = f"NEW_{mode}_{i}.md"
+        written[name] = time.perf_counter()
+        (folder / name).write_text("---\ntype: email\n---\n")
+        time.sleep(rng.uniform(0, poll_interval / 4 if mode == "polling" else 0.05))
+    done.wait(poll_interval * 3 + 5)
+    bus.close()
+    for name in written:
+        (folder / name).unlink()
+    return [seen[name] - written[name] for name in written if name in seen]
+
+
+def glob_latency(root: Path, interval: float) -> list[float]:
+    folder = root / "Needs_Action"
+    seen: dict[str, float] = {}
+    stop = threading.Event()
+
+    def loop():
+        while not stop.is_set():
+            for path in folder.glob("GLOB_*.md"):
+                seen.setdefault(path.name, time.perf_counter())
+            stop.wait(interval)
+
+    thread = threading.Thread(target=loop)
+    thread.start()
+    written = {}
+    rng = random.Random(2)
+    for i in range(SAMPLES // 2):
+        name = f"GLOB_{i}.md"
+        written[name] = time.perf_counter()
+        (folder / name).write_text("x")
+        time.sleep(rng.uniform(0, interval))
+    time.sleep(interval * 1.5)
+    stop.set()
+    thread.join()
+    for name in written:
+        (folder / name).unlink()
+    return [seen[name] - written[name] for name in written if name in seen]
+
+
+def old_loops_per_hour(root: Path) -> tuple[float, int]:
+    cpu = 0.0
+    entries = 0
+    for folder, pattern, interval in OLD_LOOPS:
+        passes = 3600 / interval
+        start = time.process_time()
+        for _ in range(5):
+            list((root / folder).glob(pattern))
+        cpu += (time.process_time() - start) / 5 * passes
+        entries += sum(1 for _ in (root / folder).iterdir()) * int(passes)
+    return cpu, entries
+
+
+def bus_idle_per_hour(root: Path, mode: str, seconds: float) -> float:
+    bus = VaultEventBus(mode=mode, poll_interval=5)
+    for folder in {f for f, _, _ in OLD_LOOPS}:
+        bus.subscribe(root / folder, "*.md", lambda event: None)
+    time.sleep(1)  # let the polling observer take its first snapshot
+    start = time.process_time()
+    time.sleep(seconds)
+    cpu = time.process_time() - start
+    bus.close()
+    return cpu * 3600 / seconds
+
+
+def fmt(latencies: list[float]) -> str:
+    ms = sorted(x * 1000 for x in latencies)
+    return f"mean {statistics.mean(ms):9.1f} ms | p95 {ms[int(len(ms) * 0.95) - 1]:9.1f} ms | n={len(ms)}"
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    idle_s = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_vault(Path(tmp), files)
+
+        print(f"Pickup latency ({SAMPLES} files)\n")
+        print(f"{'inotify bus':<24}: {fmt(bus_latency(root, 'auto', 1.0))}")
+        print(f"{'polling bus (1 s)':<24}: {fmt(bus_latency(root, 'polling', 1.0))}")
+        print(f"{'glob loop (1 s)':<24}: {fmt(glob_latency(root, 1.0))}")
+        for label, interval in [("HITL", 10), ("PlanCreator", 15), ("cloud", 30), ("posters", 300)]:
+            print(f"{label + f' ({interval} s glob)':<24}: mean {interval / 2 * 1000:9.1f} ms (expected, interval / 2)")
+
+        print(f"\nIdle cost per hour, {files} files per folder\n")
+        cpu, entries = old_loops_per_hour(root)
+        print(f"{'old glob loops':<24}: {cpu * 1000:9.0f} ms CPU | {entries:>10,} directory entries read")
+        print(f"{'inotify bus':<24}: {bus_idle_per_hour(root, 'auto', idle_s) * 1000:9.0f} ms CPU | "
+              f"{0:>10,} directory entries read")
+        polled_entries = sum(1 for f in {f for f, _, _ in OLD_LOOPS} for _ in (root / f).iterdir()) * 3600 // 5
+        print(f"{'polling bus (5 s)':<24}: {bus_idle_per_hour(root, 'polling', idle_s) * 1000:9.0f} ms CPU | "
+              f"{polled_entries:>10,} directory entries read (+ a stat each)")
+
+
+if __name__ == "__main__":
+    main()
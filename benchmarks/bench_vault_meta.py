@@ -0,0 +1,122 @@
+"""
+Benchmark: frontmatter parsing over a large vault.
+
+Writes N notes with a small header and a large body (default 10k notes
+with 64 KB bodies): half action / approval files, half YAML social posts.
+It compares:
+
+  old     the per-module copies: read_text() + splitlines() for action
+          files, read_text() + yaml.safe_load (pure Python) for posts
+  cold    watchers.vault_meta, first pass (header-only reads, libyaml)
+  warm    watchers.vault_meta, second pass over unchanged files
+          (stat + cache hit), like HITL's and PlanCreator's rescans
+
+It also checks that the new readers return what the old copies did.
+
+Usage:
+    uv run python benchmarks/bench_vault_meta.py [N] [BODY_KB]   # default 10000 64
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from watchers import vault_meta  # noqa: E402
+from watchers.vault_meta import read_body, read_frontmatter  # noqa: E402
+
+
+def old_frontmatter(filepath: Path) -> dict:
+    """The parser formerly copied into plan_creator and HITL."""
+    metadata: dict = {}
+    lines = filepath.read_text().splitlines()
+    if not lines or lines[0].strip() != "---":
+        return metadata
+    try:
+        end = lines.index("---", 1)
+    except ValueError:
+        return metadata
+    for line in lines[1:end]:
+        if ":" in line:
+            key, _, value = line.partition(":")
+            metadata[key.strip()] = value.strip()
+    return metadata
+
+
+def old_parse_post(post_file: Path) -> tuple[dict, str]:
+    """The former social_publisher.parse_post."""
+    raw = post_file.read_text()
+    if raw.startswith("---"):
+        parts = raw.split("\n---", 1)
+        if len(parts) == 2:
+            try:
+                meta = yaml.safe_load(parts[0][3:]) or {}
+            except yaml.YAMLError:
+                meta = {}
+            body = parts[1].split("\n", 1)[1] if "\n" in parts[1] else ""
+            return (meta if isinstance(meta, dict) else {}), body.strip()
+    return {}, raw.strip()
+
+
+def make_notes(root: Path, n: int, body_kb: int) -> tuple[list[Path], list[Path]]:
+    rng = random.Random(5)
+    paragraph = "Client asked about the March invoice and the renewal terms. " * 16
+    body = "\n\n".join([paragraph] * (body_kb * 1024 // len(paragraph) + 1))[: body_kb * 1024]
+    actions, posts = [], []
+    for i in range(n // 2):
+        path = root / f"APPROVAL_{i:05d}.md"
+        path.write_text(
+            f"---\ntype: approval_request\naction: send_whatsapp\nphone: +92300{rng.randint(1000000, 9999999)}\n"
+            f"subject: Re: Invoice #{i} for client{i % 50}\ncreated: 2026-03-0{i % 9 + 1}T10:00:00\n"
+            f"expires: 2026-03-1{i % 9 + 1}T10:00:00\nstatus: pending\n---\n\n{body}\n"
+        )
+        actions.append(path)
+        path = root / f"POST_{i:05d}.md"
+        path.write_text(
+            f"---\npriority: {rng.choice(['high', 'low', 1, 3])}\nscheduled_at: 2026-05-0{i % 9 + 1}T09:30:00\n"
+            f"platforms: [linkedin, twitter]\ntags:\n  - launch\n  - q2\n---\n\n{body}\n"
+        )
+        posts.append(path)
+    return actions, posts
+
+
+def timed(fn, paths):
+    start = time.perf_counter()
+    results = [fn(p) for p in paths]
+    return results, time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    body_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    with tempfile.TemporaryDirectory() as tmp:
+        actions, posts = make_notes(Path(tmp), n, body_kb)
+        vault_meta.CACHE_SIZE = max(vault_meta.CACHE_SIZE, 2 * n)
+
+        old_actions, t_old_a = timed(old_frontmatter, actions)
+        old_posts, t_old_p = timed(lambda p: old_parse_post(p)[0], posts)
+        new_actions, t_cold_a = timed(read_frontmatter, actions)
+        new_posts, t_cold_p = timed(lambda p: read_frontmatter(p, typed=True), posts)
+        _, t_warm_a = timed(read_frontmatter, actions)
+        _, t_warm_p = timed(lambda p: read_frontmatter(p, typed=True), posts)
+        sample = posts[: min(200, len(posts))]
+        bodies_match = all(read_body(p) == old_parse_post(p)[1] for p in sample)
+
+    print(f"{n:,} notes, {body_kb} KB bodies, libyaml: {yaml.__with_libyaml__}\n")
+    print(f"{'reader':<8} | {'action files ms':>15} | {'YAML posts ms':>13} | {'per note us':>11}")
+    print("-" * 58)
+    for label, ta, tp in [("old", t_old_a, t_old_p), ("cold", t_cold_a, t_cold_p), ("warm", t_warm_a, t_warm_p)]:
+        print(f"{label:<8} | {ta * 1000:>15.0f} | {tp * 1000:>13.0f} | {(ta + tp) / n * 1e6:>11.1f}")
+    print(f"\nsame frontmatter as the old parsers: actions {new_actions == old_actions}, posts {new_posts == old_posts}")
+    print(f"same post bodies ({len(sample)} checked): {bodies_match}")
+    print(f"cache: {vault_meta.cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+In-process stand-in for the googleapiclient Gmail service used by benchmarks.
+
+Implements just enough of users().getProfile / messages().list / messages().get
+/ history().list to drive watchers.gmail_sync, with a fixed simulated latency
+per API call so results are comparable across mailbox sizes.
+"""
+
+import time
+
+
+class _Request:
+    def __init__(self, fn, latency: float):
+        self._fn = fn
+        self._latency = latency
+
+    def execute(self):
+        if self._latency:
+            time.sleep(self._latency)
+        return self._fn()
+
+
+class _HttpError(Exception):
+    """Mimics googleapiclient.errors.HttpError's .resp.status."""
+
+    class _Resp:
+        def __init__(self, status):
+            self.status = status
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.resp = self._Resp(status)
+
+
+class FakeGmailService:
+    def __init__(self, latency: float = 0.005, history_retention: int = 10_000):
+        self.latency = latency
+        self.history_retention = history_retention
+        self.store: dict[str, dict] = {}
+        self.order: list[str] = []  # newest first, like the real API
+        self.changes: list[tuple[int, str, dict]] = []  # (history_id, kind, message)
+        self.history_id = 1000
+        self.calls = 0
+
+    # ── Mailbox mutation (test side) ─────────────────────────────────── #
+
+    def add_message(self, labels: list[str], subject: str = "Hello") -> str:
+        msg_id = f"m{len(self.order):08d}"
+        self.history_id += 1
+        self.store[msg_id] = {
+            "id": msg_id,
+            "threadId": msg_id,
+            "labelIds": list(labels),
+            "snippet": f"snippet for {subject}",
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": "client@example.com"},
+                    {"name": "Subject", "value": subject},
+                    {"name": "Date", "value": "Mon, 1 Jan 2026 09:00:00 +0000"},
+                ],
+                "body": {"data": ""},
+            },
+        }
+        self.order.insert(0, msg_id)
+        self.changes.append((self.history_id, "messagesAdded", self.store[msg_id]))
+        return msg_id
+
+    def bulk_load(self, count: int, match_every: int = 20) -> None:
+        """Fill the mailbox without generating history (an old, big inbox)."""
+        for i in range(count):
+            labels = ["INBOX", "UNREAD", "STARRED"] if i % match_every == 0 else ["INBOX"]
+            self.add_message(labels)
+        self.changes.clear()
+
+    # ── API surface ──────────────────────────────────────────────────── #
+
+    def users(self):
+        return self
+
+    def _req(self, fn):
+        self.calls += 1
+        return _Request(fn, self.latency)
+
+    def getProfile(self, userId):
+        return self._req(lambda: {"historyId": str(self.history_id)})
+
+    def messages(self):
+        return _Messages(self)
+
+    def history(self):
+        return _History(self)
+
+
+class _Messages:
+    def __init__(self, svc: FakeGmailService):
+        self.svc = svc
+
+    def list(self, userId, q="", maxResults=100, pageToken=None, fields=None):
+        def run():
+            wanted = {"UNREAD", "STARRED"} if "is:starred" in q else set()
+            matches = [
+                m for m in self.svc.order
+                if wanted.issubset(self.svc.store[m]["labelIds"])
+            ]
+            start = int(pageToken or 0)
+            page = matches[start:start + maxResults]
+            out = {"messages": [{"id": m, "threadId": m} for m in page]}
+            if start + maxResults < len(matches):
+                out["nextPageToken"] = str(start + maxResults)
+            return out
+        return self.svc._req(run)
+
+    def get(self, userId, id, format="full", metadataHeaders=None, fields=None):
+        return self.svc._req(lambda: self.svc.store[id])
+
+
+class _History:
+    def __init__(self, svc: FakeGmailService):
+        self.svc = svc
+
+    def list(self, userId, startHistoryId, historyTypes=None, maxResults=100, pageToken=None):
+        def run():
+            start = int(startHistoryId)
+            if start < self.svc.history_id - self.svc.history_retention:
+                raise _HttpError(404)
+            records = [
+                {"id": str(hid), kind: [{"message": msg}]}
+                for hid, kind, msg in self.svc.changes if hid > start
+            ]
+            offset = int(pageToken or 0)
+            out = {"history": records[offset:offset + maxResults],
+                   "historyId": str(self.svc.history_id)}
+            if offset + maxResults < len(records):
+                out["nextPageToken"] = str(offset + maxResults)
+            return out
+        return self.svc._req(run)
@@ -4,14 +4,18 @@ Cloud Orchestrator - Runs on Cloud VM 24/7
 Cloud Zone: Email triage + social drafts + Odoo drafts (NO sending, NO WhatsApp)
 """
 import subprocess
+import threading
 import time
 import logging
 import os
-import json
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from watchers.audit_log import append_entry
+from watchers.config import Config
+from watchers.vault_events import get_bus
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -23,8 +27,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 VAULT_PATH = Path(os.getenv('VAULT_PATH', 'AI_Employee_Vault'))
-CHECK_INTERVAL = 30
+GIT_SYNC_INTERVAL = 150  # seconds
 AGENT = 'cloud'
+TASK_PATTERNS = [
+    'EMAIL_*.md',
+    'SOCIAL_TWITTER_*.md', 'SOCIAL_LINKEDIN_*.md', 'SOCIAL_FACEBOOK_*.md',
+    'INVOICE_*.md',
+]
 
 
 def claim_task(task_file: Path) -> bool:
@@ -169,24 +178,13 @@ def git_sync():
 
 def log_action(action_type: str, target: str, result: str):
     """Log to vault"""
-    log_dir = VAULT_PATH / 'Logs'
-    log_dir.mkdir(exist_ok=True)
-    today = datetime.now().strftime('%Y-%m-%d')
-    log_file = log_dir / f'{today}.json'
-    logs = []
-    if log_file.exists():
-        try:
-            logs = json.loads(log_file.read_text())
-        except Exception:
-            logs = []
-    logs.append({
+    append_entry(VAULT_PATH / 'Logs', {
         'timestamp': datetime.now().isoformat(),
         'action_type': action_type,
         'actor': 'cloud_orchestrator',
         'target': target,
         'result': result
     })
-    log_file.write_text(json.dumps(logs, indent=2))
 
 
 def check_needs_action():
@@ -236,16 +234,27 @@ def main():
 
     Path('logs').mkdir(exist_ok=True)
 
-    iteration = 0
+    # New tasks (written locally or pulled in by git_sync) wake the loop at once;
+    # otherwise it only wakes to sync and for a safety rescan
+    wake = threading.Event()
+
+    def on_task(event) -> None:
+        if event.kind != 'deleted':
+            wake.set()
+
+    get_bus().subscribe(VAULT_PATH / 'Needs_Action', TASK_PATTERNS, on_task)
+
+    next_sync = time.monotonic() + GIT_SYNC_INTERVAL
     while True:
-        iteration += 1
+        wake.clear()
         check_needs_action()
 
-        # Git sync every 5 iterations (2.5 min)
-        if iteration % 5 == 0:
+        if time.monotonic() >= next_sync:
             git_sync()
+            next_sync = time.monotonic() + GIT_SYNC_INTERVAL
 
-        time.sleep(CHECK_INTERVAL)
+        wait = min(next_sync - time.monotonic(), Config.VAULT_RESCAN_INTERVAL)
+        wake.wait(max(0.0, wait))
 
 
 if __name__ == '__main__':
@@ -10,14 +10,19 @@ Usage:
     uv run python main.py --linkedin  # LinkedIn poster only
     uv run python main.py --facebook  # Facebook poster only
     uv run python main.py --twitter   # Twitter poster only
+    uv run python main.py --social    # Multi-platform social publisher only
     uv run python main.py --hitl      # HITL approval watcher only
     uv run python main.py --briefing  # Trigger weekly CEO briefing
+    uv run python main.py --migrate-logs  # Convert legacy Logs/*.json arrays to JSONL
+    uv run python main.py --query-logs --action send_email --failed --since 7d
     uv run python main.py --dry-run   # Safe mode (no external actions)
 """
 
 import argparse
 import os
 
+from watchers.audit_index import INDEXED_FIELDS
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Personal AI Employee")
@@ -26,9 +31,30 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--linkedin", action="store_true", help="Run LinkedIn poster only")
     parser.add_argument("--facebook", action="store_true", help="Run Facebook poster only")
     parser.add_argument("--twitter", action="store_true", help="Run Twitter poster only")
+    parser.add_argument("--social", action="store_true", help="Run multi-platform social publisher only")
+    parser.add_argument("--schedule-posts", action="store_true", help="Run the scheduled LinkedIn/Twitter/Facebook queues only")
     parser.add_argument("--filesystem", action="store_true", help="Run filesystem watcher only")
     parser.add_argument("--hitl", action="store_true", help="Run HITL approval watcher only")
     parser.add_argument("--briefing", action="store_true", help="Trigger weekly CEO briefing")
+    parser.add_argument(
+        "--migrate-logs",
+        action="store_true",
+        help="Convert legacy Logs/YYYY-MM-DD.json arrays to append-only JSONL",
+    )
+    parser.add_argument("--query-logs", action="store_true", help="Query the audit log index")
+    parser.add_argument("--action", help="[--query-logs] Filter by action_type")
+    parser.add_argument("--actor", help="[--query-logs] Filter by actor")
+    parser.add_argument("--result", help="[--query-logs] Filter by exact result")
+    parser.add_argument("--session", help="[--query-logs] Filter by session_id")
+    parser.add_argument("--failed", action="store_true", help="[--query-logs] Only failed actions")
+    parser.add_argument("--since", help="[--query-logs] YYYY-MM-DD, ISO timestamp, or 7d / 12h")
+    parser.add_argument("--until", help="[--query-logs] YYYY-MM-DD or ISO timestamp (exclusive)")
+    parser.add_argument("--limit", type=int, default=50, help="[--query-logs] Max rows (0 = all)")
+    parser.add_argument(
+        "--count-by",
+        choices=INDEXED_FIELDS,
+        help="[--query-logs] Print counts per value of this field",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -37,6 +63,45 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def query_logs(args: argparse.Namespace) -> None:
+    """Print audit entries (or counts) matching the --query-logs filters."""
+    import json
+    from watchers.audit_index import AuditIndex
+    from watchers.config import Config
+
+    index = AuditIndex(Config.LOGS)
+    try:
+        if args.count_by:
+            counts = index.counts(
+                args.count_by,
+                action_type=args.action,
+                actor=args.actor,
+                result=args.result,
+                session_id=args.session,
+                since=args.since,
+                until=args.until,
+                failed=args.failed,
+            )
+            for key, count in counts.items():
+                print(f"{count:>8}  {key}")
+            return
+        entries = index.query(
+            action_type=args.action,
+            actor=args.actor,
+            result=args.result,
+            session_id=args.session,
+            since=args.since,
+            until=args.until,
+            failed=args.failed,
+            limit=args.limit or None,
+        )
+        for entry in entries:
+            print(json.dumps(entry, ensure_ascii=False))
+        print(f"-- {len(entries)} entries")
+    finally:
+        index.close()
+
+
 def main() -> None:
     args = parse_args()
 
@@ -66,6 +131,14 @@ def main() -> None:
         from watchers.twitter_poster import TwitterPoster
         TwitterPoster().run()
 
+    elif args.social:
+        from watchers.social_publisher import SocialPublisher
+        SocialPublisher().run()
+
+    elif args.schedule_posts:
+        from watchers.post_scheduler import PostScheduler
+        PostScheduler().run()
+
     elif args.filesystem:
         from watchers.filesystem_watcher import FilesystemWatcher
         FilesystemWatcher().run()
@@ -79,6 +152,15 @@ def main() -> None:
         generate_daily_briefing()
         print("Daily briefing prompt written to /Plans — run Claude Code to generate it.")
 
+    elif args.migrate_logs:
+        from watchers.audit_log import migrate_legacy_logs
+        from watchers.config import Config
+        count = migrate_legacy_logs(Config.LOGS)
+        print(f"Migrated {count} audit entries to JSONL in {Config.LOGS}")
+
+    elif args.query_logs:
+        query_logs(args)
+
     else:
         # Default: start full orchestrator with all watchers
         from orchestrator import main as run_orchestrator
@@ -6,19 +6,17 @@ Uses same Gmail OAuth credentials
 """
 import json
 import os
-import pickle
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from watchers.google_auth import get_service
+
 # Calendar scope — add to existing Gmail scopes
 SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
@@ -35,26 +33,13 @@ app = Server("calendar-mcp")
 
 
 def get_calendar_service():
-    """Get authenticated Google Calendar service"""
-    creds = None
-
-    if Path(TOKEN_PATH).exists():
-        with open(TOKEN_PATH, 'rb') as f:
-            creds = pickle.load(f)
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                CREDENTIALS_PATH, SCOPES
-            )
-            creds = flow.run_local_server(port=0)
-
-        with open(TOKEN_PATH, 'wb') as f:
-            pickle.dump(creds, f)
-
-    return build('calendar', 'v3', credentials=creds)
+    """Get authenticated Google Calendar service (cached per process)"""
+    return get_service(
+        'calendar', 'v3', TOKEN_PATH,
+        scopes=SCOPES,
+        credentials_path=CREDENTIALS_PATH,
+        interactive=True,
+    )
 
 
 @app.list_tools()
@@ -3,8 +3,8 @@ Email MCP Server - Silver Tier
 Proper MCP implementation using the mcp library.
 """
 import asyncio
-import pickle
 import os
+import sys
 from pathlib import Path
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -14,8 +14,8 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
 
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from watchers.google_auth import get_service
 
 CREDENTIALS_PATH = Path(os.getenv("GMAIL_CREDENTIALS_PATH", "./credentials.json"))
 TOKEN_PATH = Path(os.getenv("GMAIL_TOKEN_PATH", "./watchers/token.pickle"))
@@ -24,18 +24,10 @@ DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 server = Server("email")
 
 def _get_service():
-    creds = None
-    if TOKEN_PATH.exists():
-        with open(TOKEN_PATH, "rb") as f:
-            creds = pickle.load(f)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            with open(TOKEN_PATH, "wb") as f:
-                pickle.dump(creds, f)
-        else:
-            raise RuntimeError("Gmail token not found. Run --gmail --dry-run first.")
-    return build("gmail", "v1", credentials=creds)
+    try:
+        return get_service("gmail", "v1", TOKEN_PATH)
+    except RuntimeError as e:
+        raise RuntimeError("Gmail token not found. Run --gmail --dry-run first.") from e
 
 @server.list_tools()
 async def list_tools() -> list[types.Tool]:
@@ -15,13 +15,39 @@ DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 
 server = Server("facebook")
 
+# Kept for the life of the server so every call reuses one pooled browser
+_poster = None
+
+
+def _queue_post(text: str, topic: str) -> Path:
+    """Write a post to /Plans/facebook_queue, where the orchestrator's scheduler publishes it."""
+    vault = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    queue = vault / "Plans" / "facebook_queue"
+    queue.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = queue / f"{topic}_{timestamp}.md"
+    filepath.write_text(f"""---
+type: facebook_post
+created: {datetime.now().isoformat()}
+---
+
+{text}
+""")
+    return filepath
+
 
 def _post_to_facebook(text: str) -> str:
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from watchers.facebook_poster import FacebookPoster
-    poster = FacebookPoster()
-    success = poster._post_to_facebook(text)
+    from watchers.browser_session import profile_owner
+    global _poster
+    if _poster is None:
+        _poster = FacebookPoster()
+    if profile_owner(_poster.session_path) is not None:
+        # The running orchestrator holds this browser profile; let its scheduler post it
+        return f"queued for the running orchestrator ({_queue_post(text, 'mcp').name})"
+    success = _poster._post_to_facebook(text)
     return "posted" if success else "failed"
 
 
@@ -69,19 +95,7 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
 
         elif name == "queue_facebook":
             text = arguments["text"]
-            topic = arguments.get("topic", "post")
-            vault = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
-            queue = vault / "Plans" / "facebook_queue"
-            queue.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = queue / f"{topic}_{timestamp}.md"
-            filepath.write_text(f"""---
-type: facebook_post
-created: {datetime.now().isoformat()}
----
-
-{text}
-""")
+            filepath = _queue_post(text, arguments.get("topic", "post"))
             return [types.TextContent(type="text", text=f"Facebook post queued: {filepath.name}")]
 
     except Exception as e:
@@ -14,14 +14,47 @@ DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 
 server = Server("whatsapp")
 
+# Kept for the life of the server so every call reuses one pooled browser
+_watcher = None
+
+
+def _hand_to_orchestrator(to: str, body: str) -> Path:
+    """
+    Write the send to /Approved. The running orchestrator's HITL watcher picks
+    it up within moments and sends it through the browser it already has open.
+    """
+    from datetime import datetime
+    vault = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
+    approved = vault / "Approved"
+    approved.mkdir(exist_ok=True)
+    filepath = approved / f"WHATSAPP_mcp_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.md"
+    tmp = filepath.with_name(f".{filepath.name}.tmp")
+    tmp.write_text(f"""---
+action: send_whatsapp
+to: {to}
+body: {body}
+requested_by: whatsapp_mcp
+created: {datetime.now().isoformat()}
+---
+
+# WhatsApp send requested through the MCP server
+""")
+    tmp.rename(filepath)  # HITL only sees the complete file
+    return filepath
+
 
 def _send_whatsapp(to: str, body: str) -> str:
     """Send WhatsApp message using existing WhatsApp watcher."""
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
+    from watchers.browser_session import profile_owner
     from watchers.whatsapp_watcher import WhatsAppWatcher
-    watcher = WhatsAppWatcher()
-    success = watcher.send_reply(to=to, message=body)
+    global _watcher
+    if _watcher is None:
+        _watcher = WhatsAppWatcher()
+    if profile_owner(_watcher.session_path) is not None:
+        return f"queued for the running orchestrator ({_hand_to_orchestrator(to, body).name})"
+    success = _watcher.send_reply(to=to, message=body)
     return "sent" if success else "failed"
 
 
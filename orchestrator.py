@@ -9,17 +9,21 @@ import logging
 import signal
 import sys
 import threading
-import time
 from datetime import datetime
 from pathlib import Path
 
+from watchers.audit_index import AuditIndex
+from watchers.audit_log import start_sink, stop_sink
+from watchers.browser_pool import get_pool
 from watchers.config import Config
 from watchers.gmail_watcher import GmailWatcher
 from watchers.whatsapp_watcher import WhatsAppWatcher
-from watchers.linkedin_poster import LinkedInPoster
 from watchers.filesystem_watcher import FilesystemWatcher
 from watchers.hitl_approval_watcher import HITLApprovalWatcher
 from watchers.plan_creator import PlanCreator
+from watchers.post_scheduler import PostScheduler
+from watchers.social_publisher import SocialPublisher
+from watchers.vault_events import get_bus
 
 
 # ── Logging setup ─────────────────────────────────────────────────────────── #
@@ -52,6 +56,9 @@ def ensure_vault_structure() -> None:
         Config.LOGS,
         Config.PLANS,
         Config.PLANS / "linkedin_queue",
+        Config.PLANS / "twitter_queue",
+        Config.PLANS / "facebook_queue",
+        Config.PLANS / "social_queue",
         Config.PENDING,
         Config.APPROVED,
         Config.REJECTED,
@@ -102,6 +109,26 @@ class Scheduler:
                         logger.error(f"Scheduled task {fn.__name__} failed: {e}", exc_info=True)
 
 
+def _audit_summary(days: int = 7) -> str:
+    """Markdown summary of the last N days of audit activity from the index."""
+    try:
+        index = AuditIndex(Config.LOGS)
+        try:
+            by_action = index.counts("action_type", since=f"{days}d")
+            failed = index.counts("action_type", since=f"{days}d", failed=True)
+        finally:
+            index.close()
+    except Exception as e:
+        logger.warning(f"Audit index unavailable for briefing: {e}")
+        return "- (audit index unavailable — read /Logs directly)"
+    if not by_action:
+        return "- No logged actions"
+    return "\n".join(
+        f"- {action}: {count} total, {failed.get(action, 0)} failed"
+        for action, count in by_action.items()
+    )
+
+
 def generate_daily_briefing() -> None:
     """
     Trigger Claude Code to read the vault and write a daily briefing.
@@ -123,6 +150,11 @@ Read the following and write a briefing to /Vault/Briefings/{datetime.now().strf
 2. All files in /Done/ (from today)
 3. Company_Handbook.md goals
 
+## Logged Actions (last 7 days)
+{_audit_summary()}
+
+For details run `uv run python main.py --query-logs --since 7d` instead of reading /Logs.
+
 Include:
 - Summary of pending actions
 - Completed items today
@@ -154,12 +186,23 @@ def main() -> None:
 
     ensure_vault_structure()
 
+    # Audit entries from every watcher thread go through one group-commit writer,
+    # which keeps the SQLite query index in step after each batch
+    audit_index = AuditIndex(Config.LOGS)
+    audit_sink = start_sink(
+        max_queue=Config.AUDIT_QUEUE_SIZE,
+        batch_size=Config.AUDIT_BATCH_SIZE,
+        fsync=Config.AUDIT_FSYNC,
+        on_flush=audit_index.sync,
+    )
+
     threads = []
 
     # Start all watchers as daemon threads
     threads.append(_run_in_thread(GmailWatcher().run, "GmailWatcher"))
     threads.append(_run_in_thread(WhatsAppWatcher().run, "WhatsAppWatcher"))
-    threads.append(_run_in_thread(LinkedInPoster().run, "LinkedInPoster"))
+    threads.append(_run_in_thread(PostScheduler().run, "PostScheduler"))
+    threads.append(_run_in_thread(SocialPublisher().run, "SocialPublisher"))
     threads.append(_run_in_thread(FilesystemWatcher().run, "FilesystemWatcher"))
     threads.append(_run_in_thread(HITLApprovalWatcher().run, "HITLApprovalWatcher"))
     threads.append(_run_in_thread(PlanCreator().run, "PlanCreator"))
@@ -178,9 +221,18 @@ def main() -> None:
         if datetime.now().minute % 5 == 0 and datetime.now().second < 10:
             alive = [t.name for t in threads if t.is_alive()]
             logger.info(f"Active threads: {alive}")
-
-        time.sleep(10)
-
+            logger.info(f"Audit sink: {audit_sink.stats()}")
+            logger.info(f"Browser pool: {get_pool().stats()}")
+            logger.info(f"Vault events: {get_bus().stats()}")
+
+        _shutdown_event.wait(10)
+
+    stats = audit_sink.stats()
+    logger.info(f"Flushing {stats['queue_depth']} queued audit entries...")
+    stop_sink()
+    audit_index.close()
+    get_pool().close()
+    get_bus().close()
     logger.info("Orchestrator stopped cleanly.")
 
 
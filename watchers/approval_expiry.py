@@ -0,0 +1,142 @@
+"""
+Approval Expiry - Gold Tier
+Deadline scheduler for the `expires:` field of /Pending_Approval files.
+
+HITL used to re-read every pending approval on each pass to find the few
+that would expire within 2 hours. It never did anything about the ones that
+had already expired, so a stale request stayed approvable forever. Each
+approval with `expires:` now has two deadlines in one min-heap:
+
+    warn     expires - APPROVAL_WARN_HOURS   a warning in the HITL log
+    expire   expires                         APPROVAL_ON_EXPIRY:
+                                               reject  archive as Done/EXPIRED_<name>
+                                               warn    log it once
+                                               ignore  nothing
+
+Files enter the heap when a vault event reports them in Pending_Approval.
+That costs one header read per new or changed file; a full rescan is only
+the safety net. Entries for removed or edited files are dropped lazily when
+they reach the top of the heap, as in the post scheduler. HITL sleeps until
+the next deadline or the next event, so its cost does not depend on how
+many approvals are waiting.
+"""
+
+import heapq
+import queue
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from watchers.vault_events import VaultEvent
+from watchers.vault_meta import read_frontmatter
+
+
+def expiry_time(value) -> float | None:
+    """Epoch seconds for an `expires:` value (local time unless it has an offset or Z)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    return None
+
+
+class ExpiryScheduler:
+    """Min-heap of warn / expire deadlines for the files in one folder."""
+
+    def __init__(self, folder: Path, warn_before: float, clock=time.time):
+        self.folder = Path(folder).resolve()  # the same paths vault events report
+        self.warn_before = warn_before  # seconds; 0 = no warnings
+        self.clock = clock
+        self._heap: list[tuple] = []                     # (deadline, seq, kind, path, mtime_ns, expires)
+        self._known: dict[Path, tuple[int, float]] = {}  # path -> (mtime_ns, expires)
+        self._events: queue.SimpleQueue[VaultEvent] = queue.SimpleQueue()
+        self._seq = 0
+
+    # ------------------------------------------------------------------ #
+    #  Tracking                                                             #
+    # ------------------------------------------------------------------ #
+
+    def on_event(self, event: VaultEvent) -> None:
+        """Vault event callback; applied on the HITL thread by due()."""
+        self._events.put(event)
+
+    def _apply_events(self) -> None:
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                return
+            if event.src_path is not None:
+                self._known.pop(event.src_path, None)
+            if event.kind == "deleted":
+                self._known.pop(event.path, None)
+            else:
+                self.track(event.path)
+
+    def track(self, path: Path) -> None:
+        """(Re)read path's `expires:` and schedule its deadlines."""
+        try:
+            mtime = path.stat().st_mtime_ns
+            expires = expiry_time(read_frontmatter(path).get("expires"))
+        except FileNotFoundError:
+            self._known.pop(path, None)
+            return
+        if expires is None:
+            self._known.pop(path, None)
+            return
+        if self._known.get(path) == (mtime, expires):
+            return
+        self._known[path] = (mtime, expires)
+        if self.warn_before:
+            self._push(expires - self.warn_before, "warn", path, mtime, expires)
+        self._push(expires, "expire", path, mtime, expires)
+
+    def _push(self, deadline: float, kind: str, path: Path, mtime: int, expires: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, kind, path, mtime, expires))
+
+    def scan(self) -> None:
+        """Full pass over the folder: the startup load and the safety rescan."""
+        self._apply_events()
+        present = set(self.folder.glob("*.md"))
+        for path in self._known.keys() - present:
+            del self._known[path]
+        for path in present:
+            self.track(path)
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    # ------------------------------------------------------------------ #
+    #  Deadlines                                                            #
+    # ------------------------------------------------------------------ #
+
+    def due(self, now: float | None = None) -> list[tuple[str, Path, float]]:
+        """Pop every deadline that has passed: [(kind, path, expires)]."""
+        self._apply_events()
+        now = self.clock() if now is None else now
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, kind, path, mtime, expires = heapq.heappop(self._heap)
+            if self._known.get(path) != (mtime, expires):
+                continue  # removed, or edited and rescheduled
+            try:
+                on_disk = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                del self._known[path]
+                continue
+            if on_disk != mtime:
+                self.track(path)  # edited in place; re-read `expires:`
+                continue
+            if kind == "warn" and expires <= now:
+                continue  # already expired; only the expire deadline fires
+            fired.append((kind, path, expires))
+        return fired
+
+    def next_deadline(self) -> float | None:
+        return self._heap[0][0] if self._heap else None
@@ -0,0 +1,260 @@
+"""
+Audit Index - Gold Tier
+Embedded SQLite index over the /Vault/Logs audit trail.
+
+The JSONL day files stay the source of truth; this index tails them by byte
+offset (legacy JSON arrays are re-read only when they change) so queries such
+as "all failed send_email actions this week" hit B-tree indexes instead of
+re-parsing months of logs. A day file that was rewritten rather than appended
+to (a new inode, or different first bytes, as after `main.py --migrate-logs`)
+is indexed again from the start, and rows for files that are gone are
+dropped. The database lives next to the logs and can be deleted at any time
+— it is rebuilt on the next sync().
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from watchers.audit_log import LEGACY_SUFFIX, daily_log_files, iter_log_file
+
+DB_NAME = "audit_index.sqlite3"
+
+HEAD_BYTES = 4096  # prefix hashed to notice a day file rewritten in place
+
+# Result values that count as a failure in addition to status=error / "error: ..."
+FAILED_RESULTS = ("failed", "timeout", "incomplete", "error", "partial")
+
+INDEXED_FIELDS = ("action_type", "actor", "result", "session_id")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id          INTEGER PRIMARY KEY,
+    file        TEXT NOT NULL,
+    timestamp   TEXT,
+    action_type TEXT,
+    actor       TEXT,
+    result      TEXT,
+    session_id  TEXT,
+    status      TEXT,
+    entry       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp   ON entries(timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_action_type ON entries(action_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_actor       ON entries(actor, timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_result      ON entries(result, timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_session_id  ON entries(session_id);
+CREATE INDEX IF NOT EXISTS idx_entries_file        ON entries(file);
+CREATE TABLE IF NOT EXISTS files (
+    name     TEXT PRIMARY KEY,
+    offset   INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ino      INTEGER NOT NULL,
+    head     TEXT NOT NULL
+);
+"""
+
+
+def _head_hash(f, indexed: int) -> str:
+    """sha256 of the first min(indexed, HEAD_BYTES) bytes of an open file."""
+    f.seek(0)
+    return hashlib.sha256(f.read(min(indexed, HEAD_BYTES))).hexdigest()
+
+
+def parse_since(value: str | None) -> str | None:
+    """Accept 'YYYY-MM-DD', a full ISO timestamp, or a relative '7d' / '12h'."""
+    if not value:
+        return None
+    value = value.strip()
+    if value[-1:] in ("d", "h") and value[:-1].isdigit():
+        amount = int(value[:-1])
+        delta = timedelta(days=amount) if value[-1] == "d" else timedelta(hours=amount)
+        return (datetime.now() - delta).isoformat()
+    return value
+
+
+class AuditIndex:
+    """Incrementally synced SQLite view of the audit log."""
+
+    def __init__(self, logs_dir: Path, db_path: Path | None = None):
+        self.logs_dir = Path(logs_dir)
+        self.db_path = Path(db_path) if db_path else self.logs_dir / DB_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(files)")}
+        if columns and "head" not in columns:
+            # Index from before rewrite detection; rebuild it
+            self._conn.executescript("DROP TABLE files; DROP TABLE entries;")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------ #
+    #  Sync                                                                 #
+    # ------------------------------------------------------------------ #
+
+    def sync(self) -> int:
+        """Index anything appended since the last sync. Returns rows added."""
+        added = 0
+        with self._lock, self._conn:
+            known = {
+                row["name"]: row
+                for row in self._conn.execute("SELECT * FROM files")
+            }
+            present = set()
+            for log_file in daily_log_files(self.logs_dir):
+                try:
+                    st = log_file.stat()
+                except FileNotFoundError:
+                    continue
+                present.add(log_file.name)
+                state = known.get(log_file.name)
+                if state and state["size"] == st.st_size and state["mtime_ns"] == st.st_mtime_ns:
+                    continue
+                if log_file.suffix == LEGACY_SUFFIX:
+                    added += self._reindex_legacy(log_file, st)
+                else:
+                    added += self._tail_jsonl(log_file, st, state)
+            for name in known.keys() - present:
+                # Removed, or renamed to *.json.migrated
+                self._conn.execute("DELETE FROM entries WHERE file = ?", (name,))
+                self._conn.execute("DELETE FROM files WHERE name = ?", (name,))
+        return added
+
+    def _reindex_legacy(self, log_file: Path, st) -> int:
+        self._conn.execute("DELETE FROM entries WHERE file = ?", (log_file.name,))
+        rows = [self._row(log_file.name, e) for e in iter_log_file(log_file)]
+        self._insert(rows)
+        self._save_state(log_file.name, st.st_size, st, head="")  # re-read whole on change
+        return len(rows)
+
+    def _tail_jsonl(self, log_file: Path, st, state) -> int:
+        offset = state["offset"] if state else 0
+        with open(log_file, "rb") as f:
+            if offset and (
+                st.st_size < offset
+                or st.st_ino != state["ino"]
+                or _head_hash(f, offset) != state["head"]
+            ):
+                # Rewritten rather than appended to (e.g. migration) — start over
+                self._conn.execute("DELETE FROM entries WHERE file = ?", (log_file.name,))
+                offset = 0
+            f.seek(offset)
+            chunk = f.read(st.st_size - offset)
+            # Only consume whole lines; a half-written tail is picked up next time
+            end = chunk.rfind(b"\n") + 1
+            head = _head_hash(f, offset + end)
+        rows = []
+        for line in chunk[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                rows.append(self._row(log_file.name, entry))
+        self._insert(rows)
+        self._save_state(log_file.name, offset + end, st, head)
+        return len(rows)
+
+    def _save_state(self, name: str, offset: int, st, head: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (name, offset, size, mtime_ns, ino, head) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (name, offset, st.st_size, st.st_mtime_ns, st.st_ino, head),
+        )
+
+    def _insert(self, rows: list[tuple]) -> None:
+        self._conn.executemany(
+            "INSERT INTO entries (file, timestamp, action_type, actor, result, "
+            "session_id, status, entry) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    @staticmethod
+    def _row(file_name: str, entry: dict) -> tuple:
+        def text(key):
+            value = entry.get(key)
+            return None if value is None else str(value)
+        return (
+            file_name,
+            text("timestamp"),
+            text("action_type"),
+            text("actor"),
+            text("result"),
+            text("session_id"),
+            text("status"),
+            json.dumps(entry, ensure_ascii=False, default=str),
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Queries                                                              #
+    # ------------------------------------------------------------------ #
+
+    def _where(self, since, until, failed, filters) -> tuple[str, list]:
+        clauses, params = [], []
+        for field in INDEXED_FIELDS:
+            value = filters.get(field)
+            if value is not None:
+                clauses.append(f"{field} = ?")
+                params.append(value)
+        since, until = parse_since(since), parse_since(until)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if failed:
+            placeholders = ", ".join("?" for _ in FAILED_RESULTS)
+            clauses.append(
+                f"(status = 'error' OR result LIKE 'error%' OR result IN ({placeholders}))"
+            )
+            params.extend(FAILED_RESULTS)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(self, action_type: str | None = None, actor: str | None = None,
+              result: str | None = None, session_id: str | None = None,
+              since: str | None = None, until: str | None = None,
+              failed: bool = False, limit: int | None = None) -> list[dict]:
+        """Return matching audit entries, newest first."""
+        self.sync()
+        where, params = self._where(since, until, failed, {
+            "action_type": action_type, "actor": actor,
+            "result": result, "session_id": session_id,
+        })
+        sql = f"SELECT entry FROM entries{where} ORDER BY timestamp DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [json.loads(row["entry"]) for row in self._conn.execute(sql, params)]
+
+    def counts(self, group_by: str = "action_type", action_type: str | None = None,
+               actor: str | None = None, result: str | None = None,
+               session_id: str | None = None, since: str | None = None,
+               until: str | None = None, failed: bool = False) -> dict[str, int]:
+        """Count matching entries per value of an indexed field."""
+        if group_by not in INDEXED_FIELDS:
+            raise ValueError(f"Cannot group by {group_by!r}")
+        self.sync()
+        where, params = self._where(since, until, failed, {
+            "action_type": action_type, "actor": actor,
+            "result": result, "session_id": session_id,
+        })
+        sql = (
+            f"SELECT {group_by} AS key, COUNT(*) AS n FROM entries{where} "
+            f"GROUP BY {group_by} ORDER BY n DESC"
+        )
+        with self._lock:
+            return {row["key"] or "unknown": row["n"] for row in self._conn.execute(sql, params)}
@@ -0,0 +1,292 @@
+"""
+Audit Log - Gold Tier
+Append-only JSON Lines audit trail shared by every watcher and orchestrator.
+
+Each day is one file: /Vault/Logs/YYYY-MM-DD.jsonl, one JSON object per line.
+Writing an entry is a single append (O(1) per entry), so a busy day no longer
+re-reads and re-writes the whole log, and concurrent threads cannot lose each
+other's entries. Older days written as JSON arrays (YYYY-MM-DD.json) are still
+readable and can be converted once with migrate_legacy_logs().
+
+Long-running processes can start an AuditSink: entries are then queued and a
+single writer thread group-commits them (one write, optional fsync per batch),
+so watcher threads never block on audit I/O.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+LOG_SUFFIX = ".jsonl"
+LEGACY_SUFFIX = ".json"
+
+_write_lock = threading.Lock()
+_sink: "AuditSink | None" = None
+
+
+def log_file_for(logs_dir: Path, day: str | None = None) -> Path:
+    """Return the JSONL file for a day (YYYY-MM-DD), defaulting to today."""
+    day = day or datetime.now().strftime("%Y-%m-%d")
+    return Path(logs_dir) / f"{day}{LOG_SUFFIX}"
+
+
+def encode_entry(entry: dict) -> bytes:
+    """Serialize one entry as a single JSONL line."""
+    return (json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _write_lines(log_file: Path, data: bytes, fsync: bool = False) -> None:
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with _write_lock:
+        fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def append_entry(logs_dir: Path, entry: dict) -> None:
+    """Append one audit entry to today's log (queued if a sink is running)."""
+    line = encode_entry(entry)
+    log_file = log_file_for(logs_dir)
+    sink = _sink
+    if sink is not None and sink.submit(log_file, line):
+        return
+    _write_lines(log_file, line)
+
+
+def iter_log_file(log_file: Path) -> Iterator[dict]:
+    """Yield entries from one log file, JSONL or legacy JSON array."""
+    log_file = Path(log_file)
+    if log_file.suffix == LEGACY_SUFFIX:
+        try:
+            entries = json.loads(log_file.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(entries, list):
+            yield from (e for e in entries if isinstance(e, dict))
+        return
+
+    with open(log_file, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A torn final line (crash mid-write) must not hide the rest
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+
+def daily_log_files(logs_dir: Path) -> list[Path]:
+    """All daily audit files (both formats), oldest day first."""
+    files = [
+        p for p in Path(logs_dir).glob("????-??-??.json*")
+        if p.suffix in (LOG_SUFFIX, LEGACY_SUFFIX)
+    ]
+    return sorted(files, key=lambda p: (p.stem, p.suffix))
+
+
+def read_entries(logs_dir: Path, day: str | None = None) -> Iterator[dict]:
+    """Stream audit entries for one day, or for every day when day is None."""
+    if day is None:
+        files = daily_log_files(logs_dir)
+    else:
+        files = [
+            p for p in (Path(logs_dir) / f"{day}{LEGACY_SUFFIX}", log_file_for(logs_dir, day))
+            if p.exists()
+        ]
+    for log_file in files:
+        yield from iter_log_file(log_file)
+
+
+def migrate_legacy_logs(logs_dir: Path) -> int:
+    """
+    Convert YYYY-MM-DD.json arrays into YYYY-MM-DD.jsonl, one-shot.
+    Migrated entries go before anything already appended for that day.
+    The original file is kept as YYYY-MM-DD.json.migrated.
+    Returns the number of entries migrated.
+    """
+    migrated = 0
+    for legacy in sorted(Path(logs_dir).glob("????-??-??.json")):
+        try:
+            entries = json.loads(legacy.read_text())
+        except ValueError:
+            continue
+        if not isinstance(entries, list):
+            continue
+
+        target = legacy.with_suffix(LOG_SUFFIX)
+        with _write_lock:
+            existing = target.read_bytes() if target.exists() else b""
+            tmp = target.with_suffix(".jsonl.tmp")
+            with open(tmp, "wb") as f:
+                for entry in entries:
+                    if isinstance(entry, dict):
+                        f.write(encode_entry(entry))
+                        migrated += 1
+                f.write(existing)
+            os.replace(tmp, target)
+            legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+    return migrated
+
+
+class AuditLogger:
+    """Enhanced audit logger for Gold Tier comprehensive logging."""
+
+    def __init__(self, logs_dir: Path):
+        self.logs_dir = logs_dir
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    def log(self, action_type: str, actor: str, metadata: dict,
+            result: str, duration_ms: int = 0, error: str = None) -> None:
+        append_entry(self.logs_dir, {
+            "timestamp": datetime.now().isoformat(),
+            "session_id": self.session_id,
+            "action_type": action_type,
+            "actor": actor,
+            "metadata": metadata,
+            "result": result,
+            "duration_ms": duration_ms,
+            "error": error,
+            "status": "error" if error else "success",
+        })
+
+
+class AuditSink:
+    """
+    Process-wide group-commit writer for audit entries.
+    Producers enqueue encoded lines into a bounded queue; one writer thread
+    drains up to batch_size entries at a time and writes each day's file once
+    per batch. A full queue applies backpressure for put_timeout seconds, after
+    which the producer falls back to a direct write so no entry is dropped.
+    """
+
+    def __init__(self, max_queue: int = 10_000, batch_size: int = 500,
+                 fsync: bool = False, put_timeout: float = 1.0, on_flush=None):
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.put_timeout = put_timeout
+        self.on_flush = on_flush  # called on the writer thread after each batch
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="AuditSink", daemon=True)
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._entries = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self) -> "AuditSink":
+        self._thread.start()
+        return self
+
+    def submit(self, log_file: Path, line: bytes) -> bool:
+        """Queue one line; False means the caller should write it directly."""
+        if self._closed.is_set():
+            return False
+        try:
+            self._queue.put((log_file, line), timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            self.logger.warning("Audit queue full — writing entry synchronously")
+            return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting entries, flush everything queued, join the writer."""
+        self._closed.set()
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches": self._batches,
+                "entries": self._entries,
+                "last_flush_ms": round(self._last_flush_ms, 2),
+                "max_flush_ms": round(self._max_flush_ms, 2),
+                "avg_flush_ms": round(self._total_flush_ms / self._batches, 2)
+                if self._batches else 0.0,
+            }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                stopping = True
+            if batch:
+                self._flush(batch)
+        # Drain anything that raced in after the sentinel
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                leftover.append(item)
+        if leftover:
+            self._flush(leftover)
+
+    def _flush(self, batch: list[tuple[Path, bytes]]) -> None:
+        start = time.perf_counter()
+        by_file: dict[Path, list[bytes]] = {}
+        for log_file, line in batch:
+            by_file.setdefault(log_file, []).append(line)
+        for log_file, lines in by_file.items():
+            try:
+                _write_lines(log_file, b"".join(lines), fsync=self.fsync)
+            except OSError as e:
+                self.logger.error(f"Audit flush to {log_file.name} failed: {e}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            self._batches += 1
+            self._entries += len(batch)
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+        if self.on_flush:
+            try:
+                self.on_flush()
+            except Exception as e:
+                self.logger.error(f"Audit on_flush hook failed: {e}")
+
+
+def start_sink(**kwargs) -> AuditSink:
+    """Route every append_entry() in this process through a background sink."""
+    global _sink
+    if _sink is None:
+        _sink = AuditSink(**kwargs).start()
+    return _sink
+
+
+def stop_sink(timeout: float = 10.0) -> None:
+    """Flush and stop the process-wide sink; later writes go direct again."""
+    global _sink
+    sink, _sink = _sink, None
+    if sink is not None:
+        sink.close(timeout)
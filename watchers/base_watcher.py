@@ -2,9 +2,13 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 import logging
+import threading
 import time
 from datetime import datetime
 
+from watchers.audit_log import append_entry
+from watchers.vault_events import get_bus
+
 
 class BaseWatcher(ABC):
     MAX_RETRIES = 3
@@ -46,6 +50,10 @@ class BaseWatcher(ABC):
     def create_action_file(self, item) -> Path:
         pass
 
+    def wake_folders(self) -> list[Path]:
+        """Vault folders whose new .md files end the wait between checks early."""
+        return []
+
     def _check_with_retry(self) -> list:
         """Check for updates with retry logic on failure."""
         for attempt in range(1, self.MAX_RETRIES + 1):
@@ -75,18 +83,13 @@ class BaseWatcher(ABC):
     def _log_error(self, error: str) -> None:
         """Log error to vault logs for audit trail."""
         try:
-            import json
-            log_file = self.logs / f"{datetime.now().strftime('%Y-%m-%d')}.json"
-            entry = {
+            append_entry(self.logs, {
                 "timestamp": datetime.now().isoformat(),
                 "action_type": "watcher_error",
                 "actor": self.__class__.__name__,
                 "error": error,
                 "consecutive_errors": self.consecutive_errors,
-            }
-            logs = json.loads(log_file.read_text()) if log_file.exists() else []
-            logs.append(entry)
-            log_file.write_text(json.dumps(logs, indent=2))
+            })
         except Exception:
             pass
 
@@ -96,6 +99,15 @@ class BaseWatcher(ABC):
         self.logger.info(f'Monitoring interval: {self.check_interval}s')
         self.logger.info(f'Vault path: {self.vault_path}')
 
+        wake = threading.Event()
+
+        def on_event(event) -> None:
+            if event.kind != "deleted":
+                wake.set()
+
+        for folder in self.wake_folders():
+            get_bus().subscribe(folder, "*.md", on_event)
+
         while True:
             try:
                 items = self._check_with_retry()
@@ -119,7 +131,8 @@ class BaseWatcher(ABC):
                     )
                     time.sleep(wait)
                 else:
-                    time.sleep(self.check_interval)
+                    wake.wait(self.check_interval)
+                    wake.clear()
 
             except KeyboardInterrupt:
                 self.logger.info('Shutting down gracefully...')
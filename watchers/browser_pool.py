@@ -0,0 +1,169 @@
+"""
+Browser Pool - Gold Tier
+Process-wide pool of long-lived browser sessions, one per platform.
+
+Every poster and sender used to launch its own Chromium for each post or
+message. The MCP servers also built new poster objects per call, which
+launched even more. The pool keeps one persistent context per platform
+(WhatsApp, LinkedIn, Twitter, Facebook) and hands out its page through a
+lease:
+
+    pool = get_pool()
+    pool.register("linkedin", Config.LINKEDIN_SESSION_PATH, args=..., slow_mo=...)
+    ok = pool.run("linkedin", lambda page: post(page, text))
+
+The lease is a function run on the platform's worker thread, not a page
+object returned to the caller. Playwright's sync objects must stay on the
+thread that created them, so this is what keeps the pool safe to call from
+any orchestrator thread.
+
+Each platform keeps its own Chromium profile directory, because that is where
+its login lives. Chromium runs one process tree per profile, so the pool
+bounds memory in two ways: it closes contexts that have been idle for
+idle_timeout, and when the combined RSS of all sessions passes
+max_total_rss_mb it closes the least recently used idle sessions first.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from watchers.browser_session import BrowserSession
+from watchers.config import Config
+
+logger = logging.getLogger("BrowserPool")
+
+
+class BrowserPool:
+    """Named BrowserSessions with idle eviction and a total memory cap."""
+
+    JANITOR_INTERVAL = 30  # seconds between idle / memory checks
+
+    def __init__(self, idle_timeout: float | None = 600, max_total_rss_mb: float | None = None):
+        self.idle_timeout = idle_timeout
+        self.max_total_rss_mb = max_total_rss_mb
+        self._sessions: dict[str, BrowserSession] = {}
+        self._profiles: dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self._janitor: threading.Thread | None = None
+        self.evictions = 0
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                           #
+    # ------------------------------------------------------------------ #
+
+    def register(self, platform: str, user_data_dir, **session_kwargs) -> BrowserSession:
+        """
+        Session for a platform, created on first registration.
+        Later calls (e.g. a second poster object) get the same session, since
+        Chromium will not open one profile directory twice.
+        """
+        profile = Path(user_data_dir).resolve()
+        with self._lock:
+            session = self._sessions.get(platform)
+            if session is None:
+                owner = self._profiles.get(profile)
+                if owner is not None:
+                    raise ValueError(f"Profile {profile} is already used by '{owner}'")
+                session = BrowserSession(platform, profile, **session_kwargs)
+                self._sessions[platform] = session
+                self._profiles[profile] = platform
+            self._start_janitor()
+            return session
+
+    def run(self, platform: str, fn: Callable, retry: bool = False, timeout: float | None = None):
+        """Lease the platform's page for one unit of work: returns fn(page)."""
+        with self._lock:
+            session = self._sessions.get(platform)
+        if session is None:
+            raise KeyError(f"No browser registered for '{platform}'")
+        result = session.run(fn, retry=retry, timeout=timeout)
+        self._enforce_memory_cap(keep=platform)
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            sessions = dict(self._sessions)
+        per_platform = {name: session.stats() for name, session in sessions.items()}
+        return {
+            "open": sum(1 for s in sessions.values() if s.is_open),
+            "evictions": self.evictions,
+            "total_rss_mb": round(sum(s["rss_mb"] or 0 for s in per_platform.values()), 1),
+            "platforms": per_platform,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            session.close()
+
+    # ------------------------------------------------------------------ #
+    #  Eviction                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _start_janitor(self) -> None:
+        if self._janitor is None or not self._janitor.is_alive():
+            self._janitor = threading.Thread(target=self._janitor_loop, name="BrowserPoolJanitor", daemon=True)
+            self._janitor.start()
+
+    def _janitor_loop(self) -> None:
+        while True:
+            time.sleep(self.JANITOR_INTERVAL)
+            try:
+                self._evict_idle()
+                self._enforce_memory_cap()
+            except Exception as e:
+                logger.warning(f"Browser pool maintenance failed: {e}")
+
+    def _idle_sessions(self, keep: str | None = None) -> list[BrowserSession]:
+        """Open, not-busy sessions, least recently used first."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        idle = [s for s in sessions if s.is_open and not s.busy and s.name != keep]
+        return sorted(idle, key=lambda s: s.last_used)
+
+    def _evict(self, session: BrowserSession, reason: str) -> None:
+        logger.info(f"Closing {session.name} browser ({reason})")
+        session.release()
+        self.evictions += 1
+
+    def _evict_idle(self) -> None:
+        if not self.idle_timeout:
+            return
+        now = time.monotonic()
+        for session in self._idle_sessions():
+            idle_for = now - session.last_used
+            if idle_for > self.idle_timeout:
+                self._evict(session, f"idle {idle_for:.0f}s")
+
+    def _enforce_memory_cap(self, keep: str | None = None) -> None:
+        if not self.max_total_rss_mb:
+            return
+        with self._lock:
+            sessions = list(self._sessions.values())
+        total = sum(s.rss_mb() or 0 for s in sessions if s.is_open)
+        for session in self._idle_sessions(keep=keep):
+            if total <= self.max_total_rss_mb:
+                break
+            rss = session.rss_mb() or 0
+            self._evict(session, f"pool at {total:.0f} MB, cap {self.max_total_rss_mb:.0f} MB")
+            total -= rss
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    """The process-wide pool shared by watchers, HITL and MCP servers."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                idle_timeout=Config.BROWSER_POOL_IDLE_TIMEOUT,
+                max_total_rss_mb=Config.BROWSER_POOL_MAX_RSS_MB,
+            )
+        return _pool
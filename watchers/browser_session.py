@@ -0,0 +1,340 @@
+"""
+Browser Session - Gold Tier
+Long-lived Playwright persistent context, reused across polls.
+
+Launching Chromium and reloading a web app costs tens of seconds, so doing it
+on every poll dominates the cycle. A BrowserSession launches once, keeps the
+page open and logged in, and runs each unit of work as `session.run(fn)`,
+where fn receives the live page.
+
+Playwright's sync API is bound to the thread that started it. Each session
+therefore owns one worker thread, and run() hands the work to that thread
+and waits for the result. Any thread (the watcher loop, HITL sends) can call
+run() safely.
+
+The worker relaunches the browser when it crashes or its page closes. It also
+recycles the browser before a job once the Chromium process tree passes
+max_rss_mb. Every job's duration is recorded as warm (reused browser) or cold
+(launched for this job).
+
+Chromium opens a profile directory in one process only. A launch whose
+profile is held by another process (the orchestrator, when an MCP server
+tries to use it) raises ProfileInUse instead of failing on the lock.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import sync_playwright
+
+_RELEASE = object()  # job marker: close the browser but keep the worker thread
+_PAGE_SIZE_KB = os.sysconf("SC_PAGE_SIZE") // 1024 if hasattr(os, "sysconf") else 4
+
+
+def _proc_tree_rss_mb(marker: str) -> float | None:
+    """
+    Resident memory of every process whose command line contains marker,
+    plus all of their descendants (renderers, GPU, utility processes).
+    Returns None where /proc is unavailable.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children: dict[int, list[int]] = {}
+    rss_pages: dict[int, int] = {}
+    roots: list[int] = []
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        try:
+            stat = (entry / "stat").read_text()
+            statm = (entry / "statm").read_text()
+            cmdline = (entry / "cmdline").read_bytes()
+        except OSError:
+            continue
+        # Fields after the parenthesised command name: state, ppid, ...
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(pid)
+        rss_pages[pid] = int(statm.split()[1])
+        if marker.encode() in cmdline:
+            roots.append(pid)
+
+    seen: set[int] = set()
+    stack = list(roots)
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, []))
+    return sum(rss_pages.get(pid, 0) for pid in seen) * _PAGE_SIZE_KB / 1024
+
+
+class ProfileInUse(RuntimeError):
+    """The Chromium profile is open in another process."""
+
+
+def profile_owner(user_data_dir: Path) -> int | None:
+    """
+    PID of the live Chromium holding user_data_dir's profile lock, or None
+    when the profile is free (no lock, a stale one, or another host's).
+    """
+    try:
+        target = os.readlink(Path(user_data_dir) / "SingletonLock")  # "<hostname>-<pid>"
+    except OSError:
+        return None
+    host, _, pid = target.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit():
+        return None
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        pass  # alive, owned by another user
+    return int(pid)
+
+
+class BrowserSession:
+    """One persistent Chromium context on a dedicated worker thread."""
+
+    def __init__(self, name: str, user_data_dir: Path, on_launch: Callable | None = None,
+                 headless: bool | None = None, args: list[str] | None = None,
+                 user_agent: str | None = None, slow_mo: int = 0,
+                 max_rss_mb: float | None = None, route_policy=None,
+                 logger: logging.Logger | None = None):
+        self.name = name
+        self.user_data_dir = Path(user_data_dir).resolve()
+        self.on_launch = on_launch
+        self.headless = not bool(os.environ.get("DISPLAY")) if headless is None else headless
+        self.args = list(args or [])
+        self.user_agent = user_agent
+        self.slow_mo = slow_mo
+        self.max_rss_mb = max_rss_mb
+        self.route_policy = route_policy  # watchers.route_policy.RoutePolicy, installed per launch
+        self.logger = logger or logging.getLogger(f"BrowserSession.{name}")
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._playwright = None
+        self._context = None
+        self._page = None
+        self._dead = False
+        self._ready = False  # on_launch has completed on the current page
+
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+        self._timings = {"warm": [], "cold": []}
+        self.last_poll_ms = 0.0
+        self.last_poll_kind = ""
+        self.last_used = time.monotonic()
+        self.busy = False
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                           #
+    # ------------------------------------------------------------------ #
+
+    def run(self, fn: Callable, retry: bool = True, timeout: float | None = None):
+        """
+        Run fn(page) on the session's worker thread and return its result.
+        If the browser dies mid-job and retry is True, the job runs once more
+        on a fresh browser (only pass retry=True for idempotent work).
+        """
+        self._ensure_thread()
+        future: Future = Future()
+        self._jobs.put((fn, retry, future))
+        return future.result(timeout=timeout)
+
+    def release(self) -> None:
+        """Close the browser (frees its memory); the next run() relaunches it."""
+        if self._thread and self._thread.is_alive():
+            future: Future = Future()
+            self._jobs.put((_RELEASE, False, future))
+            future.result(timeout=60)
+
+    def close(self) -> None:
+        """Close the browser and stop the worker thread."""
+        if self._thread and self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join(timeout=30)
+
+    @property
+    def is_open(self) -> bool:
+        return self._context is not None
+
+    def mark_stale(self) -> None:
+        """Re-run on_launch (reload the app) before the next job."""
+        self._ready = False
+
+    def stats(self) -> dict:
+        def avg(values):
+            return round(sum(values) / len(values), 1) if values else None
+
+        return {
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "crashes": self.crashes,
+            "warm_polls": len(self._timings["warm"]),
+            "cold_polls": len(self._timings["cold"]),
+            "avg_warm_ms": avg(self._timings["warm"]),
+            "avg_cold_ms": avg(self._timings["cold"]),
+            "last_poll_ms": round(self.last_poll_ms, 1),
+            "rss_mb": self.rss_mb(),
+            "routes": self.route_policy.stats() if self.route_policy else None,
+        }
+
+    def rss_mb(self) -> float | None:
+        if self._context is None:
+            return 0.0
+        rss = _proc_tree_rss_mb(f"--user-data-dir={self.user_data_dir}")
+        return round(rss, 1) if rss is not None else None
+
+    # ------------------------------------------------------------------ #
+    #  Worker thread                                                        #
+    # ------------------------------------------------------------------ #
+
+    def _ensure_thread(self) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name=f"BrowserSession-{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        self._playwright = sync_playwright().start()
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                fn, retry, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if fn is _RELEASE:
+                    self._shutdown_browser()
+                    future.set_result(None)
+                    continue
+                self.busy = True
+                try:
+                    future.set_result(self._run_job(fn, retry))
+                except BaseException as e:
+                    future.set_exception(e)
+                finally:
+                    self.busy = False
+                    self.last_used = time.monotonic()
+        finally:
+            self._shutdown_browser()
+            self._playwright.stop()
+            self._playwright = None
+
+    def _run_job(self, fn: Callable, retry: bool):
+        attempts = 2 if retry else 1
+        for attempt in range(1, attempts + 1):
+            self._check_health()
+            cold = not self._ready
+            start = time.perf_counter()
+            try:
+                if self._page is None:
+                    self._launch()
+                if not self._ready:
+                    # Kept open on failure (e.g. QR login pending) and retried next job
+                    if self.on_launch:
+                        self.on_launch(self._page)
+                    self._ready = True
+                result = fn(self._page)
+            except PlaywrightError as e:
+                if self._page is None:
+                    raise  # launch itself failed; nothing to reconnect to
+                if not self._browser_lost():
+                    raise
+                self.crashes += 1
+                self.logger.warning(f"{self.name} browser lost ({e}); relaunching")
+                self._shutdown_browser()
+                if attempt == attempts:
+                    raise
+                continue
+            self._record(cold, (time.perf_counter() - start) * 1000)
+            return result
+
+    def _record(self, cold: bool, elapsed_ms: float) -> None:
+        kind = "cold" if cold else "warm"
+        timings = self._timings[kind]
+        timings.append(elapsed_ms)
+        del timings[:-100]  # recent window only
+        self.last_poll_ms = elapsed_ms
+        self.last_poll_kind = kind
+
+    # ------------------------------------------------------------------ #
+    #  Browser lifecycle                                                    #
+    # ------------------------------------------------------------------ #
+
+    def _launch(self) -> None:
+        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        owner = profile_owner(self.user_data_dir)
+        if owner is not None:
+            raise ProfileInUse(
+                f"{self.name} profile {self.user_data_dir} is open in another process "
+                f"(pid {owner}); is the orchestrator running?"
+            )
+        self._dead = False
+        self._context = self._playwright.chromium.launch_persistent_context(
+            str(self.user_data_dir),
+            headless=self.headless,
+            args=self.args,
+            user_agent=self.user_agent,
+            slow_mo=self.slow_mo,
+        )
+        self._context.on("close", lambda _: self._mark_dead())
+        if self.route_policy is not None:
+            self.route_policy.install(self._context)
+        self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
+        self._page.on("crash", lambda _: self._mark_dead())
+        self.launches += 1
+        self.logger.info(f"{self.name} browser launched (launch #{self.launches})")
+
+    def _mark_dead(self) -> None:
+        self._dead = True
+
+    def _browser_lost(self) -> bool:
+        return self._dead or self._page is None or self._page.is_closed()
+
+    def _check_health(self) -> None:
+        if self._page is None:
+            return
+        if self._browser_lost():
+            self.crashes += 1
+            self.logger.warning(f"{self.name} browser went away between jobs; relaunching")
+            self._shutdown_browser()
+            return
+        if self.max_rss_mb:
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                self.recycles += 1
+                self.logger.info(
+                    f"{self.name} browser at {rss:.0f} MB (limit {self.max_rss_mb:.0f} MB); recycling"
+                )
+                self._shutdown_browser()
+
+    def _shutdown_browser(self) -> None:
+        context, self._context, self._page = self._context, None, None
+        self._ready = False
+        if context is not None:
+            try:
+                context.close()
+            except Exception:
+                pass  # already gone
+
@@ -0,0 +1,129 @@
+"""
+Browser Waits - Gold Tier
+Readiness-based waits for the Playwright flows, with per-step timings.
+
+The posting and WhatsApp flows used to be paced by fixed sleeps: 20-45 s
+after navigation and 2-3 s after every click. A flow now declares what it is
+waiting for, and a FlowTimer waits exactly that long:
+
+    timer = FlowTimer("linkedin_post", self.logger)
+    start = timer.wait(page, selector("start_post", 'button:has-text("Start a post")'))
+    start.click()
+    timer.wait(page, selector("editor", ".ql-editor"))
+    ...
+    timer.log()   # linkedin_post: start_post=812ms editor=95ms ... total=1.4s
+
+Every step's duration is recorded. Steps slower than slow_ms are logged as
+warnings, so a selector that has drifted shows up in the logs before it
+starts timing out. A step that times out raises StepTimeout, which names
+the step.
+"""
+
+import re
+import time
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+DEFAULT_TIMEOUT = 30.0  # seconds
+SLOW_STEP_MS = 5000
+
+
+class StepTimeout(Exception):
+    """A readiness step did not become true within its timeout."""
+
+
+class Step:
+    """One named readiness condition; `check(page, timeout_ms)` blocks until it holds."""
+
+    def __init__(self, name: str, check, timeout: float):
+        self.name = name
+        self.check = check
+        self.timeout = timeout
+
+
+def selector(name: str, *selectors: str, state: str = "visible",
+             timeout: float = DEFAULT_TIMEOUT) -> Step:
+    """Wait until any of the selectors reaches state; returns its Locator."""
+    def check(page, timeout_ms):
+        locator = page.locator(selectors[0])
+        for alternative in selectors[1:]:
+            locator = locator.or_(page.locator(alternative))
+        locator = locator.first
+        locator.wait_for(state=state, timeout=timeout_ms)
+        return locator
+    return Step(name, check, timeout)
+
+
+def gone(name: str, css: str, timeout: float = DEFAULT_TIMEOUT) -> Step:
+    """Wait until nothing matching css is visible (dialog closed, box removed)."""
+    def check(page, timeout_ms):
+        page.locator(css).first.wait_for(state="hidden", timeout=timeout_ms)
+        return True  # so FlowTimer.optional() can tell done from timed out
+    return Step(name, check, timeout)
+
+
+def url(name: str, pattern: str, timeout: float = DEFAULT_TIMEOUT) -> Step:
+    """Wait until the page URL matches the regex pattern."""
+    regex = re.compile(pattern)
+
+    def check(page, timeout_ms):
+        page.wait_for_url(regex, timeout=timeout_ms)
+        return page.url
+    return Step(name, check, timeout)
+
+
+def network_idle(name: str = "network_idle", timeout: float = DEFAULT_TIMEOUT) -> Step:
+    """Wait until there have been no network connections for 500 ms."""
+    def check(page, timeout_ms):
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    return Step(name, check, timeout)
+
+
+def condition(name: str, js: str, arg=None, timeout: float = DEFAULT_TIMEOUT) -> Step:
+    """Wait until a JS predicate (evaluated in the page) returns truthy."""
+    def check(page, timeout_ms):
+        return page.wait_for_function(js, arg=arg, timeout=timeout_ms).json_value()
+    return Step(name, check, timeout)
+
+
+class FlowTimer:
+    """Runs Steps for one browser flow and records how long each took."""
+
+    def __init__(self, flow: str, logger, slow_ms: float = SLOW_STEP_MS):
+        self.flow = flow
+        self.logger = logger
+        self.slow_ms = slow_ms
+        self.timings: list[tuple[str, float]] = []
+        self._start = time.perf_counter()
+
+    def wait(self, page, step: Step):
+        start = time.perf_counter()
+        try:
+            return step.check(page, step.timeout * 1000)
+        except PlaywrightTimeout as e:
+            raise StepTimeout(
+                f"{self.flow}: '{step.name}' not ready after {step.timeout:.0f}s"
+            ) from e
+        finally:
+            self.record(step.name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Add a timing measured elsewhere (e.g. a text-entry strategy)."""
+        self.timings.append((name, elapsed_ms))
+        if elapsed_ms > self.slow_ms:
+            self.logger.warning(f"{self.flow}: slow step '{name}' took {elapsed_ms:.0f} ms")
+
+    def optional(self, page, step: Step):
+        """Like wait(), but a timeout returns None instead of raising."""
+        try:
+            return self.wait(page, step)
+        except StepTimeout:
+            return None
+
+    def summary(self) -> str:
+        steps = " ".join(f"{name}={ms:.0f}ms" for name, ms in self.timings)
+        total = time.perf_counter() - self._start
+        return f"{self.flow}: {steps} total={total:.1f}s"
+
+    def log(self) -> None:
+        self.logger.info(self.summary())
@@ -17,14 +17,31 @@ class Config:
     VAULT_PATH = Path(os.getenv("VAULT_PATH", "./AI_Employee_Vault"))
     DROP_FOLDER_PATH = os.getenv("DROP_FOLDER_PATH", "./drop_folder")
 
+    # ── Drop folder ingestion ──────────────────────────────────────── #
+    INGEST_MODE = os.getenv("INGEST_MODE", "auto")            # auto (hardlink first) | copy | stream; with INGEST_DEDUP off
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))     # threads copying / hashing dropped files
+    INGEST_DEBOUNCE = float(os.getenv("INGEST_DEBOUNCE", "2"))  # seconds a dropped file must stay unchanged
+    INGEST_DEDUP = os.getenv("INGEST_DEDUP", "true").lower() == "true"  # skip re-drops; store copy is a reflink or a full copy, Needs_Action gets a read-only link
+    EXTRACT_METADATA = os.getenv("EXTRACT_METADATA", "true").lower() == "true"  # page count, CSV summary, ... in _meta.md
+    EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "2"))    # extraction worker processes
+    EXTRACT_TIMEOUT = float(os.getenv("EXTRACT_TIMEOUT", "30")) # seconds per file
+    EXTRACT_MAX_MB = int(os.getenv("EXTRACT_MAX_MB", "1024"))   # address-space limit per worker (0 = none)
+
     # ── Gmail ──────────────────────────────────────────────────────── #
     GMAIL_CREDENTIALS_PATH = os.getenv("GMAIL_CREDENTIALS_PATH", "./credentials.json")
     GMAIL_TOKEN_PATH = os.getenv("GMAIL_TOKEN_PATH", "./watchers/token.pickle")
     CHECK_INTERVAL = int(os.getenv("CHECK_INTERVAL", "120"))
+    GMAIL_INCREMENTAL_SYNC = os.getenv("GMAIL_INCREMENTAL_SYNC", "true").lower() == "true"
+    GMAIL_BATCH_FETCH = os.getenv("GMAIL_BATCH_FETCH", "true").lower() == "true"
+    GMAIL_INCLUDE_BODY = os.getenv("GMAIL_INCLUDE_BODY", "false").lower() == "true"
 
     # ── WhatsApp ───────────────────────────────────────────────────── #
     WHATSAPP_SESSION_PATH = os.getenv("WHATSAPP_SESSION_PATH", "./.whatsapp_session")
     WHATSAPP_CHECK_INTERVAL = int(os.getenv("WHATSAPP_CHECK_INTERVAL", "30"))
+    WHATSAPP_READY_TIMEOUT = int(os.getenv("WHATSAPP_READY_TIMEOUT", "60"))     # seconds for the chat list on cold start
+    WHATSAPP_CAPTURE_MODE = os.getenv("WHATSAPP_CAPTURE_MODE", "push").lower()  # push | poll
+    WHATSAPP_PUSH_WINDOW = float(os.getenv("WHATSAPP_PUSH_WINDOW", "5"))      # max seconds per push drain
+    WHATSAPP_MAX_RSS_MB = float(os.getenv("WHATSAPP_MAX_RSS_MB", "1500"))      # recycle Chromium above this
 
     # ── LinkedIn ───────────────────────────────────────────────────── #
     LINKEDIN_SESSION_PATH = os.getenv("LINKEDIN_SESSION_PATH", "./.linkedin_session")
@@ -38,9 +55,52 @@ class Config:
     FACEBOOK_SESSION_PATH = os.getenv("FACEBOOK_SESSION_PATH", "./.facebook_session")
     FACEBOOK_CHECK_INTERVAL = int(os.getenv("FACEBOOK_CHECK_INTERVAL", "300"))
 
+    # ── Browser pool ──────────────────────────────────────────────── #
+    BROWSER_POOL_IDLE_TIMEOUT = float(os.getenv("BROWSER_POOL_IDLE_TIMEOUT", "600"))  # close idle browsers after (s)
+    BROWSER_SLOW_MO = int(os.getenv("BROWSER_SLOW_MO", "0"))  # ms added to every Playwright action (debugging aid)
+    BROWSER_BLOCK_RESOURCES = [                                 # resource types aborted by the route policy
+        t.strip() for t in os.getenv("BROWSER_BLOCK_RESOURCES", "image,media,font").split(",") if t.strip()
+    ]
+    TEXT_ENTRY_STRATEGIES = [                                   # tried in order before per-key typing
+        t.strip() for t in os.getenv("TEXT_ENTRY_STRATEGIES", "insert_text,paste,fill").split(",") if t.strip()
+    ]
+    BROWSER_POOL_MAX_RSS_MB = float(os.getenv("BROWSER_POOL_MAX_RSS_MB", "3000"))     # all pooled browsers together
+    SESSION_PROBE_TTL = float(os.getenv("SESSION_PROBE_TTL", "300"))        # reuse a cookie-session check for (s)
+    SESSION_PROBE_TIMEOUT = float(os.getenv("SESSION_PROBE_TIMEOUT", "5"))  # HTTP login probe timeout (0 = expiry check only)
+
+    # ── Social fan-out publisher ───────────────────────────────────── #
+    SOCIAL_CHECK_INTERVAL = int(os.getenv("SOCIAL_CHECK_INTERVAL", "60"))
+    SOCIAL_RATE_LIMITS = {                                      # posts per hour per platform (0 = unlimited)
+        name.strip(): int(limit)
+        for name, _, limit in (
+            item.partition("=") for item in
+            os.getenv("SOCIAL_RATE_LIMITS", "linkedin=4,twitter=12,facebook=4").split(",")
+        )
+        if name.strip() and limit.strip().isdigit()
+    }
+    SOCIAL_RATE_BURST = int(os.getenv("SOCIAL_RATE_BURST", "2"))          # posts allowed back to back
+    SOCIAL_RESCAN_INTERVAL = int(os.getenv("SOCIAL_RESCAN_INTERVAL", "300"))  # safety re-check of queue folders (s); changes arrive as vault events
+
+    # ── Vault event bus ───────────────────────────────────────────── #
+    VAULT_EVENTS_MODE = os.getenv("VAULT_EVENTS_MODE", "auto").lower()          # auto (inotify, polling fallback) | polling
+    VAULT_POLL_INTERVAL = float(os.getenv("VAULT_POLL_INTERVAL", "5"))          # folder scan period when polling (s)
+    VAULT_RESCAN_INTERVAL = float(os.getenv("VAULT_RESCAN_INTERVAL", "300"))    # safety rescan for missed events (s)
+
+    # ── Approvals ─────────────────────────────────────────────────── #
+    APPROVAL_WARN_HOURS = float(os.getenv("APPROVAL_WARN_HOURS", "2"))          # warn this long before `expires:` (0 = never)
+    APPROVAL_ON_EXPIRY = os.getenv("APPROVAL_ON_EXPIRY", "reject").lower()      # reject (archive as Done/EXPIRED_*) | warn | ignore
+
     # ── Behaviour ─────────────────────────────────────────────────── #
     DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 
+    # ── Watcher dedup ─────────────────────────────────────────────── #
+    PROCESSED_ID_TTL_DAYS = float(os.getenv("PROCESSED_ID_TTL_DAYS", "90"))
+
+    # ── Audit log sink ────────────────────────────────────────────── #
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+    AUDIT_FSYNC = os.getenv("AUDIT_FSYNC", "false").lower() == "true"
+
     # ── Derived vault sub-paths (convenience) ─────────────────────── #
     NEEDS_ACTION = VAULT_PATH / "Needs_Action"
     DONE         = VAULT_PATH / "Done"
@@ -48,4 +108,5 @@ class Config:
     PLANS        = VAULT_PATH / "Plans"
     PENDING      = VAULT_PATH / "Pending_Approval"
     APPROVED     = VAULT_PATH / "Approved"
-    REJECTED     = VAULT_PATH / "Rejected"
\ No newline at end of file
+    REJECTED     = VAULT_PATH / "Rejected"
+    FILE_STORE   = VAULT_PATH / "Files"
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Content Store - Gold Tier
+Content-addressed store for files dropped into the vault.
+
+The same invoice PDF often gets dropped more than once. Each drop used to
+become a new FILE_* copy, a new _meta.md, a new Plan, and another run of the
+cloud agent. Now every ingested file is kept once, by SHA-256:
+
+    Files/objects/ab/ab12…ef    the content, named by its hash
+    Files/index.jsonl           one line per object: sha256, size, first name,
+                                action file, first seen
+    Files/incoming/             files being ingested (renamed into objects/)
+
+The index is an append-only log. It is loaded into a dict at startup, so a
+hash lookup is O(1) and survives restarts. It also keeps the set of sizes
+seen: a file whose size has never been stored cannot be a duplicate, and it
+is ingested without hashing it first. A duplicate gets no copy, no action
+item and no plan, only a "file_duplicate" audit entry that points at the
+first drop.
+
+An object is always an independent copy of the dropped file (reflink,
+copy_file_range or a streamed copy, never a hardlink), whatever INGEST_MODE
+says. A hardlink would share the inode with the user's file, so editing the
+drop in place would change the object under its hash. Objects are made
+read-only, and the Needs_Action copy is a hardlink to the object, so it is
+read-only too.
+"""
+
+import json
+import os
+import stat
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from watchers.file_ingest import IngestResult, ingest
+
+
+class ContentStore:
+    """sha256 -> stored object, backed by Files/index.jsonl."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.incoming = self.root / "incoming"
+        self.index_path = self.root / "index.jsonl"
+        for folder in [self.objects, self.incoming]:
+            folder.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: dict[str, dict] = {}
+        self._sizes: set[int] = set()
+        self._load()
+        for leftover in self.incoming.iterdir():  # ingests interrupted by a restart
+            leftover.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        with open(self.index_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line after a crash
+                self._index[record["sha256"]] = record
+                self._sizes.add(record["size"])
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects / sha256[:2] / sha256
+
+    def may_contain_size(self, size: int) -> bool:
+        """False means no stored file has this size, so it cannot be a duplicate."""
+        return size in self._sizes
+
+    def lookup(self, sha256: str) -> dict | None:
+        return self._index.get(sha256)
+
+    def ingest(self, source: Path) -> IngestResult:
+        """Copy source into incoming/ and hash it; follow with add() or discard()."""
+        return ingest(source, self.incoming / uuid.uuid4().hex, mode="copy")
+
+    def add(self, result: IngestResult, name: str, action_file: str) -> tuple[dict, bool]:
+        """
+        Move an ingested file into objects/ under its hash.
+        Returns (record, True) for new content, or the existing record and False
+        if another drop stored the same content first (the incoming file is discarded).
+        """
+        with self._lock:
+            existing = self._index.get(result.sha256)
+            if existing is not None:
+                result.dest.unlink(missing_ok=True)
+                return existing, False
+            target = self.object_path(result.sha256)
+            target.parent.mkdir(exist_ok=True)
+            os.replace(result.dest, target)
+            os.chmod(target, stat.S_IMODE(target.stat().st_mode) & ~0o222)
+            record = {
+                "sha256": result.sha256,
+                "size": result.size,
+                "name": name,
+                "action_file": action_file,
+                "first_seen": datetime.now().isoformat(),
+            }
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+            self._index[result.sha256] = record
+            self._sizes.add(result.size)
+            return record, True
+
+    def checkout(self, sha256: str, dest: Path) -> None:
+        """Place a stored object at dest: a (read-only) hardlink when possible, otherwise a copy."""
+        obj = self.object_path(sha256)
+        tmp = dest.with_name(f".{dest.name}.ingest")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(obj, tmp)
+        except OSError:
+            ingest(obj, dest, mode="copy")
+            return
+        os.replace(tmp, dest)
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,184 @@
+"""
+Cookie Session - Gold Tier
+Cached cookies.json loader with a fast session-validity check.
+
+The Twitter and Facebook posters log in by adding the cookies exported to
+.<platform>_session/cookies.json to the browser. They used to re-read and
+convert that file on every post. An expired session was only noticed after
+the home page had loaded and bounced to a login URL, which cost a full
+browser cycle per queued post.
+
+A CookieJar keeps the converted cookies in memory until the file's mtime or
+size changes. check() runs before a post and fails fast in two stages:
+
+    1. expiry   the platform's auth cookies (auth_token, c_user / xs)
+                must be present and not past their expiry timestamp
+    2. probe    one cookie-authenticated HTTP request without redirects;
+                a redirect to a login page or a 401 / 403 means logged out
+
+The result is cached for SESSION_PROBE_TTL seconds and reset whenever the
+cookie file changes. Network errors are inconclusive and let the post go
+ahead, so the browser flow's own login check stays the final word. save()
+writes the browser's cookies back after a successful post, which keeps the
+file (and the cache) current.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from watchers.config import Config
+
+# Per platform: default cookie domain, cookies that carry the login, probe URL
+PLATFORMS = {
+    "twitter": {
+        "domain": ".x.com",
+        "auth_cookies": ("auth_token",),
+        "probe_url": "https://x.com/settings/account",
+    },
+    "facebook": {
+        "domain": ".facebook.com",
+        "auth_cookies": ("c_user", "xs"),
+        "probe_url": "https://www.facebook.com/settings",
+    },
+}
+LOGIN_MARKERS = ("login", "i/flow", "checkpoint")
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+def to_playwright(raw: dict, default_domain: str) -> dict:
+    """One exported cookie (browser-extension or Playwright format) as a Playwright cookie."""
+    cookie = {
+        "name": raw["name"], "value": raw["value"],
+        "domain": raw.get("domain", default_domain),
+        "path": raw.get("path", "/"),
+        "secure": raw.get("secure", False),
+        "httpOnly": raw.get("httpOnly", False),
+    }
+    if raw.get("expirationDate"):
+        cookie["expires"] = int(raw["expirationDate"])
+    elif raw.get("expires") and raw["expires"] > 0:
+        cookie["expires"] = int(raw["expires"])
+    return cookie
+
+
+class CookieJar:
+    """cookies.json for one platform, converted once per file version."""
+
+    def __init__(self, platform: str, session_path, logger):
+        spec = PLATFORMS[platform]
+        self.platform = platform
+        self.cookies_file = Path(session_path) / "cookies.json"
+        self.default_domain = spec["domain"]
+        self.auth_cookies = spec["auth_cookies"]
+        self.probe_url = spec["probe_url"]
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._version: tuple[int, int] | None = None
+        self._cookies: list[dict] = []
+        self._verdict: tuple[float, str | None] | None = None  # (checked_at, failure reason)
+        self.loads = 0
+        self.probes = 0
+
+    # ------------------------------------------------------------------ #
+    #  Loading                                                              #
+    # ------------------------------------------------------------------ #
+
+    def cookies(self) -> list[dict]:
+        """Playwright cookies, re-read only when cookies.json has changed."""
+        try:
+            st = self.cookies_file.stat()
+        except FileNotFoundError:
+            return []
+        version = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if version != self._version:
+                with open(self.cookies_file) as f:
+                    data = json.load(f)
+                self._cookies = [to_playwright(c, self.default_domain) for c in data]
+                self._version = version
+                self._verdict = None
+                self.loads += 1
+            return self._cookies
+
+    def save(self, context) -> None:
+        """Write the browser context's current cookies back to cookies.json."""
+        cookies = context.cookies()
+        tmp = self.cookies_file.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(cookies, f, indent=2)
+        os.replace(tmp, self.cookies_file)
+        st = self.cookies_file.stat()
+        with self._lock:
+            self._cookies = [to_playwright(c, self.default_domain) for c in cookies]
+            self._version = (st.st_mtime_ns, st.st_size)
+            self._verdict = (time.time(), None)  # just used to post, so it is valid
+        self.logger.info(f"Session saved: {len(cookies)} cookies")
+
+    # ------------------------------------------------------------------ #
+    #  Validity                                                             #
+    # ------------------------------------------------------------------ #
+
+    def check(self) -> str | None:
+        """None if the session looks usable, otherwise why it is not."""
+        cookies = self.cookies()
+        with self._lock:
+            if self._verdict and time.time() - self._verdict[0] < Config.SESSION_PROBE_TTL:
+                return self._verdict[1]
+        reason = self._expired(cookies) or self._probe(cookies)
+        with self._lock:
+            self._verdict = (time.time(), reason)
+        return reason
+
+    def mark_expired(self, reason: str) -> None:
+        """Record a logged-out session seen by the browser (kept until cookies.json changes or the TTL passes)."""
+        with self._lock:
+            self._verdict = (time.time(), reason)
+
+    def _expired(self, cookies: list[dict]) -> str | None:
+        if not cookies:
+            return f"no cookies in {self.cookies_file}"
+        now = time.time()
+        by_name = {c["name"]: c for c in cookies}
+        for name in self.auth_cookies:
+            cookie = by_name.get(name)
+            if cookie is None:
+                return f"auth cookie '{name}' missing"
+            if cookie.get("expires") and cookie["expires"] < now:
+                return f"auth cookie '{name}' expired"
+        return None
+
+    def _probe(self, cookies: list[dict]) -> str | None:
+        if not Config.SESSION_PROBE_TIMEOUT:
+            return None
+        self.probes += 1
+        jar = httpx.Cookies()
+        for c in cookies:
+            jar.set(c["name"], c["value"], domain=c["domain"], path=c["path"])
+        try:
+            response = httpx.get(
+                self.probe_url, cookies=jar, follow_redirects=False,
+                headers={"User-Agent": USER_AGENT}, timeout=Config.SESSION_PROBE_TIMEOUT,
+            )
+        except httpx.HTTPError as e:
+            self.logger.debug(f"{self.platform} session probe inconclusive: {e}")
+            return None
+        location = response.headers.get("location", "").lower()
+        if response.status_code in (401, 403) or (
+            response.is_redirect and any(marker in location for marker in LOGIN_MARKERS)
+        ):
+            return f"probe of {self.probe_url} answered {response.status_code} {location}".strip()
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            verdict = self._verdict
+        return {
+            "loads": self.loads,
+            "probes": self.probes,
+            "valid": None if verdict is None else verdict[1] is None,
+        }
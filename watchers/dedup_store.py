@@ -0,0 +1,387 @@
+"""
+Processed-ID Store - Gold Tier
+Durable "have I already handled this?" set shared by all watchers.
+
+Layout under the vault Logs folder, per store name:
+    <name>.ids          append-only log, one "<id>\t<unix_ts>" line per processed ID
+    <name>.bloom        Bloom filter snapshot + the log offset it covers
+    <name>.ids.sqlite3  exact index over the log (id -> ts), tailed by offset
+
+The log is the record; the other two are derived from it and are rebuilt if
+deleted. Startup reads only the fixed-size Bloom snapshot and replays the
+short log tail written after it, so it costs the same with 100 or 10 million
+IDs. Membership checks hit the Bloom filter first; a "maybe" (an ID we have
+probably seen) is confirmed with one primary-key lookup in the index, so the
+set of IDs is never held in memory. Compaction drops IDs older than the TTL,
+rewrites the log and grows the filter; it runs on a background thread, not
+in the watchers' add() calls.
+
+Open stores with get_store(). The in-memory filter and the lock belong to one
+instance, so two instances on the same files would miss each other's IDs and
+one could replace the log while the other appends to it.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+_MAGIC = b"PIDB1\0\0\0"
+# magic, m_bits, k, log_offset, count, capacity, compacted_at
+_HEADER = struct.Struct("<8sQIQQQd")
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ids (
+    id TEXT PRIMARY KEY,
+    ts REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_ids_ts ON ids(ts);
+CREATE TABLE IF NOT EXISTS log_state (
+    k      INTEGER PRIMARY KEY CHECK (k = 0),
+    offset INTEGER NOT NULL,
+    ino    INTEGER NOT NULL
+);
+"""
+
+logger = logging.getLogger("ProcessedIdStore")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using blake2b double hashing."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001,
+                 m_bits: int | None = None, k: int | None = None, bits: bytes | None = None):
+        if m_bits is None:
+            import math
+            m_bits = max(1024, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+            k = max(1, round(m_bits / capacity * math.log(2)))
+        self.m_bits = m_bits
+        self.k = k
+        self.bits = bytearray(bits) if bits is not None else bytearray((m_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.k):
+            yield (h1 + i * h2) % self.m_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class ProcessedIdStore:
+    """
+    Append-log + Bloom-filter set of processed IDs with TTL expiry.
+    Thread-safe; `id in store` and `store.add(id)` are the whole API watchers need.
+    """
+
+    SNAPSHOT_EVERY = 1_000       # appends between Bloom snapshots (bounds startup replay)
+    COMPACT_INTERVAL = 86_400    # seconds between TTL compactions
+
+    def __init__(self, directory: Path, name: str, ttl_days: float | None = 90,
+                 capacity: int = 100_000, error_rate: float = 0.001):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / f"{name}.ids"
+        self.bloom_path = self.directory / f"{name}.bloom"
+        self.index_path = self.directory / f"{name}.ids.sqlite3"
+        self._key = (self.directory.resolve(), name)
+        self.ttl_seconds = ttl_days * 86400 if ttl_days else None
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compact_wake = threading.Event()
+        self._count = 0
+        self._since_snapshot = 0
+        self._compacted_at = time.time()  # a snapshot's value replaces this
+        self._closed = False
+        self._index = self._open_index()
+        self._sync_index()
+        self._bloom = self._load_bloom()
+        self._compactor = threading.Thread(
+            target=self._compact_loop, name=f"{name}-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                           #
+    # ------------------------------------------------------------------ #
+
+    def __contains__(self, item_id: str) -> bool:
+        with self._lock:
+            if item_id not in self._bloom:
+                return False
+            row = self._index.execute("SELECT ts FROM ids WHERE id = ?", (item_id,)).fetchone()
+            return row is not None and not self._expired(row[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, item_id: str) -> None:
+        self.add_many([item_id])
+
+    def add_many(self, item_ids: Iterable[str], timestamp: float | None = None) -> None:
+        ts = time.time() if timestamp is None else timestamp
+        lines = []
+        with self._lock:
+            for item_id in item_ids:
+                item_id = item_id.strip()
+                if not item_id:
+                    continue
+                lines.append(f"{item_id}\t{ts:.0f}\n")
+                self._bloom.add(item_id)
+            if not lines:
+                return
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+            self._sync_index()
+            self._count += len(lines)
+            self._since_snapshot += len(lines)
+            if self._since_snapshot >= self.SNAPSHOT_EVERY:
+                self._save_bloom()
+            if self._count > self.capacity:
+                self._compact_wake.set()  # grow the filter on the compactor thread
+
+    def compact(self) -> int:
+        """Drop expired IDs, rewrite the log and rebuild the filter. Returns IDs kept."""
+        with self._compact_lock:
+            if self._closed or not self.log_path.exists():
+                return 0  # closed, or nothing written yet
+            return self._compact()
+
+    def import_legacy(self, legacy_file: Path, ids: Iterable[str]) -> int:
+        """One-shot import of an old processed-ID file, renamed to *.migrated after."""
+        ids = list(ids)
+        if ids:
+            self.add_many(ids)
+        legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+        return len(ids)
+
+    def close(self) -> None:
+        with _stores_lock:
+            if _stores.get(self._key) is self:
+                del _stores[self._key]
+        with self._compact_lock, self._lock:
+            self._closed = True
+            self._compact_wake.set()
+            self._index.close()
+
+    # ------------------------------------------------------------------ #
+    #  Persistence                                                          #
+    # ------------------------------------------------------------------ #
+
+    def _expired(self, ts: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - ts > self.ttl_seconds
+
+    def _iter_log(self, offset: int = 0, end: int | None = None):
+        """(id, ts) for the whole lines in the log from offset (up to end)."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                offset += len(raw)
+                if not raw.endswith(b"\n") or (end is not None and offset > end):
+                    return  # half-written tail
+                item_id, _, ts = raw.decode("utf-8", "replace").rstrip("\n").partition("\t")
+                if not item_id:
+                    continue
+                try:
+                    yield item_id, float(ts) if ts else time.time()
+                except ValueError:
+                    yield item_id, time.time()
+
+    def _open_index(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_INDEX_SCHEMA)
+        return conn
+
+    def _sync_index(self) -> None:
+        """Bring the exact index up to the end of the log (lock held)."""
+        try:
+            st = self.log_path.stat()
+        except FileNotFoundError:
+            st = None
+        state = self._index.execute("SELECT offset, ino FROM log_state").fetchone()
+        offset, ino = state if state else (0, None)
+        size = st.st_size if st else 0
+        with self._index:
+            if st is None or st.st_ino != ino or size < offset:
+                # New log, or replaced outside this store: index it from the start
+                self._index.execute("DELETE FROM ids")
+                offset = 0
+            if size > offset:
+                end = _whole_lines_end(self.log_path, offset, size)
+                self._index.executemany(
+                    "INSERT OR REPLACE INTO ids (id, ts) VALUES (?, ?)", self._iter_log(offset, end)
+                )
+                offset = end
+            self._index.execute(
+                "INSERT OR REPLACE INTO log_state (k, offset, ino) VALUES (0, ?, ?)",
+                (offset, st.st_ino if st else 0),
+            )
+
+    def _load_bloom(self) -> BloomFilter:
+        log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        try:
+            raw = self.bloom_path.read_bytes()
+            magic, m_bits, k, offset, count, capacity, compacted_at = _HEADER.unpack_from(raw)
+            if magic != _MAGIC or offset > log_size:
+                raise ValueError("stale snapshot")
+            bloom = BloomFilter(m_bits=m_bits, k=k, bits=raw[_HEADER.size:])
+            self.capacity = max(self.capacity, capacity)
+            self._compacted_at = compacted_at
+        except (OSError, ValueError, struct.error):
+            # No usable snapshot (first run, or log rewritten elsewhere) — rebuild once
+            bloom, offset, count = None, 0, 0
+
+        if bloom is None:
+            self._count = self._index.execute("SELECT COUNT(*) FROM ids").fetchone()[0]
+            while self._count * 2 > self.capacity:
+                self.capacity *= 2
+            self._bloom = self._new_bloom(self.capacity)
+            for (item_id,) in self._index.execute("SELECT id FROM ids"):
+                self._bloom.add(item_id)
+            self._save_bloom()
+            return self._bloom
+
+        # Replay only what was appended after the snapshot
+        self._count = count
+        for item_id, _ in self._iter_log(offset):
+            bloom.add(item_id)
+            self._count += 1
+            self._since_snapshot += 1
+        return bloom
+
+    def _new_bloom(self, capacity: int) -> BloomFilter:
+        return BloomFilter(capacity=capacity, error_rate=self.error_rate)
+
+    def _save_bloom(self) -> None:
+        offset = self._index.execute("SELECT offset FROM log_state").fetchone()[0]
+        tmp = self.bloom_path.with_suffix(".bloom.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, self._bloom.m_bits, self._bloom.k, offset,
+                self._count, self.capacity, self._compacted_at,
+            ))
+            f.write(self._bloom.bits)
+        os.replace(tmp, self.bloom_path)
+        self._since_snapshot = 0
+
+    # ------------------------------------------------------------------ #
+    #  Compaction                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _compact_loop(self) -> None:
+        while True:
+            timeout = None
+            if self.ttl_seconds:
+                timeout = max(0.0, self._compacted_at + self.COMPACT_INTERVAL - time.time())
+            self._compact_wake.wait(timeout)
+            self._compact_wake.clear()
+            if self._closed:
+                return
+            try:
+                self.compact()
+            except Exception as e:
+                logger.warning(f"Compacting {self.log_path.name} failed: {e}")
+
+    def _compact(self) -> int:
+        """
+        Rewrite the log with the live IDs. The bulk of the work reads a
+        snapshot of the index through its own connection, so add() and
+        `in` keep running; only the swap and the last few IDs appended
+        meanwhile happen under the lock.
+        """
+        cutoff = time.time() - self.ttl_seconds if self.ttl_seconds else float("-inf")
+        reader = sqlite3.connect(self.index_path, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._sync_index()
+            covered = self._index.execute("SELECT offset FROM log_state").fetchone()[0]
+            reader.execute("BEGIN")
+            reader.execute("SELECT offset FROM log_state").fetchone()  # pins the snapshot at `covered`
+            capacity = self.capacity
+            while self._count * 2 > capacity:
+                capacity *= 2
+
+        bloom = self._new_bloom(capacity)
+        kept = 0
+        tmp = self.log_path.with_suffix(".ids.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for item_id, ts in reader.execute("SELECT id, ts FROM ids WHERE ts >= ?", (cutoff,)):
+                    bloom.add(item_id)
+                    f.write(f"{item_id}\t{ts:.0f}\n")
+                    kept += 1
+        finally:
+            reader.execute("COMMIT")
+            reader.close()
+
+        # IDs appended meanwhile: copy most of them before taking the lock
+        covered, copied = self._copy_tail(tmp, bloom, covered)
+        with self._lock:
+            covered, last = self._copy_tail(tmp, bloom, covered)
+            os.replace(tmp, self.log_path)
+            with self._index:
+                self._index.execute("DELETE FROM ids WHERE ts < ?", (cutoff,))
+                st = self.log_path.stat()
+                self._index.execute(
+                    "INSERT OR REPLACE INTO log_state (k, offset, ino) VALUES (0, ?, ?)",
+                    (st.st_size, st.st_ino),
+                )
+            self.capacity = capacity
+            self._bloom = bloom
+            self._count = kept + copied + last
+            self._compacted_at = time.time()
+            self._save_bloom()
+        return self._count
+
+    def _copy_tail(self, tmp: Path, bloom: BloomFilter, offset: int) -> tuple[int, int]:
+        """Append the log's whole lines from offset to tmp. Returns (new offset, lines)."""
+        end = _whole_lines_end(self.log_path, offset, self.log_path.stat().st_size)
+        copied = 0
+        with open(tmp, "a", encoding="utf-8") as f:
+            for item_id, ts in self._iter_log(offset, end):
+                bloom.add(item_id)
+                f.write(f"{item_id}\t{ts:.0f}\n")
+                copied += 1
+        return end, copied
+
+_stores: dict[tuple[Path, str], ProcessedIdStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(directory: Path, name: str, **kwargs) -> ProcessedIdStore:
+    """The process-wide store for (directory, name); opened on first use."""
+    key = (Path(directory).resolve(), name)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = ProcessedIdStore(directory, name, **kwargs)
+        return store
+
+
+def _whole_lines_end(path: Path, offset: int, size: int) -> int:
+    """Offset just past the last complete line in path[offset:size]."""
+    with open(path, "rb") as f:
+        pos = size
+        while pos > offset:
+            start = max(offset, pos - 4096)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            pos = start
+    return offset
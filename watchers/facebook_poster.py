@@ -3,16 +3,17 @@ Facebook Poster - Gold Tier
 Auto-posts to Facebook using Playwright.
 """
 
-import json
-import os
-import time
 from datetime import datetime
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
 from watchers.base_watcher import BaseWatcher
+from watchers.browser_pool import get_pool
+from watchers.browser_waits import FlowTimer, gone, selector
 from watchers.config import Config
+from watchers.cookie_session import CookieJar
+from watchers.route_policy import policy_for
+from watchers.text_entry import enter_text
+from watchers.vault_meta import read_body
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 SESSION_PATH = Config.FACEBOOK_SESSION_PATH
@@ -37,6 +38,19 @@ class FacebookPoster(BaseWatcher):
         self.queue_path.mkdir(parents=True, exist_ok=True)
         self.posted_path.mkdir(parents=True, exist_ok=True)
         self.session_path.mkdir(parents=True, exist_ok=True)
+        self.cookie_jar = CookieJar("facebook", self.session_path, self.logger)
+        get_pool().register(
+            "facebook",
+            self.session_path,
+            args=BROWSER_ARGS,
+            user_agent=USER_AGENT,
+            slow_mo=Config.BROWSER_SLOW_MO,
+            route_policy=policy_for("facebook"),
+            logger=self.logger,
+        )
+
+    def wake_folders(self) -> list[Path]:
+        return [self.queue_path]
 
     def check_for_updates(self) -> list:
         posts = list(self.queue_path.glob("*.md"))
@@ -44,135 +58,111 @@ class FacebookPoster(BaseWatcher):
         return posts
 
     def create_action_file(self, item: Path) -> Path:
-        text = self._extract_post_text(item)
+        text = read_body(item)
 
         if Config.DRY_RUN:
             self.logger.info(f"[DRY RUN] Would post to Facebook: {text[:100]}...")
             return self._archive_post(item, "dry_run")
 
-        success = self._post_to_facebook(text)
+        success = self.publish(text)
         status = "posted" if success else "failed"
         return self._archive_post(item, status)
 
+    def publish(self, text: str) -> bool:
+        """Post text now (used by the queue above and by SocialPublisher)."""
+        return self._post_to_facebook(text)
+
     def _load_cookies(self) -> list:
-        cookies_file = self.session_path / "cookies.json"
-        if not cookies_file.exists():
+        if not self.cookie_jar.cookies_file.exists():
             self.logger.error("cookies.json not found in .facebook_session/")
             return []
-        with open(cookies_file) as f:
-            cookies_data = json.load(f)
-        pw_cookies = []
-        for c in cookies_data:
-            cookie = {
-                "name": c["name"], "value": c["value"],
-                "domain": c["domain"], "path": c.get("path", "/"),
-                "secure": c.get("secure", False), "httpOnly": c.get("httpOnly", False),
-            }
-            if c.get("expirationDate"):
-                cookie["expires"] = int(c["expirationDate"])
-            pw_cookies.append(cookie)
-        return pw_cookies
+        return self.cookie_jar.cookies()
+
+    def _save_cookies(self, browser) -> None:
+        self.cookie_jar.save(browser)
 
     def _post_to_facebook(self, text: str) -> bool:
         try:
             pw_cookies = self._load_cookies()
             if not pw_cookies:
                 return False
+            expired = self.cookie_jar.check()
+            if expired:
+                self.logger.error(f"Facebook session expired ({expired})")
+                return False
+            return get_pool().run("facebook", lambda page: self._publish(page, text, pw_cookies))
+        except Exception as e:
+            self.logger.error(f"Facebook post error: {e}", exc_info=True)
+            return False
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    str(self.session_path),
-                    headless=not bool(os.environ.get("DISPLAY")),  # ← CHANGE
-                    args=BROWSER_ARGS,
-                    user_agent=USER_AGENT,
-                    slow_mo=80,                                     # ← ADD
-                )
-                browser.add_cookies(pw_cookies)
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                page.goto("https://www.facebook.com", wait_until="domcontentloaded")
-                self.logger.info("Waiting for Facebook to load...")
-                time.sleep(20)
-
-                title = page.title()
-                self.logger.info(f"Page title: {title}")
-
-                if "login" in page.url.lower():
-                    self.logger.error("Facebook session expired!")
-                    browser.close()
-                    return False
+    def _publish(self, page, text: str, pw_cookies: list) -> bool:
+        """Runs on the pooled Facebook browser's thread."""
+        timer = FlowTimer("facebook_post", self.logger)
+        try:
+            page.context.add_cookies(pw_cookies)
+            page.goto("https://www.facebook.com", wait_until="domcontentloaded")
+            self.logger.info("Waiting for Facebook to load...")
+
+            # "What's on your mind" box dhundo
+            post_box = timer.optional(page, selector(
+                "post_box",
+                '[aria-label="What\'s on your mind?"]',
+                'div[role="button"]:has-text("What\'s on your mind")',
+                '[data-testid="status-attachment-mentions-input"]',
+            ))
+            self.logger.info(f"Page title: {page.title()}")
+
+            if "login" in page.url.lower():
+                self.logger.error("Facebook session expired!")
+                self.cookie_jar.mark_expired(f"redirected to {page.url}")
+                return False
 
-                # "What's on your mind" box dhundo
-                post_box = None
-                for selector in [
-                    '[aria-label="What\'s on your mind?"]',
-                    'div[role="button"]:has-text("What\'s on your mind")',
-                    '[data-testid="status-attachment-mentions-input"]',
-                ]:
-                    post_box = page.query_selector(selector)
-                    if post_box:
-                        self.logger.info(f"Post box found: {selector}")
-                        break
-
-                if not post_box:
-                    self.logger.error("Facebook post box not found!")
-                    page.screenshot(path="/tmp/fb_debug.png")
-                    browser.close()
-                    return False
+            if not post_box:
+                self.logger.error("Facebook post box not found!")
+                page.screenshot(path="/tmp/fb_debug.png")
+                return False
 
-                post_box.click()
-                time.sleep(3)
+            post_box.click()
 
-                text_area = page.query_selector('[contenteditable="true"][role="textbox"]')
-                if text_area:
-                    text_area.fill(text)
-                    time.sleep(2)
+            text_area = timer.optional(page, selector(
+                "text_area", '[contenteditable="true"][role="textbox"]', timeout=10
+            ))
+            if text_area and not enter_text(page, text_area, text, self.logger, timer):
+                self.logger.error("Could not enter text in Facebook composer")
+                return False
 
-                # Step 1: Next button — JS click to bypass overlay intercept
+            # Step 1: Next button — JS click to bypass overlay intercept
+            try:
+                timer.wait(page, selector("next_button", '[aria-label="Next"]', state="attached", timeout=10))
+                page.evaluate("""
+                    document.querySelector('[aria-label="Next"]').click()
+                """)
+                self.logger.info("Clicked Next - Post settings page...")
+            except Exception as e:
+                self.logger.error(f"Next button not found: {e}")
+                return False
+
+            # Step 2: Post button — JS click
+            try:
+                timer.wait(page, selector("post_button", '[aria-label="Post"]', state="attached", timeout=10))
+                page.evaluate("""
+                    document.querySelector('[aria-label="Post"]').click()
+                """)
+            except Exception:
+                # Fallback text-based
                 try:
-                    page.wait_for_selector('[aria-label="Next"]', timeout=10000)
-                    page.evaluate("""
-                        document.querySelector('[aria-label="Next"]').click()
-                    """)
-                    time.sleep(3)
-                    self.logger.info("Clicked Next - Post settings page...")
+                    page.locator('div[role="button"]:has-text("Post")').last.click()
                 except Exception as e:
-                    self.logger.error(f"Next button not found: {e}")
-                    browser.close()
+                    self.logger.error(f"Post button not found: {e}")
                     return False
 
-                # Step 2: Post button — JS click
-                try:
-                    page.wait_for_selector('[aria-label="Post"]', timeout=10000)
-                    page.evaluate("""
-                        document.querySelector('[aria-label="Post"]').click()
-                    """)
-                except Exception:
-                    # Fallback text-based
-                    try:
-                        page.locator('div[role="button"]:has-text("Post")').last.click()
-                    except Exception as e:
-                        self.logger.error(f"Post button not found: {e}")
-                        browser.close()
-                        return False
-                time.sleep(5)
-                self.logger.info("Posted to Facebook successfully!")
-                browser.close()
-                return True
-
-        except Exception as e:
-            self.logger.error(f"Facebook post error: {e}", exc_info=True)
-            return False
-
-    def _extract_post_text(self, post_file: Path) -> str:
-        raw = post_file.read_text()
-        lines = raw.splitlines()
-        if lines and lines[0].strip() == "---":
-            try:
-                end = lines.index("---", 1)
-                lines = lines[end + 1:]
-            except ValueError:
-                pass
-        return "\n".join(lines).strip()
+            # The composer dialog closes once Facebook has accepted the post
+            timer.optional(page, gone("composer_closed", '[aria-label="Post"]', timeout=15))
+            self._save_cookies(page.context)
+            self.logger.info("Posted to Facebook successfully!")
+            return True
+        finally:
+            timer.log()
 
     def _archive_post(self, post_file: Path, status: str) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
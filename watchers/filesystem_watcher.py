@@ -2,55 +2,245 @@
 Filesystem Watcher - Silver Tier
 Watches a local drop folder for new files and creates action items.
 Uses watchdog library for efficient OS-level file system events.
+Create / modify / move events are coalesced per file (EventCoalescer), so a
+file is ingested once, after it has stopped changing for INGEST_DEBOUNCE s.
+Content already in the vault's content store (Files/) is not ingested again.
 """
 
-import shutil
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from watchers.audit_log import append_entry
 from watchers.config import Config
+from watchers.content_store import ContentStore
+from watchers.file_ingest import IngestResult, hash_file, ingest
+from watchers.metadata_extract import MetadataExtractor, frontmatter_lines
+
+
+class EventCoalescer:
+    """
+    Turns a stream of create / modify / move events into one call per
+    finished file.
+
+    Every event for a path pushes its deadline debounce seconds out. When the
+    deadline passes, the file is stat'ed. If its (size, mtime) is unchanged
+    since the last event it counts as complete and emit(path) is called.
+    Otherwise the deadline is pushed out again. A file whose (size, mtime)
+    matches what was last emitted is not emitted again. This covers attribute
+    events such as the link count change from a hardlink ingest, or a touch
+    without a write.
+    """
+
+    def __init__(self, emit, debounce: float, logger):
+        self.emit = emit
+        self.debounce = debounce
+        self.logger = logger
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, Path]] = []          # (deadline, seq, path)
+        self._pending: dict[Path, tuple[float, tuple]] = {}    # path -> (deadline, signature)
+        self._emitted: dict[Path, tuple] = {}
+        self._seq = 0
+        self._closed = False
+        self.events = 0
+        self.emits = 0
+        self._thread = threading.Thread(target=self._loop, name="DropFolderCoalescer", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _signature(path: Path) -> tuple | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def touch(self, path: Path) -> None:
+        """Record an event for path; it is emitted once it has been quiet for debounce seconds."""
+        signature = self._signature(path)
+        with self._cond:
+            self.events += 1
+            self._arm(path, signature)
+            self._cond.notify()
+
+    def _arm(self, path: Path, signature: tuple | None) -> None:
+        """Caller holds the lock."""
+        deadline = time.monotonic() + self.debounce
+        self._pending[path] = (deadline, signature)
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, path))
+
+    def forget(self, path: Path) -> None:
+        """Drop path (deleted or moved out); a stale heap entry is skipped when it comes due."""
+        with self._cond:
+            self._pending.pop(path, None)
+            self._emitted.pop(path, None)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                if self._closed:
+                    return
+                deadline, _, path = heapq.heappop(self._heap)
+                entry = self._pending.get(path)
+                if entry is None or entry[0] != deadline:
+                    continue  # superseded by a later event, or forgotten
+                signature = self._signature(path)
+                if signature is None:
+                    del self._pending[path]
+                    continue
+                if signature != entry[1]:
+                    # Still being written: wait another quiet period
+                    self._arm(path, signature)
+                    continue
+                del self._pending[path]
+                if self._emitted.get(path) == signature:
+                    continue
+                self._emitted[path] = signature
+                self.emits += 1
+            try:
+                self.emit(path)
+            except Exception as e:
+                self.logger.error(f"Drop folder handler failed for {path.name}: {e}", exc_info=True)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"events": self.events, "emits": self.emits, "pending": len(self._pending)}
 
 
 class DropFolderHandler(FileSystemEventHandler):
     """Handles new file events in the monitored drop folder."""
 
-    def __init__(self, needs_action: Path, logs_path: Path, logger):
+    def __init__(self, needs_action: Path, logs_path: Path, logger, store: ContentStore | None = None,
+                 extractor: MetadataExtractor | None = None):
         self.needs_action = needs_action
+        self.logs = logs_path
         self.logger = logger
+        self.store = store
+        self.extractor = extractor
+        # Copies and hashing run here, so the observer thread only queues work
+        self.executor = ThreadPoolExecutor(max_workers=Config.INGEST_WORKERS, thread_name_prefix="Ingest")
+        self.coalescer = EventCoalescer(self._submit, Config.INGEST_DEBOUNCE, logger)
+
+    @staticmethod
+    def _wanted(path: Path) -> bool:
+        # Skip hidden/temp files (e.g. a browser's .part until it is renamed)
+        return not (path.name.startswith(".") or path.suffix in {".tmp", ".part"})
 
     def on_created(self, event):
         if event.is_directory:
             return
-
         source = Path(event.src_path)
+        if self._wanted(source):
+            self.coalescer.touch(source)
+
+    def on_modified(self, event):
+        self.on_created(event)
 
-        # Skip hidden/temp files
-        if source.name.startswith(".") or source.suffix in {".tmp", ".part"}:
+    def on_moved(self, event):
+        if event.is_directory:
             return
+        self.coalescer.forget(Path(event.src_path))
+        dest = Path(event.dest_path)
+        if self._wanted(dest):
+            self.coalescer.touch(dest)
 
-        dest = self.needs_action / f"FILE_{source.name}"
-        shutil.copy2(source, dest)
-        self._create_metadata(source, dest)
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.coalescer.forget(Path(event.src_path))
+
+    def close(self) -> None:
+        self.coalescer.close()
+        self.executor.shutdown(wait=True)
+        if self.extractor is not None:
+            self.extractor.close()
+
+    def _submit(self, source: Path) -> None:
         self.logger.info(f"Detected new file: {source.name}")
+        self.executor.submit(self._ingest, source)
+
+    def _ingest(self, source: Path) -> None:
+        dest = self.needs_action / f"FILE_{source.name}"
+        try:
+            if self.store is None:
+                result = ingest(source, dest)
+            else:
+                result = self._ingest_deduped(source, dest)
+                if result is None:
+                    return
+            self._create_metadata(source, result)
+        except Exception as e:
+            self.logger.error(f"Ingest of {source.name} failed: {e}", exc_info=True)
+            return
+        self.logger.info(
+            f"Ingested {source.name} via {result.method}: "
+            f"{result.size:,} bytes in {result.elapsed_ms:.0f} ms"
+        )
+
+    def _ingest_deduped(self, source: Path, dest: Path) -> IngestResult | None:
+        """Ingest through the content store; None when source is a duplicate."""
+        # Only hash up front when a stored file has the same size
+        if self.store.may_contain_size(source.stat().st_size):
+            original = self.store.lookup(hash_file(source))
+            if original is not None:
+                self._record_duplicate(source, original)
+                return None
+        result = self.store.ingest(source)
+        original, created = self.store.add(result, source.name, dest.name)
+        if not created:
+            self._record_duplicate(source, original)
+            return None
+        self.store.checkout(result.sha256, dest)
+        return replace(result, dest=dest)
+
+    def _record_duplicate(self, source: Path, original: dict) -> None:
+        append_entry(self.logs, {
+            "timestamp": datetime.now().isoformat(),
+            "action_type": "file_duplicate",
+            "actor": "FilesystemWatcher",
+            "target": source.name,
+            "duplicate_of": original["action_file"],
+            "sha256": original["sha256"],
+            "result": "skipped",
+        })
+        self.logger.info(f"{source.name} is a duplicate of {original['action_file']} "
+                         f"(first dropped {original['first_seen']}); skipped")
 
-    def _create_metadata(self, source: Path, dest: Path) -> None:
+    def _create_metadata(self, source: Path, result: IngestResult) -> None:
         """Create companion .md file describing the dropped file."""
         meta_path = self.needs_action / f"FILE_{source.stem}_meta.md"
+        # Blocks this ingest thread (not the observer) while a worker process reads the file
+        extracted = self.extractor.extract(result.dest) if self.extractor is not None else {}
         meta_path.write_text(f"""---
 type: file_drop
 original_name: {source.name}
-size_bytes: {source.stat().st_size}
-received: {datetime.now().isoformat()}
+size_bytes: {result.size}
+sha256: {result.sha256}
+ingest_method: {result.method}
+{frontmatter_lines(extracted)}received: {datetime.now().isoformat()}
 status: pending
 ---
 
 # New File: {source.name}
 
 **Dropped:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Size:** {source.stat().st_size:,} bytes
+**Size:** {result.size:,} bytes
 **Type:** {source.suffix.upper() or 'Unknown'}
 
 ## Suggested Actions
@@ -85,17 +275,19 @@ class FilesystemWatcher:
     def run(self) -> None:
         """Start watching the drop folder indefinitely."""
         self.logger.info(f"Watching drop folder: {self.watch_folder}")
-        handler = DropFolderHandler(self.needs_action, self.logs, self.logger)
+        store = ContentStore(Config.FILE_STORE) if Config.INGEST_DEDUP else None
+        extractor = MetadataExtractor(logger=self.logger) if Config.EXTRACT_METADATA else None
+        handler = DropFolderHandler(self.needs_action, self.logs, self.logger, store, extractor)
         observer = Observer()
         observer.schedule(handler, str(self.watch_folder), recursive=False)
         observer.start()
 
         try:
             while True:
-                import time
                 time.sleep(5)
         except KeyboardInterrupt:
             self.logger.info("Filesystem watcher shutting down")
             observer.stop()
         finally:
-            observer.join()
\ No newline at end of file
+            observer.join()
+            handler.close()
\ No newline at end of file
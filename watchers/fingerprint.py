@@ -0,0 +1,130 @@
+"""
+Message Fingerprints - Gold Tier
+Stable, keyed IDs for scraped chat messages.
+
+Python's hash() is salted per process, so IDs built from it change on every
+restart and every visible message looks new again. A fingerprint here is a
+keyed BLAKE2b digest of the normalized (chat, timestamp, text) triple: the
+same pane snapshot always yields the same ID, across restarts and machines
+sharing the key, while the key keeps message content from being guessable
+from the IDs stored in the vault.
+"""
+
+import hashlib
+import os
+import re
+import secrets
+import unicodedata
+from datetime import date, timedelta
+from pathlib import Path
+
+# Zero-width and direction marks WhatsApp Web sprinkles into names and previews
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u200e\u200f\u2060\ufeff"))
+_WHITESPACE = re.compile(r"\s+")
+_TIME_LINE = re.compile(
+    r"^(\d{1,2}:\d{2}(\s?[ap]\.?m\.?)?|yesterday|today|monday|tuesday|wednesday|"
+    r"thursday|friday|saturday|sunday|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})$",
+    re.IGNORECASE,
+)
+_UNREAD_LINE = re.compile(r"^\d{1,4}$")
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def normalize(value: str) -> str:
+    """Canonical form used for hashing: NFKC, casefolded, single-spaced."""
+    value = unicodedata.normalize("NFKC", value or "").translate(_INVISIBLE)
+    return _WHITESPACE.sub(" ", value).strip().casefold()
+
+
+def resolve_day(label: str, today: date | None = None) -> str:
+    """
+    Map a chat-list time label to a stable calendar day.
+    WhatsApp shows "10:32 AM" today, "Yesterday" tomorrow and a weekday after
+    that, so the raw label would change the ID as the message ages.
+    Full dates are already stable and are returned unchanged.
+    """
+    today = today or date.today()
+    label = normalize(label)
+    if not label:
+        return ""
+    if ":" in label or label == "today":
+        return today.isoformat()
+    if label == "yesterday":
+        return (today - timedelta(days=1)).isoformat()
+    if label in _WEEKDAYS:
+        back = (today.weekday() - _WEEKDAYS.index(label)) % 7 or 7
+        return (today - timedelta(days=back)).isoformat()
+    return label
+
+
+def load_key(key_file: Path, env_var: str = "WHATSAPP_FINGERPRINT_KEY") -> bytes:
+    """Fingerprint key from the environment, else a per-install key file (created once)."""
+    env_key = os.getenv(env_var)
+    if env_key:
+        return hashlib.blake2b(env_key.encode("utf-8"), digest_size=32).digest()
+    key_file = Path(key_file)
+    if key_file.exists():
+        return key_file.read_bytes()
+    key_file.parent.mkdir(parents=True, exist_ok=True)
+    key = secrets.token_bytes(32)
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def message_fingerprint(key: bytes, chat: str, timestamp: str, text: str) -> str:
+    """Stable 128-bit hex ID for one chat message."""
+    digest = hashlib.blake2b(key=key, digest_size=16, person=b"wa-msg-v1")
+    digest.update("\x1f".join(normalize(p) for p in (chat, timestamp, text)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parse_pane_row(lines: list[str], index: int) -> tuple[str, str, str]:
+    """
+    Recover (chat, timestamp, text) for the message on lines[index] of the
+    #pane-side text, which lists each chat as name / time / preview / unread.
+    Unread badges are ignored so a changing count does not change the ID,
+    and the time label is resolved to a calendar day with resolve_day().
+    """
+    text = lines[index].strip()
+    chat, timestamp = "", ""
+    for j in range(index - 1, max(-1, index - 4), -1):
+        candidate = lines[j].strip()
+        if _TIME_LINE.match(candidate):
+            timestamp = resolve_day(candidate)
+            # Chat name is the nearest non-badge line above the time
+            for k in range(j - 1, max(-1, j - 3), -1):
+                name = lines[k].strip()
+                if name and not _UNREAD_LINE.match(name):
+                    chat = name
+                    break
+            break
+    if not timestamp and index > 0:
+        chat = lines[index - 1].strip()
+    return chat, timestamp, text
+
+
+if __name__ == "__main__":
+    # Self-check: identical IDs across interpreters with different hash seeds
+    import subprocess
+    import sys
+
+    snapshot = "Ali Traders\n10:32 AM\nURGENT: please send the invoice asap\n2"
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from watchers.fingerprint import message_fingerprint, parse_pane_row\n"
+        "lines = %r.split('\\n')\n"
+        "print(message_fingerprint(b'k' * 32, *parse_pane_row(lines, 2)))\n"
+    ) % (str(Path(__file__).parent.parent), snapshot)
+    ids = set()
+    for seed in ("1", "2", "random"):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        print(f"PYTHONHASHSEED={seed:<7} -> {out}")
+        ids.add(out)
+    assert len(ids) == 1, "fingerprint changed between interpreter runs"
+    print("OK: stable across interpreter runs")
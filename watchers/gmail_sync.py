@@ -0,0 +1,184 @@
+"""
+Gmail Sync - Gold Tier
+Incremental mailbox sync for GmailWatcher using the Gmail History API.
+
+The first run (or any run after the stored historyId has expired) does a
+full paginated messages.list resync and records the mailbox historyId.
+Every later cycle asks users.history.list for changes since that ID, so a
+quiet mailbox costs one small API call per cycle no matter how large it is,
+and nothing is silently dropped past the first page of results.
+
+Message details are fetched in batches of up to 50 messages.get calls per
+HTTP round trip, header-only (format=metadata) with a partial-response field
+mask; the full body is fetched only for messages that actually need it.
+"""
+
+import base64
+import json
+import os
+from pathlib import Path
+
+# Labels a message must carry to be picked up (mirrors q='is:unread is:starred')
+REQUIRED_LABELS = frozenset({"UNREAD", "STARRED"})
+FULL_SYNC_QUERY = "is:unread is:starred"
+
+# Header-only triage: everything GmailWatcher reads from a message, nothing more
+METADATA_HEADERS = ["From", "Subject", "Date"]
+METADATA_FIELDS = "id,threadId,labelIds,snippet,payload/headers"
+BATCH_LIMIT = 50  # Gmail's recommended maximum sub-requests per batch
+
+
+def is_history_expired(error: Exception) -> bool:
+    """History IDs older than about a week make history.list return 404."""
+    resp = getattr(error, "resp", None)
+    return getattr(resp, "status", None) == 404
+
+
+def metadata_request(service, msg_id: str):
+    return service.users().messages().get(
+        userId="me",
+        id=msg_id,
+        format="metadata",
+        metadataHeaders=METADATA_HEADERS,
+        fields=METADATA_FIELDS,
+    )
+
+
+def fetch_metadata(service, msg_ids: list[str], logger, batch: bool = True) -> dict[str, dict]:
+    """
+    Header-only details for many messages, keyed by ID.
+    Failed sub-requests are logged and left out so the caller retries them.
+    """
+    results: dict[str, dict] = {}
+    if not batch:
+        for msg_id in msg_ids:
+            try:
+                results[msg_id] = metadata_request(service, msg_id).execute()
+            except Exception as e:
+                logger.error(f"Gmail metadata fetch failed for {msg_id}: {e}")
+        return results
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            logger.error(f"Gmail metadata fetch failed for {request_id}: {exception}")
+        else:
+            results[request_id] = response
+
+    for start in range(0, len(msg_ids), BATCH_LIMIT):
+        batch_request = service.new_batch_http_request(callback=on_response)
+        for msg_id in msg_ids[start:start + BATCH_LIMIT]:
+            batch_request.add(metadata_request(service, msg_id), request_id=msg_id)
+        batch_request.execute()
+    return results
+
+
+def fetch_body(service, msg_id: str) -> str:
+    """Plain-text body of one message (lazy, full fetch)."""
+    msg = service.users().messages().get(
+        userId="me", id=msg_id, format="full", fields="payload",
+    ).execute()
+    parts = [msg.get("payload", {})]
+    while parts:
+        part = parts.pop(0)
+        if part.get("mimeType", "text/plain") == "text/plain" and part.get("body", {}).get("data"):
+            return base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8", "replace")
+        parts.extend(part.get("parts", []))
+    return ""
+
+
+class GmailSync:
+    """Tracks the last seen historyId and returns IDs of new matching messages."""
+
+    def __init__(self, service, state_file: Path, logger, page_size: int = 500):
+        self.service = service
+        self.state_file = Path(state_file)
+        self.logger = logger
+        self.page_size = page_size
+        self.history_id: str | None = self._load_state().get("history_id")
+        self.api_calls = 0  # running total, handy for monitoring and benchmarks
+
+    # ------------------------------------------------------------------ #
+    #  State                                                                #
+    # ------------------------------------------------------------------ #
+
+    def _load_state(self) -> dict:
+        try:
+            return json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"history_id": self.history_id}))
+        os.replace(tmp, self.state_file)
+
+    def _execute(self, request) -> dict:
+        self.api_calls += 1
+        return request.execute()
+
+    # ------------------------------------------------------------------ #
+    #  Sync                                                                 #
+    # ------------------------------------------------------------------ #
+
+    def new_message_ids(self) -> list[str]:
+        """IDs of unread+starred messages added since the last call."""
+        if self.history_id:
+            try:
+                return self._incremental_sync()
+            except Exception as e:
+                if not is_history_expired(e):
+                    raise
+                self.logger.warning("Gmail historyId expired — running full resync")
+        return self._full_sync()
+
+    def _full_sync(self) -> list[str]:
+        # Take the historyId first so changes made during the listing are not lost
+        profile = self._execute(self.service.users().getProfile(userId="me"))
+        start_history_id = str(profile["historyId"])
+
+        ids: list[str] = []
+        page_token = None
+        while True:
+            response = self._execute(self.service.users().messages().list(
+                userId="me",
+                q=FULL_SYNC_QUERY,
+                maxResults=self.page_size,
+                pageToken=page_token,
+                fields="messages/id,nextPageToken",
+            ))
+            ids.extend(m["id"] for m in response.get("messages", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        self.history_id = start_history_id
+        self._save_state()
+        self.logger.info(f"Gmail full sync: {len(ids)} matching message(s)")
+        return ids
+
+    def _incremental_sync(self) -> list[str]:
+        ids: dict[str, None] = {}  # ordered set
+        latest = self.history_id
+        page_token = None
+        while True:
+            response = self._execute(self.service.users().history().list(
+                userId="me",
+                startHistoryId=self.history_id,
+                historyTypes=["messageAdded", "labelAdded"],
+                maxResults=self.page_size,
+                pageToken=page_token,
+            ))
+            for record in response.get("history", []):
+                for change in record.get("messagesAdded", []) + record.get("labelsAdded", []):
+                    message = change.get("message", {})
+                    if REQUIRED_LABELS.issubset(message.get("labelIds", [])):
+                        ids[message["id"]] = None
+            latest = str(response.get("historyId", latest))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        if latest != self.history_id:
+            self.history_id = latest
+            self._save_state()
+        return list(ids)
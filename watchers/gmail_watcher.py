@@ -1,15 +1,13 @@
 """Gmail watcher - monitors Gmail for important emails"""
 
-import pickle
 from datetime import datetime
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-
 from watchers.base_watcher import BaseWatcher  # fixed: package import
 from watchers.config import Config             # fixed: package import
+from watchers.dedup_store import ProcessedIdStore, get_store
+from watchers.gmail_sync import GmailSync, fetch_body, fetch_metadata, metadata_request
+from watchers.google_auth import get_service
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
 'https://www.googleapis.com/auth/gmail.send']
@@ -25,66 +23,79 @@ class GmailWatcher(BaseWatcher):
         self.token_path = Path(Config.GMAIL_TOKEN_PATH)
         self.service = self._authenticate()
         self.processed_ids = self._load_processed_ids()
+        self.sync = GmailSync(self.service, self.logs / 'gmail_state.json', self.logger)
+        # IDs found by sync but not yet turned into action files (retried next cycle)
+        self.backlog: dict[str, None] = {}
+        self.metadata_cache: dict[str, dict] = {}
 
     def _authenticate(self):
-        """Authenticate with Gmail API"""
-        creds = None
-
-        if self.token_path.exists():
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-
-            self.token_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
-
-        return build('gmail', 'v1', credentials=creds)
-
-    def _load_processed_ids(self) -> set:
-        """Load set of already processed email IDs"""
-        processed_file = self.logs / 'processed_emails.txt'
-        if processed_file.exists():
-            return set(processed_file.read_text().splitlines())
-        return set()
+        """Authenticate with Gmail API (runs the OAuth flow on first use)"""
+        return get_service(
+            'gmail', 'v1', self.token_path,
+            scopes=SCOPES,
+            credentials_path=self.credentials_path,
+            interactive=True,
+        )
+
+    def _load_processed_ids(self) -> ProcessedIdStore:
+        """Open the processed email ID store (imports the old .txt list once)"""
+        store = get_store(
+            self.logs, 'processed_emails', ttl_days=Config.PROCESSED_ID_TTL_DAYS
+        )
+        legacy_file = self.logs / 'processed_emails.txt'
+        if legacy_file.exists():
+            store.import_legacy(legacy_file, legacy_file.read_text().splitlines())
+        return store
 
     def _save_processed_id(self, email_id: str):
         """Save processed email ID to avoid reprocessing"""
-        processed_file = self.logs / 'processed_emails.txt'
-        with open(processed_file, 'a') as f:
-            f.write(f'{email_id}\n')
         self.processed_ids.add(email_id)
+        self.backlog.pop(email_id, None)
 
     def check_for_updates(self) -> list:
         """Check Gmail for unread starred emails"""
         try:
-            results = self.service.users().messages().list(
-                userId='me',
-                q='is:unread is:starred',
-                maxResults=10
-            ).execute()
-            messages = results.get('messages', [])
-            return [m for m in messages if m['id'] not in self.processed_ids]
+            if not Config.GMAIL_INCREMENTAL_SYNC:
+                results = self.service.users().messages().list(
+                    userId='me',
+                    q='is:unread is:starred',
+                    maxResults=10
+                ).execute()
+                messages = results.get('messages', [])
+                pending = [m for m in messages if m['id'] not in self.processed_ids]
+                self._prefetch([m['id'] for m in pending])
+                return pending
+
+            for msg_id in self.sync.new_message_ids():
+                self.backlog[msg_id] = None
         except Exception as e:
             self.logger.error(f'Error checking Gmail: {e}')
-            return []
+        self.backlog = {
+            msg_id: None for msg_id in self.backlog
+            if msg_id not in self.processed_ids
+        }
+        self._prefetch(list(self.backlog))
+        return [{'id': msg_id} for msg_id in self.backlog]
+
+    def _prefetch(self, msg_ids: list) -> None:
+        """Fetch headers for all new messages up front, batched per round trip"""
+        missing = [i for i in msg_ids if i not in self.metadata_cache]
+        if not missing:
+            return
+        try:
+            self.metadata_cache.update(fetch_metadata(
+                self.service, missing, self.logger, batch=Config.GMAIL_BATCH_FETCH
+            ))
+        except Exception as e:
+            # create_action_file falls back to one request per message
+            self.logger.error(f'Batch metadata fetch failed: {e}')
 
     def create_action_file(self, message) -> Path:
         """Create markdown file for email in Needs_Action folder"""
         try:
-            msg = self.service.users().messages().get(
-                userId='me',
-                id=message['id'],
-                format='full'
-            ).execute()
+            msg = self.metadata_cache.pop(message['id'], None)
+            if msg is None:
+                msg = metadata_request(self.service, message['id']).execute()
 
             headers = {
                 h['name']: h['value']
@@ -122,7 +133,7 @@ email_id: {message['id']}
 
 ## Content Preview
 {msg.get('snippet', 'No preview available')}
-
+{self._body_section(message['id'])}
 ## Suggested Actions
 - [ ] Read full email
 - [ ] Draft reply
@@ -148,6 +159,12 @@ email_id: {message['id']}
             self.logger.error(f'Error creating action file: {e}')
             raise
 
+    def _body_section(self, msg_id: str) -> str:
+        """Full body is only fetched when configured — triage needs headers only"""
+        if not Config.GMAIL_INCLUDE_BODY:
+            return ''
+        return f"\n## Full Body\n{fetch_body(self.service, msg_id).strip()}\n"
+
 
 if __name__ == '__main__':
     GmailWatcher().run()
\ No newline at end of file
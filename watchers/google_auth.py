@@ -0,0 +1,118 @@
+"""
+Google Auth - Gold Tier
+Shared, thread-safe Google credentials and API clients.
+
+Every Gmail / Calendar caller used to unpickle token.pickle, maybe refresh it
+and run googleapiclient's build() (re-parsing the discovery document) on each
+call. This module loads each token file once per process, keeps it fresh
+from a background thread a few minutes before expiry, and caches built
+service objects per API and per thread (httplib2 is not thread-safe), built
+from the static discovery documents shipped with google-api-python-client.
+"""
+
+import logging
+import pickle
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import build
+
+REFRESH_MARGIN = 300   # seconds before expiry to refresh ahead
+REFRESH_CHECK = 60     # seconds between refresh-ahead checks
+
+logger = logging.getLogger("GoogleAuth")
+
+_lock = threading.RLock()
+_credentials: dict[Path, object] = {}
+_local = threading.local()
+_refresher: threading.Thread | None = None
+
+
+def _save(token_path: Path, creds) -> None:
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = token_path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(creds, f)
+    tmp.replace(token_path)
+
+
+def _seconds_left(creds) -> float:
+    if not creds.expiry:
+        return float("inf")
+    expiry = creds.expiry.replace(tzinfo=timezone.utc)  # google-auth stores naive UTC
+    return (expiry - datetime.now(timezone.utc)).total_seconds()
+
+
+def get_credentials(token_path, scopes: list[str] | None = None,
+                    credentials_path=None, interactive: bool = False):
+    """
+    Cached credentials for a token file, refreshed if needed.
+    With interactive=True a missing/unrefreshable token starts the OAuth
+    browser flow (first-run setup); otherwise a RuntimeError is raised.
+    """
+    token_path = Path(token_path).resolve()
+    with _lock:
+        creds = _credentials.get(token_path)
+        if creds is None and token_path.exists():
+            with open(token_path, "rb") as f:
+                creds = pickle.load(f)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            elif interactive and credentials_path:
+                from google_auth_oauthlib.flow import InstalledAppFlow
+                flow = InstalledAppFlow.from_client_secrets_file(str(credentials_path), scopes)
+                creds = flow.run_local_server(port=0)
+            else:
+                raise RuntimeError(f"Google token missing or invalid: {token_path}")
+            _save(token_path, creds)
+
+        _credentials[token_path] = creds
+        _start_refresher()
+        return creds
+
+
+def get_service(api: str, version: str, token_path, **credential_kwargs):
+    """
+    Built API client for the calling thread, reused across calls.
+    All threads share the same credentials object, so a refresh by any of
+    them (or by the refresh-ahead thread) is seen by every client.
+    """
+    creds = get_credentials(token_path, **credential_kwargs)
+    services = _local.__dict__.setdefault("services", {})
+    key = (api, version, Path(token_path).resolve())
+    service = services.get(key)
+    if service is None:
+        service = build(api, version, credentials=creds,
+                        static_discovery=True, cache_discovery=False)
+        services[key] = service
+    return service
+
+
+def _start_refresher() -> None:
+    global _refresher
+    if _refresher is None or not _refresher.is_alive():
+        _refresher = threading.Thread(target=_refresh_loop, name="GoogleAuthRefresh", daemon=True)
+        _refresher.start()
+
+
+def _refresh_loop() -> None:
+    while True:
+        time.sleep(REFRESH_CHECK)
+        with _lock:
+            items = list(_credentials.items())
+        for token_path, creds in items:
+            if not creds.refresh_token or _seconds_left(creds) > REFRESH_MARGIN:
+                continue
+            try:
+                with _lock:
+                    creds.refresh(Request())
+                    _save(token_path, creds)
+                logger.info(f"Refreshed Google token ahead of expiry: {token_path.name}")
+            except Exception as e:
+                # Callers still refresh on demand if this keeps failing
+                logger.warning(f"Refresh-ahead failed for {token_path.name}: {e}")
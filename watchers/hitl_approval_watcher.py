@@ -4,22 +4,23 @@ Monitors the /Pending_Approval folder for human decisions.
 When a file is moved to /Approved, triggers the corresponding MCP action.
 """
 
-import json
+import threading
 import time
 from datetime import datetime
-from pathlib import Path
 
+from watchers.approval_expiry import ExpiryScheduler
+from watchers.audit_log import AuditLogger, append_entry
 from watchers.config import Config
+from watchers.vault_events import VaultEvent, get_bus
+from watchers.vault_meta import read_frontmatter
 
 
 class HITLApprovalWatcher:
     """
-    Polls /Pending_Approval for files, waits for human to move them to
-    /Approved or /Rejected, then executes or cancels the action.
+    Waits for a human to move /Pending_Approval files to /Approved or
+    /Rejected, then executes or cancels the action.
     """
 
-    POLL_INTERVAL = 10  # seconds
-
     def __init__(self, logger=None):
         self.audit = AuditLogger(Config.VAULT_PATH / "Logs")
         import logging
@@ -30,6 +31,9 @@ class HITLApprovalWatcher:
         self.done_dir = self.vault_path / "Done"
         self.logs_dir = self.vault_path / "Logs"
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._wake = threading.Event()
+        self.expiry = ExpiryScheduler(self.pending_dir, warn_before=Config.APPROVAL_WARN_HOURS * 3600)
+        self._whatsapp = None  # built on the first approved send_whatsapp, then reused
 
         for folder in [
             self.pending_dir,
@@ -45,16 +49,37 @@ class HITLApprovalWatcher:
     # ------------------------------------------------------------------ #
 
     def run(self) -> None:
-        """Poll approved/rejected folders and process decisions."""
+        """
+        Process decisions as soon as files land in /Approved or /Rejected,
+        and act on `expires:` deadlines of pending approvals as they pass.
+        """
         self.logger.info("HITL Approval Watcher started")
+        bus = get_bus()
+        for folder in [self.approved_dir, self.rejected_dir]:
+            bus.subscribe(folder, "*.md", self._on_decision)
+        bus.subscribe(self.pending_dir, "*.md", self._on_pending)
+        next_scan = 0.0
         while True:
             try:
                 self._process_approved()
                 self._process_rejected()
-                self._warn_expiring()
+                if time.time() >= next_scan:
+                    next_scan = time.time() + Config.VAULT_RESCAN_INTERVAL
+                    self.expiry.scan()
+                self._process_expiry()
             except Exception as e:
                 self.logger.error(f"HITL loop error: {e}", exc_info=True)
-            time.sleep(self.POLL_INTERVAL)
+            deadline = min(next_scan, self.expiry.next_deadline() or next_scan)
+            self._wake.wait(max(0.0, deadline - time.time()))
+            self._wake.clear()
+
+    def _on_decision(self, event: VaultEvent) -> None:
+        if event.kind != "deleted":
+            self._wake.set()
+
+    def _on_pending(self, event: VaultEvent) -> None:
+        self.expiry.on_event(event)
+        self._wake.set()
 
     # ------------------------------------------------------------------ #
     #  Approval handling                                                    #
@@ -62,7 +87,7 @@ class HITLApprovalWatcher:
 
     def _process_approved(self) -> None:
         for approval_file in self.approved_dir.glob("*.md"):
-            metadata = self._parse_frontmatter(approval_file)
+            metadata = read_frontmatter(approval_file)
             action_type = metadata.get("action", "unknown")
 
             self.logger.info(f"Processing approved action: {approval_file.name}")
@@ -81,7 +106,7 @@ class HITLApprovalWatcher:
 
     def _process_rejected(self) -> None:
         for rejection_file in self.rejected_dir.glob("*.md"):
-            metadata = self._parse_frontmatter(rejection_file)
+            metadata = read_frontmatter(rejection_file)
             self.logger.info(f"Action rejected: {rejection_file.name}")
             self._log_approval(
                 rejection_file.name,
@@ -93,23 +118,27 @@ class HITLApprovalWatcher:
             dest = self.done_dir / f"REJECTED_{rejection_file.name}"
             rejection_file.rename(dest)
 
-    def _warn_expiring(self) -> None:
-        """Log a warning for approval files nearing their expiry."""
-        now = datetime.now()
-        for pending_file in self.pending_dir.glob("*.md"):
-            metadata = self._parse_frontmatter(pending_file)
-            expires_str = metadata.get("expires")
-            if not expires_str:
+    def _process_expiry(self) -> None:
+        """Warn about / expire the pending approvals whose deadline has passed."""
+        for kind, pending_file, expires in self.expiry.due():
+            if kind == "warn":
+                hours_left = (expires - time.time()) / 3600
+                self.logger.warning(f"Approval expiring in {hours_left:.1f}h: {pending_file.name}")
                 continue
-            try:
-                expires = datetime.fromisoformat(expires_str)
-                hours_left = (expires - now).total_seconds() / 3600
-                if 0 < hours_left < 2:
-                    self.logger.warning(
-                        f"Approval expiring in {hours_left:.1f}h: {pending_file.name}"
-                    )
-            except ValueError:
-                pass
+            policy = Config.APPROVAL_ON_EXPIRY
+            if policy == "reject":
+                metadata = read_frontmatter(pending_file)
+                self.logger.warning(f"Approval expired, auto-rejecting: {pending_file.name}")
+                self._log_approval(
+                    pending_file.name,
+                    metadata.get("action", "unknown"),
+                    metadata,
+                    "expired",
+                    "auto_rejected",
+                )
+                pending_file.rename(self.done_dir / f"EXPIRED_{pending_file.name}")
+            elif policy == "warn":
+                self.logger.warning(f"Approval expired: {pending_file.name}")
 
     # ------------------------------------------------------------------ #
     #  Action dispatcher                                                    #
@@ -135,19 +164,12 @@ class HITLApprovalWatcher:
 
     def _execute_email(self, metadata: dict) -> str:
         """Send approved email via Gmail API directly."""
-        import pickle, base64
+        import base64
         from email.mime.multipart import MIMEMultipart
         from email.mime.text import MIMEText
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-
-        token_path = Path(__file__).parent.parent / "watchers" / "token.pickle"
-        with open(token_path, "rb") as f:
-            creds = pickle.load(f)
-        if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+        from watchers.google_auth import get_service
 
-        service = build("gmail", "v1", credentials=creds)
+        service = get_service("gmail", "v1", Config.GMAIL_TOKEN_PATH)
         msg = MIMEMultipart()
         msg["to"] = metadata.get("to", "")
         msg["subject"] = metadata.get("subject", "(no subject)")
@@ -160,23 +182,6 @@ class HITLApprovalWatcher:
     #  Helpers                                                              #
     # ------------------------------------------------------------------ #
 
-    def _parse_frontmatter(self, filepath: Path) -> dict:
-        """Parse YAML-style frontmatter from a markdown file."""
-        metadata = {}
-        lines = filepath.read_text().splitlines()
-        if not lines or lines[0].strip() != "---":
-            return metadata
-        try:
-            end = lines.index("---", 1)
-        except ValueError:
-            return metadata
-
-        for line in lines[1:end]:
-            if ":" in line:
-                key, _, value = line.partition(":")
-                metadata[key.strip()] = value.strip()
-        return metadata
-
     def _log_approval(
         self,
         filename: str,
@@ -185,8 +190,7 @@ class HITLApprovalWatcher:
         decision: str,
         result: str,
     ) -> None:
-        log_file = self.logs_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
-        entry = {
+        append_entry(self.logs_dir, {
             "timestamp": datetime.now().isoformat(),
             "action_type": action_type,
             "actor": "hitl_approval_watcher",
@@ -194,43 +198,16 @@ class HITLApprovalWatcher:
             "decision": decision,
             "metadata": metadata,
             "result": result,
-        }
-        logs = json.loads(log_file.read_text()) if log_file.exists() else []
-        logs.append(entry)
-        log_file.write_text(json.dumps(logs, indent=2))
+        })
+
     def _execute_whatsapp(self, metadata: dict) -> str:
         """Send approved WhatsApp reply using WhatsApp Watcher."""
-        from watchers.whatsapp_watcher import WhatsAppWatcher
-        watcher = WhatsAppWatcher()
         to = metadata.get("to", "")
         body = metadata.get("body", "")
         if not to or not body:
             return "error: missing to or body"
-        success = watcher.send_reply(to=to, message=body)
+        if self._whatsapp is None:
+            from watchers.whatsapp_watcher import WhatsAppWatcher
+            self._whatsapp = WhatsAppWatcher()
+        success = self._whatsapp.send_reply(to=to, message=body)
         return "sent" if success else "failed"
-
-
-class AuditLogger:
-    """Enhanced audit logger for Gold Tier comprehensive logging."""
-
-    def __init__(self, logs_dir: Path):
-        self.logs_dir = logs_dir
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    def log(self, action_type: str, actor: str, metadata: dict,
-            result: str, duration_ms: int = 0, error: str = None) -> None:
-        log_file = self.logs_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "session_id": self.session_id,
-            "action_type": action_type,
-            "actor": actor,
-            "metadata": metadata,
-            "result": result,
-            "duration_ms": duration_ms,
-            "error": error,
-            "status": "error" if error else "success",
-        }
-        logs = json.loads(log_file.read_text()) if log_file.exists() else []
-        logs.append(entry)
-        log_file.write_text(json.dumps(logs, indent=2))
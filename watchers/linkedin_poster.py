@@ -4,17 +4,24 @@ Auto-posts business content to LinkedIn using Playwright.
 Reads post content from /Vault/Plans/linkedin_queue/ folder.
 """
 
-import os
-import time
 from datetime import datetime
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
 from watchers.base_watcher import BaseWatcher
+from watchers.browser_pool import get_pool
+from watchers.browser_waits import FlowTimer, gone, selector
 from watchers.config import Config
+from watchers.route_policy import policy_for
+from watchers.text_entry import enter_text
+from watchers.vault_meta import read_body
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",  # ← ADD
+    "--host-resolver-rules=MAP linkedin.com 150.171.22.12, MAP www.linkedin.com 150.171.22.12",
+]
 
 
 class LinkedInPoster(BaseWatcher):
@@ -31,105 +38,94 @@ class LinkedInPoster(BaseWatcher):
         for folder in [self.queue_dir, self.posted_dir, self.session_path]:
             folder.mkdir(parents=True, exist_ok=True)
 
+        get_pool().register(
+            "linkedin",
+            self.session_path,
+            args=BROWSER_ARGS,
+            user_agent=USER_AGENT,
+            slow_mo=Config.BROWSER_SLOW_MO,
+            route_policy=policy_for("linkedin"),
+            logger=self.logger,
+        )
+
+    def wake_folders(self) -> list[Path]:
+        return [self.queue_dir]
+
     def check_for_updates(self) -> list:
         pending = list(self.queue_dir.glob("*.md"))
         self.logger.info(f"Found {len(pending)} post(s) in LinkedIn queue")
         return pending
 
     def create_action_file(self, post_file: Path) -> Path:
-        post_text = self._extract_post_text(post_file)
+        post_text = read_body(post_file)
 
         if Config.DRY_RUN:
             self.logger.info(f"[DRY RUN] Would post to LinkedIn:\n{post_text[:200]}...")
             return self._archive_post(post_file, status="dry_run")
 
-        success = self._post_to_linkedin(post_text)
+        success = self.publish(post_text)
         status = "posted" if success else "failed"
         return self._archive_post(post_file, status=status)
 
+    def publish(self, text: str) -> bool:
+        """Post text now (used by the queue above and by SocialPublisher)."""
+        return self._post_to_linkedin(text)
+
     def _post_to_linkedin(self, text: str) -> bool:
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    str(self.session_path),
-                    headless=not bool(os.environ.get("DISPLAY")),  # ← CHANGE
-                    args=[
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",  # ← ADD
-                        "--host-resolver-rules=MAP linkedin.com 150.171.22.12, MAP www.linkedin.com 150.171.22.12",
-                    ],
-                    user_agent=USER_AGENT,
-                    slow_mo=500,                                            # ← ADD
-                )
-                page = browser.new_page() if not browser.pages else browser.pages[0]
-                page.goto("https://www.linkedin.com/feed/")
-                self.logger.info("Waiting for LinkedIn feed to load...")
-                time.sleep(20)
-
-                title = page.title()
-                self.logger.info(f"Page title: {title}")
-
-                # Login check
-                if "login" in page.url.lower() or "signin" in page.url.lower():
-                    self.logger.error("LinkedIn session expired — please re-login")
-                    browser.close()
-                    return False
-
-                # Click "Start a post"
-                start_post = None
-                for selector in [
-                    '[data-control-name="share.sharebox_focus_text"]',
-                    'button:has-text("Start a post")',
-                    '[placeholder*="start a post" i]',
-                ]:
-                    start_post = page.query_selector(selector)
-                    if start_post:
-                        break
-
-                if not start_post:
-                    self.logger.error("Could not find 'Start a post' button")
-                    browser.close()
-                    return False
-
-                start_post.click()
-                time.sleep(2)
-
-                # Type post content
-                editor = page.query_selector('.ql-editor')
-                if not editor:
-                    self.logger.error("LinkedIn post editor not found")
-                    browser.close()
-                    return False
-
-                editor.fill(text)
-                time.sleep(1)
-
-                # Click Post button
-                post_btn = page.get_by_role("button", name="Post", exact=True)
-                post_btn.click()
-                time.sleep(3)
-
-                browser.close()
-                self.logger.info("Successfully posted to LinkedIn")
-                return True
-
+            return get_pool().run("linkedin", lambda page: self._publish(page, text))
         except Exception as e:
             self.logger.error(f"LinkedIn post failed: {e}", exc_info=True)
             return False
 
-    def _extract_post_text(self, post_file: Path) -> str:
-        raw = post_file.read_text()
-        lines = raw.splitlines()
-
-        if lines and lines[0].strip() == "---":
-            try:
-                end = lines.index("---", 1)
-                lines = lines[end + 1:]
-            except ValueError:
-                pass
-
-        return "\n".join(lines).strip()
+    def _publish(self, page, text: str) -> bool:
+        """Runs on the pooled LinkedIn browser's thread."""
+        timer = FlowTimer("linkedin_post", self.logger)
+        try:
+            page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+            self.logger.info("Waiting for LinkedIn feed to load...")
+
+            # Click "Start a post" (its absence on a login page means the session expired)
+            start_post = timer.optional(page, selector(
+                "start_post",
+                '[data-control-name="share.sharebox_focus_text"]',
+                'button:has-text("Start a post")',
+                '[placeholder*="start a post" i]',
+            ))
+            self.logger.info(f"Page title: {page.title()}")
+
+            # Login check
+            if "login" in page.url.lower() or "signin" in page.url.lower():
+                self.logger.error("LinkedIn session expired — please re-login")
+                return False
+
+            if not start_post:
+                self.logger.error("Could not find 'Start a post' button")
+                return False
+
+            start_post.click()
+
+            # Type post content
+            editor = timer.optional(page, selector("editor", ".ql-editor", timeout=10))
+            if not editor:
+                self.logger.error("LinkedIn post editor not found")
+                return False
+
+            if not enter_text(page, editor, text, self.logger, timer):
+                self.logger.error("Could not enter text in LinkedIn editor")
+                return False
+
+            # Click Post button (click() waits until it is enabled)
+            post_btn = page.get_by_role("button", name="Post", exact=True)
+            post_btn.click()
+            # The post is out once Post was clicked; a slow composer close is not a failure
+            if not timer.optional(page, gone("composer_closed", ".ql-editor", timeout=15)):
+                self.logger.warning("LinkedIn composer still open after Post; assuming it was published")
+
+            self.logger.info("Successfully posted to LinkedIn")
+            return True
+        finally:
+            timer.log()
 
     def _archive_post(self, post_file: Path, status: str) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
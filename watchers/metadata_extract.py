@@ -0,0 +1,298 @@
+"""
+Metadata Extract - Gold Tier
+Per-file-type metadata for dropped documents, extracted on a process pool.
+
+The _meta.md written for a dropped file used to record only its name, size
+and extension. Anyone triaging it (Claude, the cloud agent, a human) had to
+open the raw document again. Extractors now add a summary to the
+frontmatter:
+
+    .pdf                      page_count, first_page_text (needs pypdf;
+                              without it, only a page count from the raw objects)
+    .csv / .tsv               csv_rows, csv_columns, csv_numeric (min / max / mean)
+    .png .jpg .gif .webp .bmp image_format, image_width, image_height
+    .txt / .md                text_lines, text_words, text_preview
+
+Extractors are plain functions registered with @extractor(".ext", ...), so a
+new file type is one function. They run in worker processes, never on the
+watchdog observer thread, and each file has limits:
+- a wall-clock limit (EXTRACT_TIMEOUT), enforced with an interval timer
+  inside the worker;
+- an address-space limit per worker (EXTRACT_MAX_MB).
+An extractor that hits either limit gives extract_error instead of taking
+the pipeline down. At most EXTRACT_WORKERS files are in flight, one per
+worker, and further callers wait for a slot. Nothing sits in the pool's own
+queue, so the parent's backstop timeout only counts time a worker spends
+on the file.
+"""
+
+import csv
+import json
+import logging
+import math
+import multiprocessing
+import re
+import resource
+import signal
+import struct
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable
+
+from watchers.config import Config
+
+EXTRACTORS: dict[str, Callable[[Path], dict]] = {}
+PREVIEW_CHARS = 500
+MAX_CSV_COLUMNS = 50
+
+
+def extractor(*suffixes: str):
+    """Register a function(path) -> dict as the extractor for these suffixes."""
+    def register(fn):
+        for suffix in suffixes:
+            EXTRACTORS[suffix.lower()] = fn
+        return fn
+    return register
+
+
+# ------------------------------------------------------------------ #
+#  Extractors                                                           #
+# ------------------------------------------------------------------ #
+
+@extractor(".pdf")
+def pdf_summary(path: Path) -> dict:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        # Page objects are "/Type /Page" (the tree nodes are "/Type /Pages")
+        raw = path.read_bytes()
+        return {"page_count": len(re.findall(rb"/Type\s*/Page(?![a-zA-Z])", raw))}
+    reader = PdfReader(path)
+    text = reader.pages[0].extract_text() if reader.pages else ""
+    return {
+        "page_count": len(reader.pages),
+        "first_page_text": " ".join(text.split())[:PREVIEW_CHARS],
+    }
+
+
+@extractor(".csv", ".tsv")
+def csv_summary(path: Path) -> dict:
+    with open(path, newline="", encoding="utf-8", errors="replace") as f:
+        sample = f.read(8192).rsplit("\n", 1)[0]  # Sniffer's cost grows fast with sample size
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample)
+        except csv.Error:
+            dialect = csv.excel_tab if path.suffix.lower() == ".tsv" else csv.excel
+        reader = csv.reader(f, dialect)
+        header = next(reader, [])[:MAX_CSV_COLUMNS]
+        stats = [[0, float("inf"), float("-inf"), 0.0] for _ in header]  # count, min, max, sum
+        numeric = [True] * len(header)
+        rows = 0
+        for row in reader:
+            rows += 1
+            for i, cell in enumerate(row[:len(header)]):
+                if not numeric[i] or not cell.strip():
+                    continue
+                try:
+                    value = float(cell.replace(",", ""))
+                except ValueError:
+                    value = math.nan
+                if not math.isfinite(value):
+                    numeric[i] = False
+                    continue
+                s = stats[i]
+                s[0] += 1
+                s[1] = min(s[1], value)
+                s[2] = max(s[2], value)
+                s[3] += value
+    return {
+        "csv_rows": rows,
+        "csv_columns": header,
+        "csv_numeric": {
+            name: {"min": s[1], "max": s[2], "mean": round(s[3] / s[0], 4)}
+            for name, s, is_numeric in zip(header, stats, numeric) if is_numeric and s[0]
+        },
+    }
+
+
+def _jpeg_size(f) -> tuple[int, int] | None:
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, 1)
+
+
+@extractor(".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp")
+def image_size(path: Path) -> dict:
+    with open(path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            fmt, size = "png", struct.unpack(">II", head[16:24])
+        elif head[:6] in (b"GIF87a", b"GIF89a"):
+            fmt, size = "gif", struct.unpack("<HH", head[6:10])
+        elif head.startswith(b"BM"):
+            width, height = struct.unpack("<ii", head[18:26])
+            fmt, size = "bmp", (width, abs(height))
+        elif head.startswith(b"\xff\xd8"):
+            fmt, size = "jpeg", _jpeg_size(f)
+        elif head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            fmt, chunk = "webp", head[12:16]
+            if chunk == b"VP8X":
+                w, h = head[24:27] + b"\0", head[27:30] + b"\0"
+                size = (struct.unpack("<I", w)[0] + 1, struct.unpack("<I", h)[0] + 1)
+            elif chunk == b"VP8L":
+                bits = struct.unpack("<I", head[21:25])[0]
+                size = ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+            else:  # VP8 (lossy): frame header follows the 3-byte start code
+                f.seek(26)
+                w, h = struct.unpack("<HH", f.read(4))
+                size = (w & 0x3FFF, h & 0x3FFF)
+        else:
+            return {"image_format": "unknown"}
+    if size is None:
+        return {"image_format": fmt}
+    return {"image_format": fmt, "image_width": size[0], "image_height": size[1]}
+
+
+@extractor(".txt", ".md")
+def text_summary(path: Path) -> dict:
+    lines = words = 0
+    preview = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            lines += 1
+            words += len(line.split())
+            if sum(map(len, preview)) < PREVIEW_CHARS:
+                preview.append(line)
+    return {
+        "text_lines": lines,
+        "text_words": words,
+        "text_preview": " ".join("".join(preview).split())[:PREVIEW_CHARS],
+    }
+
+
+# ------------------------------------------------------------------ #
+#  Worker side                                                          #
+# ------------------------------------------------------------------ #
+
+class ExtractTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise ExtractTimeout()
+
+
+def _init_worker(max_mb: int) -> None:
+    if max_mb:
+        limit = max_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    signal.signal(signal.SIGALRM, _on_alarm)
+
+
+def _run(fn: Callable[[Path], dict], path: str, timeout: float) -> dict:
+    """Runs in a worker process: one extractor under the per-file time limit."""
+    start = time.perf_counter()
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        result = fn(Path(path))
+    except ExtractTimeout:
+        result = {"extract_error": f"timed out after {timeout:.0f}s"}
+    except MemoryError:
+        result = {"extract_error": "memory limit exceeded"}
+    except Exception as e:
+        result = {"extract_error": f"{type(e).__name__}: {e}"}
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    result["extract_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+# ------------------------------------------------------------------ #
+#  Parent side                                                          #
+# ------------------------------------------------------------------ #
+
+class MetadataExtractor:
+    """Bounded process pool running the registered extractors."""
+
+    def __init__(self, workers: int | None = None, timeout: float | None = None,
+                 max_mb: int | None = None, logger=None):
+        self.workers = workers or Config.EXTRACT_WORKERS
+        self.timeout = timeout or Config.EXTRACT_TIMEOUT
+        self.max_mb = Config.EXTRACT_MAX_MB if max_mb is None else max_mb
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._slots = threading.BoundedSemaphore(self.workers)  # one file per worker
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # forkserver: forking this threaded process directly is unsafe
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_init_worker,
+                    initargs=(self.max_mb,),
+                    max_tasks_per_child=100,
+                )
+            return self._pool
+
+    def _reset(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken or wedged pool; the next extract() starts a fresh one."""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.kill()  # a worker stuck in C code ignores the in-process timer
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def extract(self, path: Path) -> dict:
+        """Frontmatter fields for path ({} for file types without an extractor)."""
+        fn = EXTRACTORS.get(Path(path).suffix.lower())
+        if fn is None:
+            return {}
+        return self.run(fn, path)
+
+    def run(self, fn: Callable[[Path], dict], path: Path) -> dict:
+        with self._slots:
+            pool = self._executor()
+            try:
+                future = pool.submit(_run, fn, str(path), self.timeout)
+                # The worker enforces the timeout itself; this is the backstop.
+                # A slot means a free worker, so the clock starts with the job.
+                return future.result(timeout=self.timeout + 5)
+            except FutureTimeout:
+                self.logger.warning(f"Extraction of {Path(path).name} wedged; restarting workers")
+                self._reset(pool)
+                return {"extract_error": f"timed out after {self.timeout:.0f}s"}
+            except BrokenProcessPool:
+                self.logger.warning(f"Extraction worker died on {Path(path).name}; restarting workers")
+                self._reset(pool)
+                return {"extract_error": "worker crashed"}
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def frontmatter_lines(fields: dict) -> str:
+    """Fields as YAML frontmatter lines (values JSON-encoded, which YAML reads as-is)."""
+    return "".join(f"{key}: {json.dumps(value, ensure_ascii=False)}\n" for key, value in fields.items())
@@ -7,12 +7,16 @@ structured Plan.md files banata hai /Plans/ folder mein.
 Claude Code in Plan.md files ko padhta hai aur steps execute karta hai.
 """
 
-import time
 import logging
+import queue
+import time
 from datetime import datetime
 from pathlib import Path
 
 from watchers.config import Config
+from watchers.plan_index import PlanIndex
+from watchers.vault_meta import read_frontmatter
+from watchers.vault_events import VaultEvent, get_bus
 
 
 # Action steps templates for each source type
@@ -47,23 +51,6 @@ PLAN_STEPS: dict[str, list[str]] = {
 }
 
 
-def _parse_frontmatter(filepath: Path) -> dict:
-    """Extract YAML frontmatter key-value pairs from a markdown file."""
-    metadata: dict = {}
-    lines = filepath.read_text().splitlines()
-    if not lines or lines[0].strip() != "---":
-        return metadata
-    try:
-        end = lines.index("---", 1)
-    except ValueError:
-        return metadata
-    for line in lines[1:end]:
-        if ":" in line:
-            key, _, value = line.partition(":")
-            metadata[key.strip()] = value.strip()
-    return metadata
-
-
 def _get_steps(source_type: str, metadata: dict) -> list[str]:
     """Return Plan steps for this source type, filling in any template variables."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -76,7 +63,7 @@ def create_plan_for(action_file: Path, plans_dir: Path, logger: logging.Logger)
     Read a Needs_Action file and write a corresponding Plan.md.
     This is the 'reasoning seed' that Claude Code reads to determine its next steps.
     """
-    metadata = _parse_frontmatter(action_file)
+    metadata = read_frontmatter(action_file)
     source_type = metadata.get("type", "default")
     priority = metadata.get("priority", "medium")
     subject = metadata.get("subject", action_file.stem)
@@ -131,26 +118,50 @@ class PlanCreator:
     Runs as a background thread inside the Orchestrator.
     """
 
-    POLL_INTERVAL = 15  # seconds
-
     def __init__(self):
         self.vault_path = Config.VAULT_PATH
         self.needs_action = Config.NEEDS_ACTION
         self.plans_dir = Config.PLANS
-        self.processed: set[str] = set()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._arrived: queue.SimpleQueue[Path] = queue.SimpleQueue()
 
         self.plans_dir.mkdir(parents=True, exist_ok=True)
+        # Survives restarts, so files still in Needs_Action are not planned twice
+        self.index = PlanIndex(Config.LOGS / "plan_index.jsonl", plans_dir=self.plans_dir)
+
+    def _on_event(self, event: VaultEvent) -> None:
+        if event.kind != "deleted":
+            self._arrived.put(event.path)
+
+    def _create(self, action_file: Path) -> Path:
+        return create_plan_for(action_file, self.plans_dir, self.logger)
+
+    def _plan(self, action_file: Path) -> None:
+        try:
+            st = action_file.stat()
+        except FileNotFoundError:
+            return
+        if st.st_size == 0:
+            return  # still being written (polled folder); picked up on the next event or rescan
+        self.index.ensure(action_file, self._create, st)
 
     def run(self) -> None:
-        """Poll Needs_Action and create Plan.md for each new file."""
+        """Create a Plan.md for each file arriving in Needs_Action."""
         self.logger.info("PlanCreator started — watching /Needs_Action for new files")
+        get_bus().subscribe(self.needs_action, "*.md", self._on_event)
+        next_scan = 0.0
         while True:
             try:
-                for action_file in self.needs_action.glob("*.md"):
-                    if action_file.name not in self.processed:
-                        create_plan_for(action_file, self.plans_dir, self.logger)
-                        self.processed.add(action_file.name)
+                if time.monotonic() >= next_scan:
+                    # Full pass at startup and as a safety net for missed events
+                    next_scan = time.monotonic() + Config.VAULT_RESCAN_INTERVAL
+                    stats = self.index.reconcile(self.needs_action, "*.md", self._create)
+                    if stats["planned"]:
+                        self.logger.info(f"Planned {stats['planned']} of {stats['files']} files in /Needs_Action")
+                try:
+                    action_file = self._arrived.get(timeout=max(0.0, next_scan - time.monotonic()))
+                except queue.Empty:
+                    continue
+                self._plan(action_file)
             except Exception as e:
                 self.logger.error(f"PlanCreator error: {e}", exc_info=True)
-            time.sleep(self.POLL_INTERVAL)
\ No newline at end of file
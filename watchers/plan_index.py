@@ -0,0 +1,184 @@
+"""
+Plan Index - Gold Tier
+Which Needs_Action files already have a Plan, kept across restarts.
+
+PlanCreator used to remember planned files in an in-memory set of names, so
+every orchestrator restart wrote a second PLAN_*.md for everything still in
+Needs_Action. The index is an append-only log, Logs/plan_index.jsonl, with
+one line per source file:
+
+    {"name", "ino", "mtime_ns", "size", "sha256", "plan", "planned"}
+
+A file already has a plan when a record has
+- its name and inode (a changed mtime / size is the agent editing the note,
+  not new work; the record is refreshed with the new hash), or
+- its name and content hash (the same note rewritten under a new inode, e.g.
+  restored by git or saved by an editor that replaces the file).
+Different files with the same content, or a new file reusing an old name,
+still get their own plans. Only files whose (inode, mtime, size) is not in
+the index are hashed, so reconciling a large backlog at startup is one
+scandir pass and dict lookups. Without an
+index, the first start seeds it from the source_file field of the plans
+already in /Plans, so upgrading does not re-plan the backlog. Records whose
+source has left Needs_Action are dropped when the log is compacted.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable
+
+from watchers.file_ingest import hash_file
+from watchers.vault_meta import read_frontmatter
+
+
+class PlanIndex:
+    """source file identity -> plan, backed by Logs/plan_index.jsonl."""
+
+    def __init__(self, path: Path, plans_dir: Path | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._by_ino: dict[int, dict] = {}
+        self._by_content: dict[tuple[str, str], dict] = {}  # (name, sha256)
+        self._seeded: dict[str, str] = {}  # source name -> plan name, from existing plans
+        self._lines = 0
+        self._log = None
+        if self.path.exists():
+            self._load()
+        elif plans_dir is not None:
+            self._seeded = _plans_by_source(Path(plans_dir))
+
+    def _load(self) -> None:
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line after a crash
+                self._remember(record)
+                self._lines += 1
+
+    def _remember(self, record: dict) -> None:
+        self._by_ino[record["ino"]] = record
+        self._by_content[record["name"], record["sha256"]] = record
+
+    def _append(self, record: dict) -> None:
+        if self._log is None:
+            self._log = open(self.path, "a", buffering=1)  # line-buffered: one write per record
+        self._log.write(json.dumps(record) + "\n")
+        self._remember(record)
+        self._lines += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+
+    def __len__(self) -> int:
+        return len(self._by_ino)
+
+    # ------------------------------------------------------------------ #
+    #  Lookup                                                               #
+    # ------------------------------------------------------------------ #
+
+    def ensure(self, source: Path, create: Callable[[Path], Path],
+               st: os.stat_result | None = None) -> tuple[dict, bool]:
+        """
+        Record of the plan for source. create(source) -> plan path is called
+        only if source has none; returns (record, True) when it was.
+        """
+        st = st or source.stat()
+        with self._lock:
+            same_file = self._by_ino.get(st.st_ino)
+            if same_file is not None and same_file["name"] != source.name:
+                same_file = None  # inode number reused by another file
+            if same_file is not None and (same_file["mtime_ns"], same_file["size"]) == (st.st_mtime_ns, st.st_size):
+                return same_file, False
+
+        sha256 = hash_file(source)
+        with self._lock:
+            record = same_file or self._by_content.get((source.name, sha256))
+            if record is not None:
+                return self._refresh(record, source, st, sha256), False
+            plan = self._seeded.pop(source.name, None)
+        created = plan is None
+        if created:
+            plan = create(source).name
+        record = {
+            "name": source.name,
+            "ino": st.st_ino,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": sha256,
+            "plan": plan,
+            "planned": datetime.now().isoformat(),
+        }
+        with self._lock:
+            self._append(record)
+        return record, created
+
+    def _refresh(self, record: dict, source: Path, st: os.stat_result, sha256: str) -> dict:
+        """Same source edited, or rewritten under a new inode (lock held)."""
+        record = {**record, "name": source.name, "ino": st.st_ino,
+                  "mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha256}
+        self._append(record)
+        return record
+
+    # ------------------------------------------------------------------ #
+    #  Startup reconciliation                                               #
+    # ------------------------------------------------------------------ #
+
+    def reconcile(self, folder: Path, pattern: str, create: Callable[[Path], Path]) -> dict:
+        """
+        One pass over folder: plan the files that have none, then compact the
+        log if most of it describes sources that are gone.
+        """
+        live: dict[int, dict] = {}
+        planned = 0
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file() or not fnmatch(entry.name, pattern):
+                    continue
+                st = entry.stat()
+                if st.st_size == 0:
+                    continue  # still being written
+                record, created = self.ensure(Path(entry.path), create, st)
+                live[record["ino"]] = record
+                planned += created
+        with self._lock:
+            compacted = self._lines > 2 * len(live) + 1000
+            if compacted:
+                self._compact(live)
+            self._seeded.clear()
+        return {"files": len(live), "planned": planned, "compacted": compacted}
+
+    def _compact(self, live: dict[int, dict]) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            for record in live.values():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp, self.path)
+        self._by_ino = dict(live)
+        self._by_content = {(record["name"], record["sha256"]): record for record in live.values()}
+        self._lines = len(live)
+
+
+def _plans_by_source(plans_dir: Path) -> dict[str, str]:
+    """source_file -> plan name for the PLAN_*.md files already in plans_dir."""
+    found = {}
+    for plan in plans_dir.glob("PLAN_*.md"):
+        try:
+            source = read_frontmatter(plan).get("source_file")
+        except OSError:
+            continue
+        if source:
+            found.setdefault(source, plan.name)
+    return found
@@ -0,0 +1,308 @@
+"""
+Post Scheduler - Gold Tier
+Time-scheduled, rate-limited priority queue for the per-platform social queues.
+
+The LinkedIn / Twitter / Facebook posters each glob their Plans/*_queue
+folder every 300 s. They post whatever the glob returns, in directory order,
+back to back. One scheduler now serves all three folders and reads two
+optional frontmatter fields from each post:
+
+    ---
+    priority: high                     # urgent | high | normal | low, or an int (lower first)
+    scheduled_at: 2026-05-01T09:30:00  # not posted before this (local time unless offset given)
+    ---
+
+Posts wait in a min-heap keyed by scheduled_at. Once due, they move to a
+per-platform ready heap keyed by (priority, scheduled_at). Each platform has a
+token bucket (SOCIAL_RATE_LIMITS posts per hour, SOCIAL_RATE_BURST in a row),
+shared with the fan-out SocialPublisher so both draw on one budget.
+A throttled platform therefore never holds up the others. The loop sleeps
+until the next post is due, the next token is available, or a vault event
+says a queue folder changed. Without events it only stats the folders every
+SOCIAL_RESCAN_INTERVAL s, and it reads a post's frontmatter only when the
+file is new or has changed.
+
+Publishing and archiving are left to each poster's create_action_file(), so
+DRY_RUN and the Done/*_posted naming work as before.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from datetime import date, datetime
+from functools import partial
+from pathlib import Path
+
+from watchers.config import Config
+from watchers.social_publisher import parse_post, poster_classes
+from watchers.vault_events import VaultEvent, get_bus
+
+QUEUE_DIRS = {
+    "linkedin": "linkedin_queue",
+    "twitter": "twitter_queue",
+    "facebook": "facebook_queue",
+}
+
+PRIORITY_RANK = {"urgent": 0, "high": 1, "normal": 2, "medium": 2, "low": 3}
+DEFAULT_RANK = PRIORITY_RANK["normal"]
+
+
+def priority_rank(value) -> int:
+    """Sort key for a `priority:` value; lower is posted first."""
+    if isinstance(value, bool):
+        return DEFAULT_RANK
+    if isinstance(value, int):
+        return value
+    return PRIORITY_RANK.get(str(value).strip().lower(), DEFAULT_RANK)
+
+
+def due_time(value, default: float) -> float:
+    """Epoch seconds for a `scheduled_at:` value (YAML datetime / date or ISO string)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return default
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    return default
+
+
+class TokenBucket:
+    """`rate_per_hour` tokens per hour, holding at most `burst`; one token per post."""
+
+    def __init__(self, rate_per_hour: float, burst: int = 1, now: float = 0.0):
+        self.rate = rate_per_hour / 3600.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = now
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def available_at(self, now: float) -> float:
+        """Earliest time a token can be taken (now if one is available)."""
+        with self._lock:
+            self._refill(now)
+            if self.tokens >= 1:
+                return now
+            if self.rate <= 0:
+                return float("inf")
+            return now + (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> bool:
+        with self._lock:
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(platform: str) -> TokenBucket:
+    """The process-wide SOCIAL_RATE_LIMITS bucket for a platform, on the wall clock."""
+    with _buckets_lock:
+        bucket = _buckets.get(platform)
+        if bucket is None:
+            rate = Config.SOCIAL_RATE_LIMITS.get(platform, 0) or float("inf")
+            bucket = _buckets[platform] = TokenBucket(rate, Config.SOCIAL_RATE_BURST, time.time())
+        return bucket
+
+
+class PostScheduler:
+    """Heap-ordered, token-bucket-limited publisher for Plans/<platform>_queue."""
+
+    def __init__(self, vault_path: Path | None = None, platforms=None, clock=time.time,
+                 rate_limits: dict | None = None, burst: int | None = None):
+        self.vault_path = Path(vault_path or Config.VAULT_PATH)
+        self.clock = clock
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.queue_dirs = {
+            platform: self.vault_path / "Plans" / QUEUE_DIRS[platform]
+            for platform in (platforms or QUEUE_DIRS)
+        }
+        for folder in self.queue_dirs.values():
+            folder.mkdir(parents=True, exist_ok=True)
+
+        if rate_limits is None and burst is None:
+            self.buckets = {platform: get_bucket(platform) for platform in self.queue_dirs}
+        else:
+            limits = rate_limits if rate_limits is not None else Config.SOCIAL_RATE_LIMITS
+            burst = burst if burst is not None else Config.SOCIAL_RATE_BURST
+            now = clock()
+            self.buckets = {
+                platform: TokenBucket(limits.get(platform, 0) or float("inf"), burst, now)
+                for platform in self.queue_dirs
+            }
+
+        self._waiting: list[tuple] = []                    # (due, rank, seq, platform, path, mtime_ns)
+        self._ready: dict[str, list[tuple]] = {p: [] for p in self.queue_dirs}  # (rank, due, seq, path, mtime_ns)
+        self._known: dict[str, dict[Path, int]] = {p: {} for p in self.queue_dirs}
+        self._dir_mtimes: dict[str, int] = {}
+        self._seq = 0
+        self._next_scan = 0.0
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+        self._classes = poster_classes()
+        self._posters: dict = {}
+        self.posted = 0
+
+    # ------------------------------------------------------------------ #
+    #  Main loop                                                            #
+    # ------------------------------------------------------------------ #
+
+    def run(self) -> None:
+        self.logger.info(f"Post scheduler started for {', '.join(self.queue_dirs)}")
+        bus = get_bus()
+        for platform, folder in self.queue_dirs.items():
+            bus.subscribe(folder, "*.md", partial(self._on_event, platform))
+        while not self._stop.is_set():
+            now = self.clock()
+            try:
+                if now >= self._next_scan or self._wake.is_set():
+                    self._wake.clear()
+                    self.scan()
+                    self._next_scan = now + Config.SOCIAL_RESCAN_INTERVAL
+                item = self.next_post(now)
+                if item is not None:
+                    self._dispatch(*item)
+                    continue
+                wake = self.next_wake(now)
+            except Exception as e:
+                self.logger.error(f"Post scheduler error: {e}", exc_info=True)
+                wake = None
+            deadline = self._next_scan if wake is None else min(wake, self._next_scan)
+            self._wake.wait(max(0.0, deadline - now))
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _on_event(self, platform: str, event: VaultEvent) -> None:
+        # Forget the folder mtime so the next scan lists it even if the
+        # change landed within the same timestamp tick as the last one
+        self._dir_mtimes.pop(platform, None)
+        self._wake.set()
+
+    # ------------------------------------------------------------------ #
+    #  Queue maintenance                                                    #
+    # ------------------------------------------------------------------ #
+
+    def scan(self) -> int:
+        """Pick up new, changed and removed posts in folders whose mtime moved."""
+        added = 0
+        for platform, folder in self.queue_dirs.items():
+            try:
+                mtime = folder.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self._dir_mtimes.get(platform) == mtime:
+                continue
+            self._dir_mtimes[platform] = mtime
+            known = self._known[platform]
+            present = set(folder.glob("*.md"))
+            for path in known.keys() - present:
+                del known[path]  # removed by hand; its heap entry is skipped on pop
+            for path in present - known.keys():
+                added += self._enqueue(platform, path)
+        if added:
+            self.logger.info(f"Queued {added} new post(s); {self.pending()} pending")
+        return added
+
+    def _enqueue(self, platform: str, path: Path) -> int:
+        try:
+            mtime = path.stat().st_mtime_ns
+            meta, _ = parse_post(path)
+        except (FileNotFoundError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Skipping unreadable post {path.name}: {e}")
+            return 0
+        self.add(platform, path, priority_rank(meta.get("priority")),
+                 due_time(meta.get("scheduled_at"), default=0.0), mtime)
+        return 1
+
+    def add(self, platform: str, path: Path, rank: int, due: float, mtime_ns: int = 0) -> None:
+        """Queue one post; it becomes ready once `due` has passed."""
+        self._seq += 1
+        self._known[platform][path] = mtime_ns
+        heapq.heappush(self._waiting, (due, rank, self._seq, platform, path, mtime_ns))
+
+    def pending(self) -> int:
+        return sum(len(known) for known in self._known.values())
+
+    def _promote(self, now: float) -> None:
+        while self._waiting and self._waiting[0][0] <= now:
+            due, rank, seq, platform, path, mtime = heapq.heappop(self._waiting)
+            heapq.heappush(self._ready[platform], (rank, due, seq, path, mtime))
+
+    def _current(self, platform: str, path: Path, mtime: int) -> bool:
+        """False for entries whose file was removed or edited since it was queued."""
+        known = self._known[platform]
+        if known.get(path) != mtime:
+            return False
+        try:
+            on_disk = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            del known[path]
+            return False
+        if on_disk != mtime:
+            del known[path]
+            self._enqueue(platform, path)  # re-read priority / scheduled_at
+            return False
+        return True
+
+    # ------------------------------------------------------------------ #
+    #  Scheduling                                                           #
+    # ------------------------------------------------------------------ #
+
+    def next_post(self, now: float) -> tuple[str, Path] | None:
+        """Highest-priority due post on a platform with a free token, or None."""
+        self._promote(now)
+        while True:
+            best = None
+            for platform, heap in self._ready.items():
+                if not heap or self.buckets[platform].available_at(now) > now:
+                    continue
+                if best is None or heap[0] < self._ready[best][0]:
+                    best = platform
+            if best is None:
+                return None
+            entry = heapq.heappop(self._ready[best])
+            _, _, _, path, mtime = entry
+            if self._current(best, path, mtime):
+                if not self.buckets[best].take(now):
+                    # The SocialPublisher took the token first; wait for the next one
+                    heapq.heappush(self._ready[best], entry)
+                    continue
+                del self._known[best][path]
+                return best, path
+            self._promote(now)
+
+    def next_wake(self, now: float) -> float | None:
+        """When next_post() could next return something, or None if nothing is queued."""
+        times = [self._waiting[0][0]] if self._waiting else []
+        times += [
+            self.buckets[platform].available_at(now)
+            for platform, heap in self._ready.items() if heap
+        ]
+        return min(times) if times else None
+
+    def _dispatch(self, platform: str, path: Path) -> None:
+        try:
+            poster = self._posters.get(platform)
+            if poster is None:
+                poster = self._posters[platform] = self._classes[platform]()
+            poster.create_action_file(path)
+            self.posted += 1
+        except Exception as e:
+            self.logger.error(f"{platform} post {path.name} failed: {e}", exc_info=True)
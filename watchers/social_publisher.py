@@ -0,0 +1,164 @@
+"""
+Social Publisher - Gold Tier
+Publishes one queued post to several social platforms at once.
+
+The per-platform posters each poll their own Plans/*_queue folder every
+300 s, one item at a time, so the same announcement could land on three
+networks up to 15 minutes apart. A post dropped in Plans/social_queue/ names
+its targets in frontmatter:
+
+    ---
+    platforms: [linkedin, twitter, facebook]
+    ---
+    We just shipped ...
+
+All targets are published concurrently. Each one first takes a token from
+the platform's SOCIAL_RATE_LIMITS bucket, the same bucket the PostScheduler
+uses, and waits if the platform is throttled. Per-platform results and the
+total wall time go to the audit log as one social_publish entry.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from watchers.audit_log import append_entry
+from watchers.base_watcher import BaseWatcher
+from watchers.config import Config
+from watchers.vault_meta import read_body, read_frontmatter
+
+
+def poster_classes() -> dict:
+    # Imported lazily: each poster registers a pooled browser when constructed
+    from watchers.facebook_poster import FacebookPoster
+    from watchers.linkedin_poster import LinkedInPoster
+    from watchers.twitter_poster import TwitterPoster
+    return {"linkedin": LinkedInPoster, "twitter": TwitterPoster, "facebook": FacebookPoster}
+
+
+def parse_post(post_file: Path) -> tuple[dict, str]:
+    """Frontmatter dict and body text of a queued post."""
+    return read_frontmatter(post_file, typed=True), read_body(post_file)
+
+
+def target_platforms(meta: dict) -> list[str]:
+    """`platforms:` as a YAML list or a comma-separated string, lowercased and de-duplicated."""
+    value = meta.get("platforms") or []
+    if isinstance(value, str):
+        value = value.split(",")
+    return list(dict.fromkeys(str(p).strip().lower() for p in value if str(p).strip()))
+
+
+class SocialPublisher(BaseWatcher):
+
+    def __init__(self):
+        super().__init__(
+            vault_path=Config.VAULT_PATH,
+            check_interval=Config.SOCIAL_CHECK_INTERVAL,
+        )
+        self.queue_dir = self.vault_path / "Plans" / "social_queue"
+        self.posted_dir = self.vault_path / "Done" / "social_posted"
+        for folder in [self.queue_dir, self.posted_dir]:
+            folder.mkdir(parents=True, exist_ok=True)
+
+        self._classes = poster_classes()
+        self._posters: dict = {}
+        self._posters_lock = threading.Lock()
+        # Imported lazily: post_scheduler imports this module
+        from watchers.post_scheduler import get_bucket
+        self._buckets = {platform: get_bucket(platform) for platform in self._classes}
+        # Posts are published one at a time, so one thread per platform is enough
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._classes),
+            thread_name_prefix="SocialPublish",
+        )
+
+    def wake_folders(self) -> list[Path]:
+        return [self.queue_dir]
+
+    def check_for_updates(self) -> list:
+        posts = sorted(self.queue_dir.glob("*.md"))
+        if posts:
+            self.logger.info(f"Found {len(posts)} post(s) in social queue")
+        return posts
+
+    def create_action_file(self, post_file: Path) -> Path:
+        meta, text = parse_post(post_file)
+        platforms = target_platforms(meta)
+        unknown = [p for p in platforms if p not in self._classes]
+        targets = [p for p in platforms if p in self._classes]
+
+        start = time.perf_counter()
+        futures = {p: self._executor.submit(self._publish_one, p, text) for p in targets}
+        results = {p: future.result() for p, future in futures.items()}
+        results.update({p: {"result": "unknown_platform", "duration_ms": 0} for p in unknown})
+        wall_ms = int((time.perf_counter() - start) * 1000)
+
+        ok = [p for p, r in results.items() if r["result"] in ("posted", "dry_run")]
+        if not results:
+            status = "no_platforms"
+        elif len(ok) == len(results):
+            status = "dry_run" if Config.DRY_RUN else "posted"
+        else:
+            status = "partial" if ok else "failed"
+
+        append_entry(self.logs, {
+            "timestamp": datetime.now().isoformat(),
+            "action_type": "social_publish",
+            "actor": self.__class__.__name__,
+            "target": post_file.name,
+            "platforms": results,
+            "wall_ms": wall_ms,
+            "result": status,
+        })
+        self.logger.info(
+            f"Published {post_file.name} [{status}] in {wall_ms} ms: "
+            + ", ".join(f"{p}={r['result']} ({r['duration_ms']} ms)" for p, r in results.items())
+        )
+        return self._archive_post(post_file, status)
+
+    def _poster(self, platform: str):
+        with self._posters_lock:
+            if platform not in self._posters:
+                self._posters[platform] = self._classes[platform]()
+            return self._posters[platform]
+
+    def _publish_one(self, platform: str, text: str) -> dict:
+        waited_ms = self._wait_for_token(platform)
+        start = time.perf_counter()
+        if Config.DRY_RUN:
+            self.logger.info(f"[DRY RUN] Would post to {platform}: {text[:100]}...")
+            result = "dry_run"
+        else:
+            try:
+                result = "posted" if self._poster(platform).publish(text) else "failed"
+            except Exception as e:
+                self.logger.error(f"{platform} publish error: {e}", exc_info=True)
+                result = f"error: {e}"
+        return {
+            "result": result,
+            "duration_ms": int((time.perf_counter() - start) * 1000),
+            "waited_ms": waited_ms,
+        }
+
+    def _wait_for_token(self, platform: str) -> int:
+        """Block until the platform's rate bucket gives a token; returns ms waited."""
+        bucket = self._buckets[platform]
+        start = time.time()
+        while not bucket.take(time.time()):
+            now = time.time()
+            wait = bucket.available_at(now) - now
+            if wait == float("inf"):
+                wait = Config.SOCIAL_RESCAN_INTERVAL
+            self.logger.info(f"{platform} is rate limited; waiting {wait:.0f} s")
+            time.sleep(max(0.0, wait))
+        return int((time.time() - start) * 1000)
+
+    def _archive_post(self, post_file: Path, status: str) -> Path:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        dest = self.posted_dir / f"{post_file.stem}_{status}_{timestamp}.md"
+        post_file.rename(dest)
+        self.logger.info(f"Archived [{status}]: {dest.name}")
+        return dest
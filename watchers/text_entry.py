@@ -0,0 +1,128 @@
+"""
+Text Entry - Gold Tier
+Fast, verified text entry into web compose boxes.
+
+Typing a post one key at a time (keyboard.type with a 30 ms delay, plus
+slow_mo) takes 20+ s for a full tweet. enter_text() tries faster strategies
+in order and reads the box back after each one, moving on if the text did
+not land:
+
+    insert_text  one CDP Input.insertText call, the way an IME commits text
+    paste        a synthetic ClipboardEvent carrying the text, which
+                 React / Draft.js editors handle like a real paste; the
+                 system clipboard is not touched and needs no permission
+    fill         Playwright's fill() (sets value / contenteditable content)
+    type         per-keystroke typing, used only when all of the above fail
+
+Each attempt is timed into the caller's FlowTimer as "text_<strategy>", and
+per-strategy success counts are kept for stats().
+"""
+
+import threading
+import time
+
+from watchers.config import Config
+
+TYPE_DELAY_MS = 30
+
+_PASTE_JS = """(el, text) => {
+    el.focus();
+    const data = new DataTransfer();
+    data.setData("text/plain", text);
+    el.dispatchEvent(new ClipboardEvent("paste", {clipboardData: data, bubbles: true, cancelable: true}));
+}"""
+_READ_JS = "el => el.isContentEditable ? el.innerText : el.value"
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, float]] = {}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _insert_text(page, box, text: str) -> None:
+    box.click()
+    page.keyboard.insert_text(text)
+
+
+def _paste(page, box, text: str) -> None:
+    box.click()
+    box.evaluate(_PASTE_JS, text)
+
+
+def _fill(page, box, text: str) -> None:
+    box.fill(text)
+
+
+def _type(page, box, text: str) -> None:
+    box.click()
+    page.keyboard.type(text, delay=TYPE_DELAY_MS)
+
+
+STRATEGIES = {
+    "insert_text": _insert_text,
+    "paste": _paste,
+    "fill": _fill,
+    "type": _type,
+}
+
+
+def _clear(page, box) -> None:
+    box.click()
+    page.keyboard.press("ControlOrMeta+A")
+    page.keyboard.press("Delete")
+
+
+def _record(strategy: str, ok: bool, elapsed_ms: float) -> None:
+    with _stats_lock:
+        entry = _stats.setdefault(strategy, {"ok": 0, "failed": 0, "total_ms": 0.0})
+        entry["ok" if ok else "failed"] += 1
+        entry["total_ms"] += elapsed_ms
+
+
+def enter_text(page, box, text: str, logger, timer=None, strategies: list[str] | None = None) -> str | None:
+    """
+    Put text into box (a Locator / ElementHandle for an input, textarea or
+    contenteditable) and confirm it by reading the box back.
+    Returns the strategy that worked, or None if even typing failed.
+    """
+    if strategies is None:
+        strategies = Config.TEXT_ENTRY_STRATEGIES
+    order = [s for s in strategies if s in STRATEGIES and s != "type"]
+    order.append("type")  # last resort, always available
+    wanted = _normalize(text)
+
+    for strategy in order:
+        start = time.perf_counter()
+        try:
+            STRATEGIES[strategy](page, box, text)
+            landed = _normalize(box.evaluate(_READ_JS)) == wanted
+        except Exception as e:
+            logger.debug(f"Text entry via {strategy} raised: {e}")
+            landed = False
+        elapsed = (time.perf_counter() - start) * 1000
+        _record(strategy, landed, elapsed)
+        if timer is not None:
+            timer.record(f"text_{strategy}", elapsed)
+        if landed:
+            return strategy
+        logger.info(f"Text entry via {strategy} did not land; trying next strategy")
+        try:
+            _clear(page, box)
+        except Exception:
+            pass
+    return None
+
+
+def stats() -> dict:
+    """Per-strategy success / failure counts and average time."""
+    with _stats_lock:
+        return {
+            name: {
+                "ok": int(entry["ok"]),
+                "failed": int(entry["failed"]),
+                "avg_ms": round(entry["total_ms"] / (entry["ok"] + entry["failed"]), 1),
+            }
+            for name, entry in _stats.items()
+        }
@@ -2,22 +2,30 @@
 Twitter/X Poster - Gold Tier
 Auto-posts to Twitter/X using Playwright (browser automation).
 No API cost - uses web interface directly.
-Session managed via cookies.json — refresh manually when expired.
+Session managed via cookies.json — refresh manually when expired
+(watchers/cookie_session.py caches it and checks it before each post).
 """
 
-import json
-import os
-import time
 from datetime import datetime
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
 from watchers.base_watcher import BaseWatcher
+from watchers.browser_pool import get_pool
+from watchers.browser_waits import FlowTimer, condition, selector
 from watchers.config import Config
+from watchers.cookie_session import CookieJar
+from watchers.route_policy import policy_for
+from watchers.text_entry import enter_text
+from watchers.vault_meta import read_body
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 SESSION_PATH = Config.TWITTER_SESSION_PATH
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--host-resolver-rules=MAP x.com 172.66.0.227, MAP twitter.com 172.66.0.227",
+]
 
 
 class TwitterPoster(BaseWatcher):
@@ -33,6 +41,19 @@ class TwitterPoster(BaseWatcher):
         self.queue_path.mkdir(parents=True, exist_ok=True)
         self.posted_path.mkdir(parents=True, exist_ok=True)
         self.session_path.mkdir(parents=True, exist_ok=True)
+        self.cookie_jar = CookieJar("twitter", self.session_path, self.logger)
+        get_pool().register(
+            "twitter",
+            self.session_path,
+            args=BROWSER_ARGS,
+            user_agent=USER_AGENT,
+            slow_mo=Config.BROWSER_SLOW_MO,
+            route_policy=policy_for("twitter"),
+            logger=self.logger,
+        )
+
+    def wake_folders(self) -> list[Path]:
+        return [self.queue_path]
 
     def check_for_updates(self) -> list:
         posts = list(self.queue_path.glob("*.md"))
@@ -40,28 +61,23 @@ class TwitterPoster(BaseWatcher):
         return posts
 
     def create_action_file(self, item: Path) -> Path:
-        tweet_text = self._extract_post_text(item)
-        if len(tweet_text) > 250:
-            tweet_text = tweet_text[:247] + "..."
+        tweet_text = read_body(item)
 
         if Config.DRY_RUN:
-            self.logger.info(f"[DRY RUN] Would tweet: {tweet_text[:100]}...")
+            self.logger.info(f"[DRY RUN] Would tweet: {self._fit(tweet_text)[:100]}...")
             return self._archive_post(item, "dry_run")
 
-        success = self._post_tweet(tweet_text)
+        success = self.publish(tweet_text)
         status = "posted" if success else "failed"
         return self._archive_post(item, status)
 
-    def _extract_post_text(self, post_file: Path) -> str:
-        raw = post_file.read_text()
-        lines = raw.splitlines()
-        if lines and lines[0].strip() == "---":
-            try:
-                end = lines.index("---", 1)
-                lines = lines[end + 1:]
-            except ValueError:
-                pass
-        return "\n".join(lines).strip()
+    def publish(self, text: str) -> bool:
+        """Tweet text now, trimmed to fit (used by the queue above and by SocialPublisher)."""
+        return self._post_tweet(self._fit(text))
+
+    @staticmethod
+    def _fit(text: str) -> str:
+        return text[:247] + "..." if len(text) > 250 else text
 
     def _archive_post(self, post_file: Path, status: str) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
@@ -71,140 +87,84 @@ class TwitterPoster(BaseWatcher):
         return dest
 
     def _load_cookies(self) -> list:
-        cookies_file = self.session_path / "cookies.json"
-        if not cookies_file.exists():
+        if not self.cookie_jar.cookies_file.exists():
             self.logger.error("No cookies.json found! Run session setup first.")
             return []
-        with open(cookies_file) as f:
-            cookies_data = json.load(f)
-        pw_cookies = []
-        for c in cookies_data:
-            cookie = {
-                "name": c["name"], "value": c["value"],
-                "domain": c.get("domain", ".x.com"),
-                "path": c.get("path", "/"),
-                "secure": c.get("secure", False),
-                "httpOnly": c.get("httpOnly", False),
-            }
-            if c.get("expirationDate"):
-                cookie["expires"] = int(c["expirationDate"])
-            elif c.get("expires") and c["expires"] > 0:
-                cookie["expires"] = int(c["expires"])
-            pw_cookies.append(cookie)
-        return pw_cookies
+        return self.cookie_jar.cookies()
 
     def _save_cookies(self, browser) -> None:
-        cookies = browser.cookies()
-        cookies_file = self.session_path / "cookies.json"
-        with open(cookies_file, "w") as f:
-            json.dump(cookies, f, indent=2)
-        self.logger.info(f"Session saved: {len(cookies)} cookies")
+        self.cookie_jar.save(browser)
 
     def _post_tweet(self, text: str) -> bool:
         try:
             pw_cookies = self._load_cookies()
             if not pw_cookies:
                 return False
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    str(self.session_path),
-                    headless=not bool(os.environ.get("DISPLAY")),
-                    args=[
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",
-                        "--host-resolver-rules=MAP x.com 172.66.0.227, MAP twitter.com 172.66.0.227",
-                    ],
-                    user_agent=USER_AGENT,
-                    slow_mo=80,
-                )
-
-                browser.add_cookies(pw_cookies)
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                page.goto("https://x.com/home", wait_until="domcontentloaded")
-                self.logger.info("Waiting for X/Twitter to load...")
-                time.sleep(20)
-
-                self.logger.info(f"Page title: {page.title()}")
-
-                # Session expired check
-                if "login" in page.url.lower() or "i/flow" in page.url.lower():
-                    self.logger.error("Session expired! Please refresh cookies.json manually.")
-                    browser.close()
-                    return False
-
-                # Find tweet box
-                tweet_box = None
-                for selector in [
-                    '[data-testid="tweetTextarea_0"]',
-                    '[aria-label="Post text"]',
-                    '[placeholder="What is happening?!"]',
-                ]:
-                    tweet_box = page.query_selector(selector)
-                    if tweet_box:
-                        self.logger.info(f"Tweet box found: {selector}")
-                        break
-
-                if not tweet_box:
-                    self.logger.error("Tweet box not found!")
-                    page.screenshot(path="/tmp/twitter_debug.png")
-                    browser.close()
-                    return False
-
-                # Click and type
-                tweet_box.click()
-                time.sleep(2)
-                self.logger.info("Typing tweet via keyboard...")
-                page.keyboard.type(text, delay=30)
-                time.sleep(3)
-
-                # Verify text entered
-                content = tweet_box.inner_text().strip()
-                self.logger.info(f"Tweet box content: '{content[:80]}'")
-
-                if not content:
-                    self.logger.error("Text not entered in tweet box!")
-                    page.screenshot(path="/tmp/twitter_debug.png")
-                    browser.close()
-                    return False
-
-                # Submit via Ctrl+Enter
-                self.logger.info("Submitting tweet via Ctrl+Enter...")
-                page.keyboard.press("Control+Enter")
-                time.sleep(3)
-
-                # Verify submission
-                submitted = False
-                for i in range(20):
-                    time.sleep(1)
-                    try:
-                        box = page.query_selector('[data-testid="tweetTextarea_0"]')
-                        if box:
-                            content = box.inner_text().strip()
-                            self.logger.info(f"Wait {i+1}s: box='{content[:50]}'")
-                            if content == "":
-                                self.logger.info("Tweet box empty — submitted!")
-                                submitted = True
-                                break
-                        else:
-                            self.logger.info("Tweet box gone — submitted!")
-                            submitted = True
-                            break
-                    except Exception:
-                        submitted = True
-                        break
-
-                if not submitted:
-                    self.logger.error("Tweet submission failed!")
-                    browser.close()
-                    return False
-
-                self._save_cookies(browser)
-                self.logger.info("Tweet posted successfully!")
-                browser.close()
-                return True
-
+            expired = self.cookie_jar.check()
+            if expired:
+                self.logger.error(f"Session expired ({expired})! Please refresh cookies.json manually.")
+                return False
+            return get_pool().run("twitter", lambda page: self._publish(page, text, pw_cookies))
         except Exception as e:
             self.logger.error(f"Twitter post error: {e}", exc_info=True)
-            return False
\ No newline at end of file
+            return False
+
+    def _publish(self, page, text: str, pw_cookies: list) -> bool:
+        """Runs on the pooled Twitter browser's thread."""
+        timer = FlowTimer("twitter_post", self.logger)
+        try:
+            browser = page.context
+            browser.add_cookies(pw_cookies)
+            page.goto("https://x.com/home", wait_until="domcontentloaded")
+            self.logger.info("Waiting for X/Twitter to load...")
+
+            # Find tweet box (never appears on the login flow)
+            tweet_box = timer.optional(page, selector(
+                "tweet_box",
+                '[data-testid="tweetTextarea_0"]',
+                '[aria-label="Post text"]',
+                '[placeholder="What is happening?!"]',
+            ))
+            self.logger.info(f"Page title: {page.title()}")
+
+            # Session expired check
+            if "login" in page.url.lower() or "i/flow" in page.url.lower():
+                self.logger.error("Session expired! Please refresh cookies.json manually.")
+                self.cookie_jar.mark_expired(f"redirected to {page.url}")
+                return False
+
+            if not tweet_box:
+                self.logger.error("Tweet box not found!")
+                page.screenshot(path="/tmp/twitter_debug.png")
+                return False
+
+            # Enter text: fast strategies first, each verified by reading the box back
+            strategy = enter_text(page, tweet_box, text, self.logger, timer)
+            if not strategy:
+                self.logger.error("Text not entered in tweet box!")
+                page.screenshot(path="/tmp/twitter_debug.png")
+                return False
+            self.logger.info(f"Tweet text entered via {strategy}")
+
+            # Submit via Ctrl+Enter
+            self.logger.info("Submitting tweet via Ctrl+Enter...")
+            page.keyboard.press("Control+Enter")
+
+            # Verify submission: the box empties or goes away once X accepts the post
+            submitted = timer.optional(page, condition(
+                "submitted",
+                """() => {
+                    const box = document.querySelector('[data-testid="tweetTextarea_0"]');
+                    return !box || box.innerText.trim() === "";
+                }""",
+                timeout=20,
+            ))
+            if not submitted:
+                self.logger.error("Tweet submission failed!")
+                return False
+
+            self._save_cookies(browser)
+            self.logger.info("Tweet posted successfully!")
+            return True
+        finally:
+            timer.log()
@@ -0,0 +1,219 @@
+"""
+Vault Events - Gold Tier
+One process-wide file event bus for the vault folders.
+
+PlanCreator, HITL, the social queues and the cloud orchestrator each used
+to glob their folders on a timer (every 10 s to 300 s). A new file therefore
+waited half an interval on average, and an idle vault was still listed
+thousands of times an hour. Components now subscribe to the folders they
+care about:
+
+    bus = get_bus()
+    bus.subscribe(Config.NEEDS_ACTION, "*.md", on_event)
+
+and on_event(VaultEvent) is called a few milliseconds after a matching file
+appears or goes away. Events are seen from the subscribed folder:
+
+    created   a file was written into the folder
+    moved     a file was renamed within the folder or moved into it
+              (path is the new name, src_path the old one)
+    deleted   a file was removed, or moved out of the folder
+
+Each folder gets one non-recursive watchdog watch (inotify on Linux), however
+many subscribers it has. With inotify, a file that is still empty when it
+is created is reported once its writer closes it, so a subscriber does not
+read a note before write_text() has filled it. Files moved in arrive
+complete and are reported at once. If the kernel refuses a watch (inotify limits), or
+VAULT_EVENTS_MODE=polling (network shares, some container mounts), that
+folder is polled every VAULT_POLL_INTERVAL s instead. Callbacks run on the
+observer thread and should only queue work or set an Event. Subscribers still
+do a full rescan every VAULT_RESCAN_INTERVAL s, which covers files that
+existed before they started and any event the kernel dropped.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Iterable
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
+
+from watchers.config import Config
+
+logger = logging.getLogger("VaultEventBus")
+
+
+@dataclass(frozen=True)
+class VaultEvent:
+    kind: str                     # created | moved | deleted
+    path: Path
+    src_path: Path | None = None  # previous name, for moves
+
+
+@dataclass(frozen=True)
+class Subscription:
+    folder: Path
+    patterns: tuple[str, ...]
+    callback: Callable[[VaultEvent], None]
+
+    def matches(self, path: Path) -> bool:
+        return path.parent == self.folder and any(fnmatch(path.name, p) for p in self.patterns)
+
+
+def _empty(path: Path) -> bool:
+    try:
+        return path.stat().st_size == 0
+    except OSError:
+        return False
+
+
+class _Dispatcher(FileSystemEventHandler):
+    def __init__(self, bus: "VaultEventBus"):
+        self.bus = bus
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in ("created", "closed", "moved", "deleted"):
+            return
+        dest = Path(event.dest_path) if event.event_type == "moved" else None
+        self.bus.publish(event.event_type, Path(event.src_path), dest)
+
+
+class VaultEventBus:
+    """Folder + filename-pattern subscriptions over watchdog observers."""
+
+    def __init__(self, mode: str | None = None, poll_interval: float | None = None):
+        self.mode = (mode or Config.VAULT_EVENTS_MODE).lower()
+        self.poll_interval = poll_interval or Config.VAULT_POLL_INTERVAL
+        self._dispatcher = _Dispatcher(self)
+        self._lock = threading.Lock()
+        self._subs: dict[Path, list[Subscription]] = {}
+        self._polled: set[Path] = set()
+        self._close_events = False           # native observer reports close-after-write (inotify)
+        self._writing: set[Path] = set()     # created empty, not yet closed
+        self._native: BaseObserver | None = None
+        self._polling: BaseObserver | None = None
+        self.events = 0
+        self.delivered = 0
+        self.errors = 0
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                           #
+    # ------------------------------------------------------------------ #
+
+    def subscribe(self, folder: Path, patterns: str | Iterable[str],
+                  callback: Callable[[VaultEvent], None]) -> Subscription:
+        """Call callback(VaultEvent) for files in folder whose names match a pattern."""
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        folder = folder.resolve()
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        sub = Subscription(folder, tuple(patterns), callback)
+        with self._lock:
+            if folder not in self._subs:
+                self._watch(folder)
+                self._subs[folder] = []
+            self._subs[folder].append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.folder, [])
+            if sub in subs:
+                subs.remove(sub)
+
+    def publish(self, kind: str, path: Path, dest: Path | None = None) -> None:
+        """Route one raw file event to the subscriptions it concerns."""
+        deliveries = []
+        with self._lock:
+            self.events += 1
+            if kind == "created" and self._close_events and path.parent not in self._polled and _empty(path):
+                self._writing.add(path)
+                return
+            if kind == "closed":
+                if path not in self._writing:
+                    return  # an existing file rewritten in place
+                self._writing.discard(path)
+                kind = "created"
+            else:
+                self._writing.discard(path)
+            folders = {path.parent} if dest is None else {path.parent, dest.parent}
+            subs = [s for folder in folders for s in self._subs.get(folder, ())]
+        for sub in subs:
+            if dest is not None and sub.matches(dest):
+                deliveries.append((sub, VaultEvent("moved", dest, path)))
+            elif sub.matches(path):
+                deliveries.append((sub, VaultEvent("deleted" if dest is not None else kind, path)))
+        for sub, event in deliveries:
+            try:
+                sub.callback(event)
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Vault event subscriber failed on {event.path.name}: {e}", exc_info=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            observer = self._native or self._polling
+            return {
+                "backend": type(observer).__name__ if observer else "none",
+                "watched": len(self._subs) - len(self._polled),
+                "polled": len(self._polled),
+                "subscriptions": sum(len(s) for s in self._subs.values()),
+                "events": self.events,
+                "delivered": self.delivered,
+                "errors": self.errors,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            observers = [o for o in (self._native, self._polling) if o is not None]
+            self._native = self._polling = None
+            self._subs.clear()
+            self._polled.clear()
+            self._writing.clear()
+        for observer in observers:
+            observer.stop()
+        for observer in observers:
+            observer.join(timeout=5)
+
+    # ------------------------------------------------------------------ #
+    #  Observers (lock held)                                                #
+    # ------------------------------------------------------------------ #
+
+    def _watch(self, folder: Path) -> None:
+        if self.mode != "polling":
+            try:
+                if self._native is None:
+                    self._native = Observer()
+                    self._native.daemon = True
+                    self._native.start()
+                    self._close_events = type(self._native).__name__ == "InotifyObserver"
+                self._native.schedule(self._dispatcher, str(folder), recursive=False)
+                return
+            except OSError as e:
+                logger.warning(f"Native watch on {folder} failed ({e}); polling it every {self.poll_interval:g}s")
+        if self._polling is None:
+            self._polling = PollingObserver(timeout=self.poll_interval)
+            self._polling.daemon = True
+            self._polling.start()
+        self._polling.schedule(self._dispatcher, str(folder), recursive=False)
+        self._polled.add(folder)
+
+
+_bus: VaultEventBus | None = None
+_bus_lock = threading.Lock()
+
+
+def get_bus() -> VaultEventBus:
+    """The process-wide bus shared by every vault watcher."""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = VaultEventBus()
+        return _bus
@@ -0,0 +1,124 @@
+"""
+Vault Meta - Gold Tier
+Shared frontmatter reader for vault notes.
+
+PlanCreator, HITL, the social publisher and each poster had their own copy
+of the frontmatter parser. Every copy read the whole note with read_text()
+and split all of it into lines, only to look at the header, and it did so
+on every pass. This module replaces them:
+
+    read_frontmatter(path)              {"type": "email", "priority": "high", ...}
+    read_frontmatter(path, typed=True)  YAML-typed values (ints, dates, lists)
+    read_body(path)                     text after the closing ---
+
+Only the header is read: the file is streamed line by line up to the
+closing "---" (at most MAX_HEADER_BYTES), so a note with a large body costs
+the same as a short one. Results are cached by (path, mtime, size). An
+unchanged note is a single stat().
+
+Two readers, because the notes are written two ways:
+- Action and approval files are written with raw values (`subject: Re:
+  Invoice #42`, `phone: +92300...`). The default reader keeps the
+  line-based `key: value` rule those files were written for, and every
+  value is a string. A YAML parse would end the subject at " #" and turn
+  the phone number into an int.
+- Queued social posts are YAML (`priority: 1`, `scheduled_at: 2026-05-01`,
+  `platforms: [x, y]`). typed=True parses them with PyYAML's libyaml C
+  loader when it is available, otherwise the pure-Python loader.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+MAX_HEADER_BYTES = 64 * 1024
+CACHE_SIZE = 16_384
+
+_cache: OrderedDict[tuple[str, bool], tuple[int, int, dict]] = OrderedDict()
+_cache_lock = threading.Lock()
+hits = misses = 0
+
+
+def read_header(path: Path) -> tuple[str | None, int]:
+    """
+    Frontmatter text (None without a closed header) and the byte offset
+    where the body starts, reading no further than the closing ---.
+    """
+    with open(path, "rb") as f:
+        first = f.readline(MAX_HEADER_BYTES)
+        if first.strip() != b"---":
+            return None, 0
+        lines = []
+        size = len(first)
+        while size < MAX_HEADER_BYTES:
+            line = f.readline(MAX_HEADER_BYTES - size)
+            if not line:
+                break
+            size += len(line)
+            if line.strip() == b"---":
+                return b"".join(lines).decode("utf-8", errors="replace"), size
+            lines.append(line)
+    return None, 0
+
+
+def _parse_lines(header: str) -> dict:
+    metadata = {}
+    for line in header.splitlines():
+        if ":" in line:
+            key, _, value = line.partition(":")
+            metadata[key.strip()] = value.strip()
+    return metadata
+
+
+def _parse_yaml(header: str) -> dict:
+    try:
+        metadata = yaml.load(header, Loader=YamlLoader) or {}
+    except yaml.YAMLError:
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def read_frontmatter(path: Path, typed: bool = False) -> dict:
+    """Frontmatter of a vault note ({} without one), cached until the file changes."""
+    global hits, misses
+    st = os.stat(path)
+    key = (os.fspath(path), typed)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _cache.move_to_end(key)
+            hits += 1
+            return dict(cached[2])
+        misses += 1
+    header, _ = read_header(path)
+    if header is None:
+        metadata = {}
+    else:
+        metadata = _parse_yaml(header) if typed else _parse_lines(header)
+    with _cache_lock:
+        _cache[key] = (st.st_mtime_ns, st.st_size, metadata)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return dict(metadata)
+
+
+def read_body(path: Path) -> str:
+    """Text after the frontmatter (the whole note without one), stripped."""
+    _, offset = read_header(path)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read().decode("utf-8", errors="replace").replace("\r\n", "\n").strip()
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return {"entries": len(_cache), "hits": hits, "misses": misses}
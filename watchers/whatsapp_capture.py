@@ -0,0 +1,180 @@
+"""
+WhatsApp Capture - Gold Tier
+Push-mode chat list capture for WhatsAppWatcher.
+
+Scraping means copying all of #pane-side into Python and re-scanning every
+line on every poll. Here a MutationObserver inside WhatsApp Web watches the
+chat list instead. When rows change it sends only those rows to Python
+through a Playwright binding, as structured records:
+
+    {"chat": ..., "message": ..., "time": ..., "unread": 3,
+     "lines": <the row's innerText lines>, "seen_at": <ms epoch>}
+
+Message IDs are not taken from the structured fields. find_urgent() builds
+them from a row's "lines" with the same parse_pane_row() / message_fingerprint()
+calls that poll mode applies to the #pane-side text, which is those rows'
+lines in order. A message therefore gets the same ID in either
+WHATSAPP_CAPTURE_MODE, and switching modes does not report it again.
+
+Binding calls are delivered while the session's worker thread is inside
+Playwright. drain() therefore pumps the page for a bounded window and
+returns as soon as a batch arrives. A new message is picked up in well under
+a second, not on the next poll interval.
+"""
+
+import threading
+import time
+
+from watchers.fingerprint import message_fingerprint, parse_pane_row
+
+BINDING_NAME = "__aiEmployeeChatRows"
+
+# Injected as an init script so it survives reloads. It waits for #pane-side,
+# re-attaches if WhatsApp replaces the pane, batches mutations per animation
+# frame and only reports rows whose text actually changed.
+OBSERVER_JS = """
+(() => {
+  if (window.top !== window || window.__aiEmployeeObserver) return;
+  window.__aiEmployeeObserver = true;
+  const BINDING = "%s";
+  const sent = new Map();
+  let pane = null, observer = null, scheduled = false;
+
+  const parseRow = (row) => {
+    const raw = row.innerText.split("\\n");
+    const lines = raw.map((s) => s.trim()).filter(Boolean);
+    if (!lines.length) return null;
+    const chat = lines[0];
+    let unread = 0;
+    if (lines.length > 2 && /^\\d{1,4}$/.test(lines[lines.length - 1])) {
+      unread = parseInt(lines.pop(), 10);
+    }
+    const rest = lines.slice(1);
+    const time = rest.length > 1 ? rest.shift() : "";
+    return { chat, time, message: rest.join(" "), unread, lines: raw };
+  };
+
+  const flush = () => {
+    scheduled = false;
+    if (!pane) return;
+    const changed = [];
+    const now = Date.now();
+    for (const row of pane.querySelectorAll('[role="listitem"], [role="row"]')) {
+      const text = row.innerText;
+      const record = parseRow(row);
+      if (!record || sent.get(record.chat) === text) continue;
+      sent.set(record.chat, text);
+      record.seen_at = now;
+      changed.push(record);
+    }
+    if (changed.length) window[BINDING](changed);
+  };
+
+  const schedule = () => {
+    if (!scheduled) { scheduled = true; requestAnimationFrame(flush); }
+  };
+
+  const attach = () => {
+    const current = document.querySelector("#pane-side");
+    if (!current || current === pane) return;
+    if (observer) observer.disconnect();
+    pane = current;
+    observer = new MutationObserver(schedule);
+    observer.observe(pane, { childList: true, subtree: true, characterData: true });
+    schedule();  // initial snapshot
+  };
+
+  setInterval(attach, 1000);
+  attach();
+})();
+""" % BINDING_NAME
+
+
+def find_urgent(key: bytes, lines: list[str], keywords, seen: set[str]) -> list[dict]:
+    """
+    Urgent messages in chat-list text: all of #pane-side (poll) or one row's
+    lines (push). IDs already in seen are skipped; new ones are added.
+    """
+    found = []
+    for i, line in enumerate(lines):
+        if not any(kw in line.lower() for kw in keywords):
+            continue
+        chat, day, text = parse_pane_row(lines, i)
+        msg_id = message_fingerprint(key, chat, day, text)
+        if msg_id in seen:
+            continue
+        seen.add(msg_id)
+        found.append({
+            "id": msg_id,
+            "chat": chat,
+            "text": "\n".join(lines[max(0, i - 2):i + 3]).strip(),
+            "matched_line": line.strip(),
+        })
+    return found
+
+
+class PaneObserver:
+    """Receives changed chat rows from the page; one per BrowserSession."""
+
+    def __init__(self, logger):
+        self.logger = logger
+        self._records: list[dict] = []
+        self._lock = threading.Lock()
+        self._installed_on = None
+        self.last_latency_ms: float | None = None
+
+    def install(self, page) -> None:
+        """Register the binding and observer (before navigation, once per page)."""
+        if self._installed_on is page:
+            return
+        page.expose_binding(BINDING_NAME, self._on_rows)
+        page.add_init_script(OBSERVER_JS)
+        self._installed_on = page
+
+    def _on_rows(self, source, rows) -> None:
+        received = time.time() * 1000
+        with self._lock:
+            self._records.extend(rows)
+        latest = max((row.get("seen_at", received) for row in rows), default=received)
+        self.last_latency_ms = max(0.0, received - latest)
+
+    def drain(self, page, window: float, settle: float = 0.25) -> list[dict]:
+        """
+        Pump page events for up to `window` seconds and return the rows
+        reported so far. Returns early, after a short settle for follow-up
+        mutations, once anything arrives.
+        """
+        deadline = time.monotonic() + window
+        while time.monotonic() < deadline:
+            with self._lock:
+                pending = bool(self._records)
+            if pending:
+                page.wait_for_timeout(settle * 1000)
+                break
+            page.wait_for_timeout(min(200, max(1, (deadline - time.monotonic()) * 1000)))
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+
+if __name__ == "__main__":
+    # Self-check: a chat row gets the same message ID in poll and push mode
+    pane_text = (
+        "Ali Traders\n10:32 AM\nURGENT: please send the invoice asap\n2\n"
+        "Sara\nYesterday\nok thanks\n"
+        "Accounts Group\nMonday\nBilal: payment is overdue"
+    )
+    rows = [
+        "Ali Traders\n10:32 AM\nURGENT: please send the invoice asap\n2",
+        "Sara\nYesterday\nok thanks",
+        "Accounts Group\nMonday\nBilal: payment is overdue",
+    ]
+    keywords = ["urgent", "invoice", "payment"]
+    key = b"k" * 32
+    polled = [m["id"] for m in find_urgent(key, pane_text.split("\n"), keywords, set())]
+    pushed_seen: set[str] = set()
+    # What OBSERVER_JS sends as "lines": row.innerText.split("\n")
+    pushed = [m["id"] for row in rows for m in find_urgent(key, row.split("\n"), keywords, pushed_seen)]
+    print(f"poll -> {polled}\npush -> {pushed}")
+    assert polled and polled == pushed, "poll and push fingerprints differ"
+    print("OK: poll and push produce the same message IDs")
@@ -4,16 +4,20 @@ Monitors WhatsApp Web for urgent messages using Playwright.
 """
 
 import json
-import os
+import logging
 import time
 import urllib.parse
 from datetime import datetime
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
 from watchers.base_watcher import BaseWatcher
+from watchers.browser_pool import get_pool
+from watchers.browser_waits import FlowTimer, condition, selector
 from watchers.config import Config
+from watchers.dedup_store import ProcessedIdStore, get_store
+from watchers.fingerprint import load_key
+from watchers.route_policy import policy_for
+from watchers.whatsapp_capture import PaneObserver, find_urgent
 
 URGENT_KEYWORDS = ["urgent", "asap", "invoice", "payment", "emergency", "important"]
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -24,6 +28,9 @@ BROWSER_ARGS = [
     "--host-resolver-rules=MAP web.whatsapp.com 157.240.227.60",
 ]
 
+# Shared like the browser session itself: every watcher instance drives the same page
+_pane_observer = PaneObserver(logging.getLogger("WhatsAppWatcher"))
+
 
 class WhatsAppWatcher(BaseWatcher):
 
@@ -32,78 +39,118 @@ class WhatsAppWatcher(BaseWatcher):
             vault_path=Config.VAULT_PATH,
             check_interval=Config.WHATSAPP_CHECK_INTERVAL,
         )
+        self.push_mode = Config.WHATSAPP_CAPTURE_MODE == "push"
+        if self.push_mode:
+            # drain() blocks for up to WHATSAPP_PUSH_WINDOW, so no extra sleep is needed
+            self.check_interval = 1
         self.session_path = Path(Config.WHATSAPP_SESSION_PATH)
         self.session_path.mkdir(parents=True, exist_ok=True)
-        self.processed_ids: set[str] = self._load_processed_ids()
-
-    def _processed_ids_file(self) -> Path:
-        return self.logs / "processed_whatsapp.json"
+        self.fingerprint_key = load_key(self.session_path / "fingerprint.key")
+        self.processed_ids = self._load_processed_ids()
+        # One long-lived, logged-in browser from the shared pool, also used by send_reply (HITL thread)
+        self.session = get_pool().register(
+            "whatsapp",
+            self.session_path,
+            on_launch=self._open_whatsapp,
+            args=BROWSER_ARGS,
+            user_agent=USER_AGENT,
+            slow_mo=Config.BROWSER_SLOW_MO,
+            route_policy=policy_for("whatsapp"),
+            max_rss_mb=Config.WHATSAPP_MAX_RSS_MB,
+            logger=self.logger,
+        )
 
-    def _load_processed_ids(self) -> set[str]:
-        f = self._processed_ids_file()
-        if f.exists():
-            return set(json.loads(f.read_text()))
-        return set()
+    def _load_processed_ids(self) -> ProcessedIdStore:
+        store = get_store(
+            self.logs, "processed_whatsapp", ttl_days=Config.PROCESSED_ID_TTL_DAYS
+        )
+        legacy_file = self.logs / "processed_whatsapp.json"
+        if legacy_file.exists():
+            store.import_legacy(legacy_file, json.loads(legacy_file.read_text()))
+        return store
 
     def _save_processed_id(self, msg_id: str) -> None:
         self.processed_ids.add(msg_id)
-        self._processed_ids_file().write_text(json.dumps(list(self.processed_ids)))
+
+    def _open_whatsapp(self, page) -> None:
+        """Cold start only: load WhatsApp Web and wait for the chat list."""
+        if self.push_mode:
+            _pane_observer.install(page)
+        timer = FlowTimer("whatsapp_open", self.logger)
+        page.goto("https://web.whatsapp.com", wait_until="domcontentloaded")
+        self.logger.info("Waiting for WhatsApp Web to load...")
+        timer.wait(page, selector("chat_list", "#pane-side", timeout=Config.WHATSAPP_READY_TIMEOUT))
+        self.logger.info(f"Page title: {page.title()}")
+        timer.log()
 
     def check_for_updates(self) -> list:
         if Config.DRY_RUN:
             self.logger.info("[DRY RUN] Skipping WhatsApp browser session")
             return []
 
+        if self.push_mode:
+            return self._check_pushed_rows()
+
         urgent_messages = []
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    str(self.session_path),
-                    headless=not bool(os.environ.get("DISPLAY")),  # ← CHANGE
-                    args=BROWSER_ARGS,
-                    user_agent=USER_AGENT,
-                    slow_mo=80,                                     # ← ADD
-                )
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                page.goto("https://web.whatsapp.com", wait_until="domcontentloaded")
-                self.logger.info("Waiting for WhatsApp Web to load...")
-                time.sleep(40)
-
-                title = page.title()
-                self.logger.info(f"Page title: {title}")
-
-                pane = page.query_selector('#pane-side')
-                if not pane:
-                    self.logger.error("pane-side not found!")
-                    browser.close()
-                    return []
-
-                pane_text = pane.inner_text()
-                lines = pane_text.split('\n')
-
-                for i, line in enumerate(lines):
-                    line_lower = line.lower().strip()
-                    if any(kw in line_lower for kw in URGENT_KEYWORDS):
-                        start = max(0, i - 2)
-                        end = min(len(lines), i + 3)
-                        context = '\n'.join(lines[start:end]).strip()
-                        msg_id = str(hash(context))
-                        if msg_id not in self.processed_ids:
-                            urgent_messages.append({
-                                "id": msg_id,
-                                "text": context,
-                                "matched_line": line.strip(),
-                            })
-                            self.logger.info(f"Urgent message found: {line.strip()}")
-
-                self.logger.info(f"Found {len(urgent_messages)} urgent messages")
-                browser.close()
+            lines = self.session.run(self._read_pane)
+            if lines is None:
+                self.logger.error("pane-side not found! Reloading WhatsApp Web next poll")
+                self.session.mark_stale()
+                return []
+
+            urgent_messages = [
+                m for m in find_urgent(self.fingerprint_key, lines, URGENT_KEYWORDS, set())
+                if m["id"] not in self.processed_ids
+            ]
+            for message in urgent_messages:
+                self.logger.info(f"Urgent message found: {message['matched_line']}")
+
+            self.logger.info(
+                f"Found {len(urgent_messages)} urgent messages "
+                f"({self.session.last_poll_kind} poll, {self.session.last_poll_ms:.0f} ms)"
+            )
 
         except Exception as e:
             self.logger.error(f"WhatsApp browser error: {e}", exc_info=True)
 
         return urgent_messages
 
+    def _check_pushed_rows(self) -> list:
+        """Push mode: urgent messages among the chat rows the page reported changed."""
+        try:
+            rows = self.session.run(
+                lambda page: _pane_observer.drain(page, Config.WHATSAPP_PUSH_WINDOW)
+            )
+        except Exception as e:
+            self.logger.error(f"WhatsApp browser error: {e}", exc_info=True)
+            time.sleep(Config.WHATSAPP_CHECK_INTERVAL)  # back off instead of relaunching every second
+            return []
+
+        seen_this_poll: set[str] = set()
+        urgent_messages = [
+            m for row in rows
+            for m in find_urgent(self.fingerprint_key, row.get("lines", []), URGENT_KEYWORDS, seen_this_poll)
+            if m["id"] not in self.processed_ids
+        ]
+        for message in urgent_messages:
+            self.logger.info(f"Urgent message found: {message['matched_line']}")
+
+        if rows:
+            self.logger.info(
+                f"{len(rows)} chat row(s) changed, {len(urgent_messages)} urgent "
+                f"(detected {_pane_observer.last_latency_ms or 0:.0f} ms after render)"
+            )
+        return urgent_messages
+
+    @staticmethod
+    def _read_pane(page) -> list[str] | None:
+        """Runs on the session thread: one read of the already-loaded chat list."""
+        pane = page.query_selector('#pane-side')
+        if not pane:
+            return None
+        return pane.inner_text().split('\n')
+
     def create_action_file(self, message: dict) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filepath = self.needs_action / f"WHATSAPP_{timestamp}.md"
@@ -115,6 +162,7 @@ received: {datetime.now().isoformat()}
 priority: high
 status: pending
 msg_id: {message['id']}
+chat: {message.get('chat', '')}
 ---
 
 # WhatsApp Urgent Message
@@ -146,48 +194,48 @@ msg_id: {message['id']}
             self.logger.info(f"[DRY RUN] Would send WhatsApp to {to}: {message}")
             return True
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    str(self.session_path),
-                    headless=not bool(os.environ.get("DISPLAY")),  # ← CHANGE
-                    args=BROWSER_ARGS,
-                    user_agent=USER_AGENT,
-                    slow_mo=80,                                     # ← ADD
-                )
-                page = browser.new_page()
-
+        def send(page) -> bool:
+            timer = FlowTimer("whatsapp_send", self.logger)
+            try:
                 phone = to.replace("+", "").replace(" ", "")
                 encoded_msg = urllib.parse.quote(message)
                 page.goto(f"https://web.whatsapp.com/send?phone={phone}&text={encoded_msg}")
                 self.logger.info(f"Opening chat with {to}...")
-                time.sleep(45)
 
-                textbox = page.query_selector('[contenteditable="true"][data-tab="10"]')
-                if not textbox:
-                    textbox = page.query_selector('[contenteditable="true"]')
+                # The chat opens with the message pre-filled in the compose box
+                textbox = timer.optional(page, selector(
+                    "compose_box",
+                    '[contenteditable="true"][data-tab="10"]',
+                    'footer [contenteditable="true"]',
+                    timeout=Config.WHATSAPP_READY_TIMEOUT,
+                ))
                 if textbox:
                     textbox.click()
-                    time.sleep(2)
-
-                send_btn = None
-                for btn in page.query_selector_all("button"):
-                    label = btn.get_attribute("aria-label")
-                    if label and "Send" in label:
-                        send_btn = btn
-                        break
 
+                send_btn = timer.optional(page, selector(
+                    "send_button", 'button[aria-label*="Send"]', timeout=10
+                ))
                 if send_btn:
                     send_btn.click()
-                    time.sleep(3)
+                    # Sent once the compose box has been cleared
+                    timer.optional(page, condition(
+                        "sent",
+                        """() => {
+                            const box = document.querySelector('footer [contenteditable="true"]');
+                            return !box || box.innerText.trim() === "";
+                        }""",
+                        timeout=10,
+                    ))
                     self.logger.info(f"Message sent to {to}")
-                    browser.close()
                     return True
-                else:
-                    self.logger.error("Send button not found!")
-                    browser.close()
-                    return False
+                self.logger.error("Send button not found!")
+                return False
+            finally:
+                timer.log()
 
+        try:
+            # Never retried: a crash mid-send may already have delivered the message
+            return self.session.run(send, retry=False)
         except Exception as e:
             self.logger.error(f"WhatsApp send error: {e}", exc_info=True)
-            return False
\ No newline at end of file
+            return False